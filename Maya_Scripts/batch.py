@@ -0,0 +1,325 @@
+'''
+Headless batch exporter for standalone Maya (mayapy).
+Drives the exporter types from a manifest of scenes, selections and settings,
+then appends the export batch to the import journal consumed by 'unrealLoader.py'.
+
+Usage:
+    mayapy -m Maya_Scripts.batch manifest.json [--project PATH] [--data-path PATH] [--report PATH]
+    mayapy -m Maya_Scripts.batch --worker [--project PATH] [--data-path PATH]
+
+Worker mode keeps the standalone session alive and exports one job (JSON line)
+per stdin line, answering each with a result line; see 'scheduler.py'.
+
+Manifest layout (JSON):
+    {
+        "project": "C:/Unreal Projects/MyGame",
+        "profile": "Props",
+        "settings": {"move_to_origin": true, "version": "FBX 2020"},
+        "jobs": [
+            {"scene": "D:/scenes/props.mb", "type": "FBX", "folder": "Props",
+             "file_name": "crate", "selection": ["crate_geo"],
+             "settings": {"batch_export": true}},
+            {"scene": "D:/scenes/hero.mb", "type": "FBX", "folder": "Hero/Anims",
+             "selection": ["root"], "settings": {"export_anim": true, "bake_anim": true},
+             "clips": [["Hero_Walk", 1, 30], ["Hero_Run", 31, 60]]}
+        ]
+    }
+
+'project' defaults to the project stored in 'ue_data.json' by 'unrealLoader.py'.
+Settings use the exporter UI element IDs; missing values fall back to the UI defaults
+and job settings override the manifest settings. Without a 'selection', every
+top level DAG object of the scene (cameras excluded) is exported.
+A 'profile' (manifest or job) names a saved export profile, or a profile file path
+(see 'library/profiles.py'); its settings apply under the settings of the same level.
+'''
+from .library import projectdata
+from .library import profiles
+from .library import journal
+from .library import tracing
+import argparse
+import json
+import time
+import sys
+
+EXPORT_TYPES = ['FBX', 'OBJ', 'GLTF']
+
+def initialize_standalone() -> None:
+    ''' Initializes standalone Maya and loads the exporter plugins. '''
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+
+    import maya.cmds as mc
+    for plugin in ['fbxmaya', 'objExport']:
+        if not mc.pluginInfo(plugin, query=True, loaded=True):
+            mc.loadPlugin(plugin, quiet=True)
+
+def get_profile_settings(profile_name:str|None, export_type:str|None=None) -> dict:
+    ''' Returns the settings of an export profile; raises ValueError if its type does not match. '''
+    if not profile_name:
+        return {}
+    profile = profiles.load_profile(profile_name)
+    if export_type and profile.export_type != export_type:
+        raise ValueError(f'Profile [{profile_name}] is a {profile.export_type} profile, not {export_type}.')
+    return profile.get_settings()
+
+def load_manifest(manifest_path:str) -> dict:
+    '''
+    Loads and validates a batch manifest (JSON) file.
+    Export profiles are resolved into the manifest and job settings.
+    '''
+    with open(manifest_path, 'r') as file:
+        manifest = json.load(file)
+
+    if not isinstance(manifest.get('jobs'), list):
+        raise ValueError(f'Manifest [{manifest_path}] has no jobs list.')
+    if manifest.get('profile'):
+        manifest['settings'] = dict(get_profile_settings(manifest['profile']), **manifest.get('settings', {}))
+    for job in manifest['jobs']:
+        if job.get('type', 'FBX') not in EXPORT_TYPES:
+            raise ValueError(f"Job type [{job.get('type')}] not available. Available types: {EXPORT_TYPES}")
+        if job.get('profile'):
+            job['settings'] = dict(get_profile_settings(job['profile'], job.get('type', 'FBX')),
+                                   **job.get('settings', {}))
+        if not job.get('folder'):
+            raise ValueError(f'Job {job} has no folder name to export.')
+        if not job.get('file_name') and not job.get('clips'):
+            raise ValueError(f'Job {job} has no file name for export.')
+
+    return manifest
+
+# marks worker result lines; Maya may write its own output to stdout
+WORKER_READY = 'MTOU_WORKER_READY'
+WORKER_RESULT = 'MTOU_WORKER_RESULT '
+
+def merge_import_data(import_data:dict, result:dict) -> None:
+    ''' Merges the files of a job result into the import settings data set. '''
+    if result.get('status') != 'ok':
+        return
+    importer = import_data.setdefault(result['type'], {})
+    importer.update(result['files'])
+
+class batchExporter():
+    '''
+    Runs manifest export jobs through the exporter types without any UI.
+    Requires an initialized standalone Maya session.
+    '''
+    def __init__(self, project_path:str|None=None, defaults:dict|None=None, data_path:str|None=None):
+        ''' Initializes exporter types and the UE project data. '''
+        # import Maya dependent modules once the standalone session is running
+        from .library import modules as md
+        from .library import exporter
+
+        self._md = md
+        self._data_path = data_path or md.get_data_folder()
+        self._defaults = defaults or {}
+        self._current_scene = None
+
+        # UE project data, reloaded only when the Unreal loader updates it
+        self._ue_data = projectdata.projectData(self._data_path)
+        self._project_path = project_path or self._ue_data.get_project_path()
+        if not self._project_path:
+            raise RuntimeError('No UE project has been provided or loaded for export!')
+
+        self.fbx = exporter.fbx()
+        self.obj = exporter.obj()
+        self.gltf = exporter.gltf()
+
+    def get_data_path(self) -> str:
+        ''' Returns the path the import settings data set is saved to. '''
+        return self._data_path
+
+    def open_scene(self, scene:str|None) -> None:
+        ''' Opens the scene file, unless it is already the open scene. '''
+        import maya.cmds as mc
+
+        if not scene or scene == self._current_scene:
+            return
+        mc.file(scene, open=True, force=True, prompt=False)
+        self._current_scene = scene
+
+    def get_selection(self, job:dict) -> list:
+        ''' Returns the existing job selection, or every top level object except cameras. '''
+        import maya.cmds as mc
+
+        selection = job.get('selection')
+        if selection:
+            missing = [node for node in selection if not mc.objExists(node)]
+            if missing:
+                raise ValueError(f'Selection nodes not found in scene: {missing}')
+            return list(selection)
+
+        cameras = set(mc.listRelatives(mc.ls(type='camera'), parent=True) or [])
+        return [node for node in mc.ls(assemblies=True) if node not in cameras]
+
+    def get_settings(self, job:dict) -> dict:
+        ''' Builds the job settings: UI defaults, overridden by manifest and job settings. '''
+        from .library import procedures
+
+        export_type = job.get('type', 'FBX')
+        if export_type == 'FBX':
+            settings = dict(procedures.FBX_DEFAULT_SETTINGS)
+        elif export_type == 'GLTF':
+            settings = dict(procedures.GLTF_DEFAULT_SETTINGS)
+        else:
+            settings = dict(procedures.OBJ_DEFAULT_SETTINGS)
+        settings.update(self._defaults)
+        settings.update(job.get('settings', {}))
+
+        return settings
+
+    def run_job(self, job:dict) -> dict:
+        '''
+        Exports a single manifest job.
+        Returns the job result: type, status, exported files import settings and duration.
+        '''
+        import maya.cmds as mc
+        from .library import procedures
+        from .library import fingerprint
+
+        export_type = job.get('type', 'FBX')
+        result = {'type': export_type, 'scene': job.get('scene'), 'files': {}, 'status': 'ok'}
+        start_time = time.perf_counter()
+
+        try:
+            with tracing.span('batch.open_scene', scene=job.get('scene')):
+                self.open_scene(job.get('scene'))
+            selection = self.get_selection(job)
+            settings = self.get_settings(job)
+            folder_name = job['folder'].replace('\\', '/')
+            file_name = job.get('file_name', '')
+            # load export fingerprints to skip unchanged assets
+            cache = fingerprint.exportCache(self._data_path) if settings.get('skip_unchanged') else None
+            # processed texture copies are cached across exports
+            textures = procedures.get_texture_cache(self._data_path, settings)
+
+            if export_type == 'FBX':
+                self.fbx.set_UE_project_path(self._project_path, folder_name)
+                result['files'] = procedures.fbx_export_procedure(self.fbx, selection, settings,
+                                                                  file_name, folder_name,
+                                                                  clips=job.get('clips'),
+                                                                  skeleton_data=self._ue_data.get_skeletons(),
+                                                                  start_index=job.get('start_index', 0),
+                                                                  cache=cache, textures=textures)
+            elif export_type == 'GLTF':
+                self.gltf.set_UE_project_path(self._project_path, folder_name)
+                result['files'] = procedures.gltf_export_procedure(self.gltf, selection, settings,
+                                                                   file_name, folder_name,
+                                                                   skeleton_data=self._ue_data.get_skeletons(),
+                                                                   start_index=job.get('start_index', 0),
+                                                                   cache=cache)
+            else:
+                self.obj.set_UE_project_path(self._project_path, folder_name)
+                result['files'] = procedures.obj_export_procedure(self.obj, selection, settings,
+                                                                  file_name, folder_name,
+                                                                  start_index=job.get('start_index', 0),
+                                                                  cache=cache, textures=textures)
+            if cache:
+                cache.save()
+            mc.select(cl=True)
+
+        except Exception as e:
+            result['status'] = 'error'
+            result['error'] = str(e)
+            sys.stderr.write(f'Batch job failed [{job.get("scene")}]: {e}\n')
+
+        result['duration'] = time.perf_counter() - start_time
+        if 'job_id' in job:
+            result['job_id'] = job['job_id']
+        return result
+
+    def run(self, jobs:list) -> tuple:
+        ''' Exports every job; returns the merged import settings data set and the job results. '''
+        import_data = {}
+        results = []
+        for job in jobs:
+            with tracing.span('batch.run_job', scene=job.get('scene')):
+                result = self.run_job(job)
+            results.append(result)
+            merge_import_data(import_data, result)
+            sys.stdout.write(f"[{result['status']}] {job.get('scene')}: {len(result['files'])} file(s) "
+                             f"in {result['duration']:.2f}s\n")
+
+        return import_data, results
+
+def run_worker(project_path:str|None=None, data_path:str|None=None) -> int:
+    '''
+    Runs a warm export worker: reads jobs (JSON lines) from stdin until EOF or a 'quit' command.
+    Writes a result line for every job; the standalone session stays alive between jobs.
+    '''
+    initialize_standalone()
+    batch = batchExporter(project_path=project_path, data_path=data_path)
+
+    sys.stdout.write(WORKER_READY + '\n')
+    sys.stdout.flush()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        if job.get('command') == 'quit':
+            break
+        with tracing.span('batch.run_job', job_id=job.get('job_id'), scene=job.get('scene')):
+            result = batch.run_job(job)
+        # workers are stopped by the scheduler; write the job spans right away
+        tracing.flush()
+        sys.stdout.write(WORKER_RESULT + json.dumps(result) + '\n')
+        sys.stdout.flush()
+
+    import maya.standalone
+    maya.standalone.uninitialize()
+
+    return 0
+
+def main(argv:list|None=None) -> int:
+    ''' Command line entry point: exports a manifest and journals its export batch. '''
+    parser = argparse.ArgumentParser(prog='Maya_Scripts.batch', description='MtoU headless batch exporter.')
+    parser.add_argument('manifest', nargs='?', help='batch manifest (JSON) file')
+    parser.add_argument('--project', help='UE project path; defaults to the manifest or ue_data.json project')
+    parser.add_argument('--data-path', help="folder of the import journal; defaults to 'Documents/UE/Data'")
+    parser.add_argument('--report', help='optional path to save the per job results (JSON)')
+    parser.add_argument('--worker', action='store_true', help='run as a warm worker reading jobs from stdin')
+    parser.add_argument('--push', action='store_true', help='push the batch to a listening Unreal loader and wait for its import')
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return run_worker(project_path=args.project, data_path=args.data_path)
+    if not args.manifest:
+        parser.error('a manifest is required unless running with --worker')
+
+    manifest = load_manifest(args.manifest)
+    initialize_standalone()
+
+    batch = batchExporter(project_path=args.project or manifest.get('project'),
+                          defaults=manifest.get('settings'), data_path=args.data_path)
+    # trace the export batch; the batch ID correlates it with the Unreal import
+    with tracing.span('batch.run', jobs=len(manifest['jobs'])) as batch_span:
+        batch_id = tracing.new_batch_id()
+        batch_span.set(batch_id=batch_id)
+        import_data, results = batch.run(manifest['jobs'])
+
+        # queue the export batch in the import journal for unreal importer
+        journal.append_batch(batch.get_data_path(), import_data, batch_id)
+
+    if args.push and any(import_data.values()):
+        from .library import transport
+        done = transport.transportClient().send_batch(dict(import_data, **{tracing.BATCH_ID_KEY: batch_id}),
+                                                      batch_id=batch_id, wait=True)
+        if done is None:
+            sys.stdout.write('No Unreal loader listening; export batch journaled for manual import\n')
+        else:
+            sys.stdout.write(f"Unreal import done: {len(done.get('results', []))} file(s) in {done.get('duration', 0.0):.2f}s\n")
+
+    if args.report:
+        with open(args.report, 'w') as file:
+            json.dump(results, file, indent=4)
+
+    failed = [result for result in results if result['status'] != 'ok']
+    sys.stdout.write(f'Batch export finished: {len(results)-len(failed)} succeeded, {len(failed)} failed\n')
+
+    import maya.standalone
+    maya.standalone.uninitialize()
+
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+from ..library import datafiles
+from collections import deque
+import hashlib
+import json
+import time
+import os
+
+# Batch export checkpoints: per item progress of a batch export, for resuming an interrupted batch.
+# A checkpoint file ('exportCheckpoint.<batch key>.jsonl', JSON Lines) is appended once per exported item:
+#   {"type": "batch", "key": "<batch key>", "total": 1000, "time": 0.0}
+#   {"type": "item", "file": "mesh_1.fbx", "settings": {...import settings...} | null}
+#   {"type": "journaled", "files": ["mesh_1.fbx"]}
+# Null settings mark unchanged (skipped) assets. Items of a cancelled run are journaled for import right away
+# and marked, so the resumed run only journals the items left. Every record is synced to disk before the next item
+# is exported, so a crash loses at most the item being exported. The batch key hashes the exporter type,
+# selection, file and folder names and settings: the same batch run again resumes from its checkpoint.
+# The checkpoint file is removed once the batch completes. No Maya module is required.
+
+CHECKPOINT_FILE_NAME = 'exportCheckpoint.jsonl'
+
+def get_batch_key(export_type:str, selection:list, file_name:str, folder_name:str, settings:dict) -> str:
+    ''' Returns the key of a batch export: the hash of everything deciding its exported files. '''
+    batch = json.dumps([export_type, list(selection), file_name, folder_name, settings], sort_keys=True, default=str)
+    return hashlib.blake2b(batch.encode('utf-8'), digest_size=8).hexdigest()
+
+class exportCheckpoint():
+    '''
+    Append-only progress record of a batch export: exported file -> import settings.
+    Items recorded by an earlier, interrupted run of the same batch are loaded on creation.
+    '''
+    def __init__(self, data_path:str, batch_key:str, total:int=0):
+        name, extension = os.path.splitext(CHECKPOINT_FILE_NAME)
+        self._file_path = os.path.join(data_path, f'{name}.{batch_key}{extension}')
+        self._batch_key = batch_key
+        self._total = total
+        self._items = {}
+        self._journaled = set()
+        self._load()
+        self._resumed = len(self._items)
+
+    def get_file_path(self) -> str:
+        ''' Returns the checkpoint file. '''
+        return self._file_path
+
+    def _load(self) -> None:
+        ''' Loads the items of an earlier run; an incomplete last line (interrupted write) is ignored. '''
+        if not os.path.exists(self._file_path):
+            return
+        with open(self._file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if not line.endswith('\n'):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # skip damaged records; their item is exported again
+                    continue
+                if record.get('type') == 'item':
+                    self._items[record['file']] = record.get('settings')
+                elif record.get('type') == 'journaled':
+                    self._journaled.update(record.get('files', []))
+
+    def _append(self, records:list) -> None:
+        ''' Appends the records to the checkpoint file in a single synced write. '''
+        with datafiles.file_lock(self._file_path):
+            datafiles.append_text(self._file_path, ''.join(json.dumps(record, sort_keys=True) + '\n'
+                                                           for record in records))
+
+    def get_done_count(self) -> int:
+        ''' Returns the number of items recorded, by this run and the earlier ones. '''
+        return len(self._items)
+
+    def get_resumed_count(self) -> int:
+        ''' Returns the number of items loaded from an earlier run. '''
+        return self._resumed
+
+    def is_done(self, file_name:str) -> bool:
+        ''' Returns True if the item file has been recorded as exported. '''
+        return file_name in self._items
+
+    def get_import_settings(self, file_name:str) -> dict|None:
+        '''
+        Returns the recorded import settings of an item still to be journaled;
+        None for unchanged (skipped) and already journaled assets.
+        '''
+        if file_name in self._journaled:
+            return None
+        return self._items.get(file_name)
+
+    def record(self, file_name:str, import_settings:dict|None) -> None:
+        ''' Records an exported item; the batch header is written with the first item. '''
+        records = []
+        if not os.path.exists(self._file_path):
+            records.append({'type': 'batch', 'key': self._batch_key, 'total': self._total, 'time': time.time()})
+        records.append({'type': 'item', 'file': file_name, 'settings': import_settings})
+        self._append(records)
+        self._items[file_name] = import_settings
+
+    def mark_journaled(self, file_names:list) -> None:
+        ''' Records the items journaled by a cancelled run. '''
+        file_names = [file_name for file_name in file_names if file_name not in self._journaled]
+        if not file_names:
+            return
+        self._append([{'type': 'journaled', 'files': file_names}])
+        self._journaled.update(file_names)
+
+    def complete(self) -> None:
+        '''
+        Removes the checkpoint file of a completed batch.
+        Its lock file is left in place: another session may hold it open or wait on it,
+        and a new lock file would let two sessions hold the lock at once.
+        '''
+        with datafiles.file_lock(self._file_path):
+            if os.path.exists(self._file_path):
+                os.remove(self._file_path)
+
+class batchProgress():
+    '''
+    Progress of a batch export: throughput and ETA from a moving average of the per item export time.
+    The report callback receives the progress after every item; the cancel callback is polled
+    before every item and returns True to stop the batch.
+    '''
+    def __init__(self, total:int, window:int=20, report=None, cancel=None):
+        self.total = total
+        self.done = 0
+        self.cancelled = False
+        self._durations = deque(maxlen=window)
+        self._report = report
+        self._cancel = cancel
+        self._start = None
+
+    def skip(self, count:int=1) -> None:
+        ''' Counts items done by an earlier run; they are not part of the moving average. '''
+        self.done += count
+
+    def is_cancelled(self) -> bool:
+        ''' Polls the cancel callback; returns True once the batch has been cancelled. '''
+        if not self.cancelled and self._cancel is not None and self._cancel():
+            self.cancelled = True
+        return self.cancelled
+
+    def start_item(self) -> None:
+        ''' Starts timing an item export. '''
+        self._start = time.perf_counter()
+
+    def finish_item(self) -> None:
+        ''' Records the export time of the current item and reports the progress. '''
+        if self._start is not None:
+            self._durations.append(time.perf_counter() - self._start)
+            self._start = None
+        self.done += 1
+        if self._report is not None:
+            self._report(self)
+
+    def get_item_time(self) -> float:
+        ''' Returns the moving average of the per item export time (seconds); 0.0 before the first item. '''
+        if not self._durations:
+            return 0.0
+        return sum(self._durations) / len(self._durations)
+
+    def get_throughput(self) -> float:
+        ''' Returns the export throughput (items per second). '''
+        item_time = self.get_item_time()
+        return 1.0 / item_time if item_time else 0.0
+
+    def get_eta(self) -> float:
+        ''' Returns the estimated time left (seconds). '''
+        return max(self.total - self.done, 0) * self.get_item_time()
+
+    def get_percent(self) -> int:
+        ''' Returns the progress percentage. '''
+        return int(100 * self.done / self.total) if self.total else 100
+
+    def get_status(self) -> str:
+        ''' Returns the progress status line: items done, throughput and ETA. '''
+        minutes, seconds = divmod(int(round(self.get_eta())), 60)
+        return (f'{self.done}/{self.total} items, {self.get_throughput():.1f} items/s, '
+                f'ETA {minutes}:{seconds:02d}')
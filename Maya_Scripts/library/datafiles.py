@@ -0,0 +1,137 @@
+from contextlib import contextmanager
+import tempfile
+import json
+import time
+import os
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+# Multi-session safe access to the shared data files ('Documents/UE/Data'), used by every Maya
+# session and batch exporter; 'unrealLoader.py' implements the same protocol for the editor.
+# Writers hold an advisory lock on '<file>.lock' and replace the file atomically
+# (temp file + fsync + rename), so readers never see a truncated file and need no lock.
+# No Maya module is required.
+
+LOCK_TIMEOUT = 10.0
+
+class lockTimeout(TimeoutError):
+    ''' Raised when a data file lock cannot be acquired in time. '''
+
+def try_lock(file) -> bool:
+    ''' Tries to lock the open lock file without blocking; returns True if locked. '''
+    try:
+        if os.name == 'nt':
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+def unlock(file) -> None:
+    ''' Releases the lock of the open lock file. '''
+    if os.name == 'nt':
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+@contextmanager
+def file_lock(file_path:str, timeout:float=LOCK_TIMEOUT):
+    '''
+    Holds the advisory lock of a data file for the enclosed block; raises lockTimeout after the timeout.
+    Every process writing the file must lock it; readers of atomically replaced files do not need to.
+    '''
+    folder_path = os.path.dirname(file_path)
+    if folder_path and not os.path.exists(folder_path):
+        os.makedirs(folder_path, exist_ok=True)
+
+    with open(file_path + '.lock', 'a+b') as file:
+        deadline = time.monotonic() + timeout
+        delay = 0.005
+        while not try_lock(file):
+            if time.monotonic() > deadline:
+                raise lockTimeout(f'Data file is locked by another session: {file_path}')
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)
+        # the lock file modification time marks the last session activity
+        os.utime(file_path + '.lock')
+        try:
+            yield
+        finally:
+            unlock(file)
+
+def replace_file(source_path:str, file_path:str, retries:int=20) -> None:
+    ''' Renames the source file over the file; retried while a Windows reader holds the file open. '''
+    for attempt in range(retries):
+        try:
+            os.replace(source_path, file_path)
+            return
+        except PermissionError:
+            if attempt == retries - 1:
+                raise
+            time.sleep(0.01 * (attempt + 1))
+
+def atomic_write(file_path:str, data:str|bytes) -> None:
+    ''' Writes the whole file at once: temp file in the same folder, fsync, then rename over the file. '''
+    folder_path = os.path.dirname(file_path) or '.'
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path, exist_ok=True)
+
+    file_descriptor, temp_path = tempfile.mkstemp(dir=folder_path, prefix=f'.{os.path.basename(file_path)}.',
+                                                  suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(data.encode('utf-8') if isinstance(data, str) else data)
+            file.flush()
+            os.fsync(file.fileno())
+        replace_file(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def dump_json(data) -> str:
+    ''' Returns the data set as formatted JSON text; same layout as every shared data file. '''
+    return json.dumps(data, indent=4, sort_keys=True)
+
+def load_json(file_path:str, default=None):
+    ''' Loads a JSON data file; returns the default if it does not exist. '''
+    if not os.path.exists(file_path):
+        return default
+    with open(file_path, 'r') as file:
+        return json.load(file)
+
+def save_json(file_path:str, data) -> None:
+    ''' Saves a JSON data file atomically, under its lock. '''
+    with file_lock(file_path):
+        atomic_write(file_path, dump_json(data))
+
+def update_json(file_path:str, update, default=None):
+    '''
+    Read-modify-write of a JSON data file under its lock: update receives the stored data set
+    (or a copy of the default) and returns the data set to save. Returns the saved data set.
+    '''
+    with file_lock(file_path):
+        data = load_json(file_path, json.loads(json.dumps(default)))
+        data = update(data)
+        atomic_write(file_path, dump_json(data))
+    return data
+
+def append_text(file_path:str, text:str) -> None:
+    '''
+    Appends text to a data file in a single write; the caller holds the file lock.
+    An incomplete last line left by an interrupted write is ended first.
+    '''
+    with open(file_path, 'a+b') as file:
+        if file.tell():
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b'\n':
+                text = '\n' + text
+        file.write(text.encode('utf-8'))
+        file.flush()
+        os.fsync(file.fileno())
@@ -1,4 +1,9 @@
 from ..library import modules as md
+from ..library import gltfwriter
+from ..library import objwriter
+from ..library import profiles
+from ..library import tracing
+from contextlib import contextmanager
 from abc import ABC
 import maya.cmds as mc
 import maya.mel as mel
@@ -12,9 +17,6 @@ class exporterType(ABC):
         self._export_path = None
         self._file_name = None
 
-        # create empty data set to store any incoming mesh's translation data values 
-        self._obj_placement = {}
-
     def set_file_name(self, file_name: str):
         ''' Create unique file name. '''
         self._file_name=file_name
@@ -28,23 +30,26 @@ class exporterType(ABC):
         if not os.path.exists(self._export_path):
             os.makedirs(self._export_path)
 
-    def move_sel_to_origin(self, obj_selection):
-        ''' Move object to world origin: [0,0,0]. ''' 
-        obj_parent=mc.listRelatives(obj_selection, parent=True)
-        if mc.nodeType(obj_parent) != 'joint':
-            # store object with their initial translation data values (location)
-            self._obj_placement[obj_selection] = mc.xform(obj_selection, worldSpace=True, query=True, translation=True)
-            md.move_to_origin(obj_selection)
-        else:
-            if not obj_parent:
-                self._obj_placement[obj_selection] = mc.xform(obj_selection, worldSpace=True, query=True, translation=True)
-                md.move_to_origin(obj_selection)
+    @contextmanager
+    def origin_offset(self, nodes:list):
+        '''
+        Places the movable nodes at world origin [0,0,0] for the enclosed exports.
+        The nodes are restored on exit, errors included; no undo entry or placement data is left behind.
+        '''
+        movable_nodes=md.get_movable_nodes(nodes)
+        modifier=md.offset_to_origin(movable_nodes) if movable_nodes else None
+        try:
+            yield movable_nodes
+        finally:
+            if modifier is not None:
+                with tracing.span('exporter.restore_origin_offset', nodes=len(movable_nodes)):
+                    modifier.undoIt()
 
-    def place_sel_to_original_pos(self, obj_selection):
-        ''' Move object to initial translation data values (location). ''' 
-        if self._obj_placement.get(obj_selection):
-            translation=self._obj_placement.get(obj_selection)
-            md.place_mesh_back(translation, obj_selection)
+    def get_export_file(self) -> str:
+        ''' Returns the full path of the file the next export will write. '''
+        if not self._export_path:
+            self._export_path = md.get_documents_folder()
+        return os.path.join(self._export_path, self._file_name).replace('\\', '/')
 
     def export(self):
         ''' Perform the type dependant export. '''
@@ -55,75 +60,138 @@ class fbx(exporterType):
     ''' 
     FBX exporter interface. 
     Enable mel.eval settings prior to executing export.
+    The FBX plugin state applied by the exporters is tracked; setting calls are only issued when their value changes.
+    The FBX plugin is loaded and reset on the first FBX call, not when the exporter is created.
     '''
+    # FBX plugin setting values last applied: (command, *setting args) -> value
+    # the plugin state is global to the Maya session, so the tracked state is shared by every fbx exporter
+    _fbx_state = {}
+    # True once the FBX plugin is loaded and its export settings reset
+    _plugin_ready = False
+
     def __init__(self):
         super().__init__()
         
         self._file_name='mayaExport.fbx'
 
-        self._fbx_ver_set = {"FBX 2020": "FBX202000", "FBX 2019": "FBX201900",
-                             "FBX 2018": "FBX201800", "FBX 2016/2017": "FBX201600",
-                             "FBX 2014/2015": "FBX201400", "FBX 2013": "FBX201300",
-                             "FBX 2012": "FBX201200", "FBX 2011": "FBX201100",
-                             "FBX 2010": "FBX201000", "FBX 2009": "FBX200900"}
-        
-        mc.FBXResetExport()
+        self._fbx_ver_set = dict(profiles.FBX_VERSIONS)
+
+        # the FBX settings may have changed since the last exporter; reset on first use
+        self.reset_state()
 
     def get_fbx_versions(self) -> dict:
         ''' Return FBX version (key) values data set. '''
         return self._fbx_ver_set
 
+    def setup_plugin(self):
+        ''' Loads the FBX plugin if needed and resets its export settings; only runs once per reset. '''
+        if fbx._plugin_ready:
+            return
+        with tracing.span('fbx.setup_plugin'):
+            if not mc.pluginInfo('fbxmaya', query=True, loaded=True):
+                mc.loadPlugin('fbxmaya', quiet=True)
+            mc.FBXResetExport()
+        self._fbx_state.clear()
+        fbx._plugin_ready = True
+
+    def reset_state(self):
+        ''' 
+        Resets the FBX plugin export settings to their defaults before the next FBX call; every setting is issued again.
+        Call after the FBX settings were changed outside the exporter (e.g. the FBX export dialog).
+        '''
+        fbx._plugin_ready = False
+        self._fbx_state.clear()
+
+    def set_fbx_property(self, command:str, *args) -> bool:
+        '''
+        Issues an FBX plugin setting call unless the same value is already applied.
+        The last argument is the value; the command and its preceding arguments identify the setting.
+        Returns True if the call was issued.
+        '''
+        self.setup_plugin()
+        key = (command, *args[:-1])
+        if key in self._fbx_state and self._fbx_state[key] == args[-1]:
+            return False
+        getattr(mc, command)(*args)
+        self._fbx_state[key] = args[-1]
+        return True
+
+    def apply_calls(self, calls:list) -> int:
+        ''' Applies compiled FBX plugin calls, a list of (command, args); returns the number of issued calls. '''
+        issued = 0
+        for command, args in calls:
+            issued += self.set_fbx_property(command, *args)
+        return issued
+
+    @tracing.traced('fbx.export_bake_anim')
     def export_bake_anim(self, start: int|None=None, end: int|None=None, value: bool=False):
         ''' 
         Enable or disable 'FBXExportBakeComplexAnimation' export bool value.
         Optionally set start and end frame values for baking animation. 
         '''
-        mc.FBXExportBakeComplexAnimation('-v', value)
-        mc.FBXExportBakeResampleAnimation('-v', value)
+        self.set_fbx_property('FBXExportBakeComplexAnimation', '-v', value)
+        self.set_fbx_property('FBXExportBakeResampleAnimation', '-v', value)
         if start:
-            mc.FBXExportBakeComplexStart('-v', start)
+            self.set_fbx_property('FBXExportBakeComplexStart', '-v', start)
         if end:
-            mc.FBXExportBakeComplexEnd('-v', end)
-        mc.FBXExportBakeComplexStep('-v', 1)
+            self.set_fbx_property('FBXExportBakeComplexEnd', '-v', end)
+        self.set_fbx_property('FBXExportBakeComplexStep', '-v', 1)
         
+    @tracing.traced('fbx.split_animation_take')
+    def split_animation_take(self, name:str, start:int, end:int):
+        '''
+        Export only the provided frame range as a single animation take.
+        The original (full timeline) take is dropped from the exported file.
+        '''
+        self.setup_plugin()
+        mc.FBXExportSplitAnimationIntoTakes('-c')
+        mc.FBXExportSplitAnimationIntoTakes('-v', name, start, end)
+        self.set_fbx_property('FBXExportDeleteOriginalTakeOnSplitAnimation', '-v', True)
+
+    def clear_animation_takes(self):
+        ''' Clear split animation takes; the full timeline take is exported again. '''
+        self.setup_plugin()
+        mc.FBXExportSplitAnimationIntoTakes('-c')
+        self.set_fbx_property('FBXExportDeleteOriginalTakeOnSplitAnimation', '-v', False)
+
     def export_smoothing_groups(self, value: bool=False):
         ''' Enable or disable 'FBXExportSmoothingGroups' export bool value. '''
-        mc.FBXExportSmoothingGroups('-v', value)
+        self.set_fbx_property('FBXExportSmoothingGroups', '-v', value)
 
     def export_smooth_mesh(self, value: bool=False):
         ''' Enable or disable 'FBXExportSmoothMesh' export bool value. '''
-        mc.FBXExportSmoothMesh('-v', value)
+        self.set_fbx_property('FBXExportSmoothMesh', '-v', value)
 
     def export_tangents_binormals(self, value: bool=False):
         ''' Enable or disable 'FBXExportTangents' export bool value. '''
-        mc.FBXExportTangents('-v', value)
+        self.set_fbx_property('FBXExportTangents', '-v', value)
 
     def export_skinWeights(self, value: bool=False):
         ''' Enable or disable 'FBXExportSkins' export bool value. '''
-        mc.FBXExportSkins('-v', value)
+        self.set_fbx_property('FBXExportSkins', '-v', value)
         
     def export_blendShapes(self, value: bool=False):
         ''' Enable or disable 'FBXExportShapes' export bool value. '''
-        mc.FBXExportShapes('-v', value)
+        self.set_fbx_property('FBXExportShapes', '-v', value)
 
     def export_embedded_textures(self, value: bool=False):
         ''' Enable or disable 'FBXExportTextures' export bool value. '''
-        mc.FBXExportEmbeddedTextures('-v', value)
+        self.set_fbx_property('FBXExportEmbeddedTextures', '-v', value)
 
     def triangulate(self, value: bool=False):
         ''' Enable or disable 'FBXExportTriangulate' export bool value. '''
-        mc.FBXExportTriangulate('-v', value)
+        self.set_fbx_property('FBXExportTriangulate', '-v', value)
 
     def file_type(self, value: bool=False):
         ''' Enable or disable 'FBXExportInAscii' export bool value. '''
-        mc.FBXExportInAscii('-v', value)
+        self.set_fbx_property('FBXExportInAscii', '-v', value)
 
     def up_axis(self, value: bool=False):
         ''' Set mel.eval 'FBXExportUpAxis' export value to 'y' or 'z'. '''
         if value:
-            mc.FBXExportUpAxis('y')
+            self.set_fbx_property('FBXExportUpAxis', 'y')
         else:
-            mc.FBXExportUpAxis('z')
+            self.set_fbx_property('FBXExportUpAxis', 'z')
     
     def file_version(self, version: str="FBX 2018"):
         ''' Set mel.eval 'FBXExportFileVersion' export value to an existing FBX version.\n
@@ -136,25 +204,30 @@ class fbx(exporterType):
         # find the export value based on the version data set
         export_value=self._fbx_ver_set[version]
         print(f'Exported: {version} - {export_value}')
-        mc.FBXExportFileVersion('-v', export_value)
+        self.set_fbx_property('FBXExportFileVersion', '-v', export_value)
 
+    @tracing.traced('fbx.exclude_anim')
     def exclude_anim(self):
-        mc.FBXExportAnimationOnly('-v', False)
-        mc.FBXExportBakeComplexAnimation('-v', False)
-        mc.FBXProperty('Export|IncludeGrp|Animation', '-v', 0)
-
-    def export(self):
+        self.set_fbx_property('FBXExportAnimationOnly', '-v', False)
+        self.set_fbx_property('FBXExportBakeComplexAnimation', '-v', False)
+        self.set_fbx_property('FBXProperty', 'Export|IncludeGrp|Animation', '-v', 0)
 
-        export_file = os.path.join(self._export_path, self._file_name)
+    def export(self) -> bool:
+        ''' Exports the selection into a .fbx file; returns False if the export raised warnings. '''
+        export_file = self.get_export_file()
+        self.setup_plugin()
 
         try:
             #'-f' stands for "File" & '-s' for "Selected"; export the selected mesh into a .fbx file
-            mc.FBXExport('-f', export_file.replace('\\', '/'), '-s')
+            with tracing.span('FBXExport', file=export_file):
+                mc.FBXExport('-f', export_file, '-s')
 
             # log execution
             sys.stdout.write("Export Successful: Open Unreal Project to Initialize Import\n")
+            return True
         except Exception as e:
             sys.stderr.write(f"Export completed with warnings: {e}")
+            return False
 
 class obj(exporterType):
     ''' 
@@ -172,23 +245,62 @@ class obj(exporterType):
                materials=0,
                smoothing=0,
                normals=0,
-               include_textures: bool=False):
-        '''OBJ export values are interpreted as bool integers: 0 (False) or 1 (True)'''
-        
-        export_file = os.path.join(self._export_path, self._file_name)
-
-        # store tuple values corresponding to each OBJ setting
-        export_settings=(f'groups={groups};ptgroups={pt_groups};materials={materials};smoothing={smoothing};normals={normals}')
+               include_textures: bool=False,
+               move_to_origin: bool=False):
+        '''
+        OBJ export values are interpreted as bool integers: 0 (False) or 1 (True).
+        Streams the selected meshes with the native OBJ writer; the scene is left untouched.
+        Point groups are not written by the native writer.
+        Returns False if the export raised warnings.
+        '''
+        export_file = self.get_export_file()
 
         # force export file
         # ignore non-crucial errors
         try:
-            mc.file(export_file, force=True, options=export_settings, typ="OBJexport", 
-                    preserveReferences=include_textures, exportSelected=True)
-            
+            with tracing.span('objwriter.write_obj', file=export_file):
+                objwriter.write_obj(export_file, mc.ls(selection=True, long=True), move_to_origin=move_to_origin,
+                                    groups=bool(groups), materials=bool(materials), smoothing=bool(smoothing),
+                                    normals=bool(normals), include_textures=include_textures)
+
             # log execution
             sys.stdout.write("Export Successful: Open Unreal Project to Initialize Import\n")
+            return True
         except Exception as e:
             sys.stderr.write(f"Export completed with warnings: {e}")
-            
-    
+            return False
+
+class gltf(exporterType):
+    '''
+    Binary glTF (.glb) exporter interface.
+    Mesh, skin and joint buffers are read from the Maya API and packed by the native writer.
+    '''
+    def __init__(self):
+        super().__init__()
+
+        self._file_name='mayaExport.glb'
+
+    def export(self,
+               skins: bool=True,
+               quantize: bool=False,
+               reorder: bool=True,
+               move_to_origin: bool=False):
+        '''
+        Exports the selected meshes into a .glb file; the scene is left untouched.
+        Quantize stores normals and UVs as normalized integers (KHR_mesh_quantization);
+        reorder sorts vertices by first use in the index buffer.
+        Returns False if the export raised warnings.
+        '''
+        export_file = self.get_export_file()
+
+        try:
+            with tracing.span('gltfwriter.write_glb', file=export_file):
+                gltfwriter.write_glb(export_file, mc.ls(selection=True, long=True), move_to_origin=move_to_origin,
+                                     skins=skins, quantize=quantize, reorder=reorder)
+
+            # log execution
+            sys.stdout.write("Export Successful: Open Unreal Project to Initialize Import\n")
+            return True
+        except Exception as e:
+            sys.stderr.write(f"Export completed with warnings: {e}")
+            return False
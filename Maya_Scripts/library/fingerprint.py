@@ -0,0 +1,136 @@
+from ..library import meshdata
+from ..library import modules as md
+from ..library import datafiles
+from ..library import tracing
+import maya.api.OpenMayaAnim as oma
+import maya.api.OpenMaya as om
+import maya.cmds as mc
+import numpy as np
+import hashlib
+import json
+import os
+
+# Export fingerprints: content hashes of the exported assets for incremental export
+
+def hash_settings(hasher, settings) -> None:
+    ''' Updates the hasher with a stable serialization of the provided settings. '''
+    hasher.update(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+
+def hash_mesh(hasher, shape_path:om.MDagPath) -> None:
+    ''' Updates the hasher with the mesh geometry, topology, UVs, skin weights and world transform. '''
+    mesh_fn=om.MFnMesh(shape_path)
+    hasher.update(shape_path.fullPathName().encode('utf-8'))
+
+    counts, connects=meshdata.get_topology(mesh_fn)
+    hasher.update(meshdata.get_points(mesh_fn).tobytes())
+    hasher.update(counts.tobytes())
+    hasher.update(connects.tobytes())
+
+    for uv_set, (uvs, uv_counts, uv_ids) in meshdata.get_uv_sets(mesh_fn).items():
+        hasher.update(uv_set.encode('utf-8'))
+        hasher.update(uvs.tobytes())
+        hasher.update(uv_counts.tobytes())
+        hasher.update(uv_ids.tobytes())
+
+    weights, influences=meshdata.get_skin_weights(shape_path)
+    if weights is not None:
+        hasher.update('|'.join(influences).encode('utf-8'))
+        hasher.update(weights.tobytes())
+
+    # exported transforms depend on the world placement of the shape
+    hasher.update(np.array(shape_path.inclusiveMatrix(), dtype=np.float64).tobytes())
+
+def hash_animation(hasher, nodes:list) -> None:
+    ''' Updates the hasher with the keys of every animation curve driving the nodes and their descendants. '''
+    hierarchy=list(nodes)
+    descendants=mc.listRelatives(nodes, allDescendents=True, fullPath=True)
+    if descendants:
+        hierarchy.extend(descendants)
+
+    anim_curves=mc.listConnections(hierarchy, type='animCurve', source=True, destination=False)
+    for anim_curve in sorted(set(anim_curves or [])):
+        sel_list=om.MSelectionList()
+        sel_list.add(anim_curve)
+        curve_fn=oma.MFnAnimCurve(sel_list.getDependNode(0))
+        hasher.update(anim_curve.encode('utf-8'))
+        keys=np.array([(curve_fn.input(index).value, curve_fn.value(index))
+                       for index in range(curve_fn.numKeys)], dtype=np.float64)
+        hasher.update(keys.tobytes())
+
+    # joint transforms are exported even without animation curves
+    for dag_path in [meshdata.get_dag_path(node) for node in hierarchy if mc.nodeType(node) == 'joint']:
+        hasher.update(np.array(dag_path.inclusiveMatrix(), dtype=np.float64).tobytes())
+
+def geometry_fingerprint(shape_path:om.MDagPath) -> str:
+    '''
+    Returns the transform-invariant fingerprint (hex digest) of a mesh shape: object space points,
+    topology and UVs. Copies and instances of the same mesh share it wherever they are placed.
+    '''
+    mesh_fn=om.MFnMesh(shape_path)
+    hasher=hashlib.blake2b(digest_size=20)
+
+    counts, connects=meshdata.get_topology(mesh_fn)
+    hasher.update(meshdata.get_points(mesh_fn).tobytes())
+    hasher.update(counts.tobytes())
+    hasher.update(connects.tobytes())
+
+    for uv_set, (uvs, uv_counts, uv_ids) in meshdata.get_uv_sets(mesh_fn).items():
+        hasher.update(uv_set.encode('utf-8'))
+        hasher.update(uvs.tobytes())
+        hasher.update(uv_counts.tobytes())
+        hasher.update(uv_ids.tobytes())
+
+    return hasher.hexdigest()
+
+def asset_fingerprint(nodes:list, settings, anim_range:list|None=None) -> str:
+    '''
+    Returns the content fingerprint (hex digest) of an exported asset.
+    Combines the nodes geometry, skin, UVs, animation, animation range and the effective settings.
+    '''
+    hasher=hashlib.blake2b(digest_size=20)
+    hash_settings(hasher, {'settings': settings, 'range': anim_range})
+
+    for shape_path in meshdata.get_mesh_shapes(nodes):
+        hash_mesh(hasher, shape_path)
+    hash_animation(hasher, nodes)
+
+    return hasher.hexdigest()
+
+class exportCache():
+    '''
+    Persistent export fingerprints data set: export file path -> fingerprint.
+    Stored next to the import settings data set as 'exportCache.json'.
+    '''
+    def __init__(self, data_path:str, file_name:str='exportCache.json'):
+        ''' Loads the stored export fingerprints, if any. '''
+        self._data_path=data_path
+        self._file_name=file_name
+        self._fingerprints={}
+        self._updated={}
+
+        if md.path_exists(os.path.join(data_path, file_name)):
+            self._fingerprints=md.load_data(data_path, file_name)
+
+    def is_unchanged(self, export_file:str, fingerprint:str) -> bool:
+        ''' Returns True if the export file exists and was exported with the same fingerprint. '''
+        export_file=export_file.replace('\\', '/')
+        return self._fingerprints.get(export_file)==fingerprint and os.path.exists(export_file)
+
+    def update(self, export_file:str, fingerprint:str) -> None:
+        ''' Stores the fingerprint of a successfully exported file. '''
+        export_file=export_file.replace('\\', '/')
+        self._fingerprints[export_file]=fingerprint
+        self._updated[export_file]=fingerprint
+
+    def save(self) -> None:
+        ''' Saves the updated fingerprints, merged with the ones stored by other exporters since loading. '''
+        if not self._updated:
+            return
+        def merge(fingerprints:dict) -> dict:
+            fingerprints.update(self._updated)
+            return fingerprints
+
+        # merged under the file lock; parallel exporters keep each other's fingerprints
+        with tracing.span('exportCache.save', files=len(self._updated)):
+            self._fingerprints=datafiles.update_json(os.path.join(self._data_path, self._file_name), merge, default={})
+        self._updated={}
@@ -0,0 +1,343 @@
+from ..library import objwriter
+from ..library import meshdata
+import maya.api.OpenMaya as om
+import numpy as np
+import struct
+import json
+
+# Binary glTF (.glb) writer: packs mesh, skin and joint buffers read from the Maya API.
+# glTF is Y-up like Maya, but in meters; positions and joint translations are scaled on write.
+
+UNIT_SCALE = 0.01
+
+# glTF component types and buffer view targets
+BYTE = 5120
+UNSIGNED_BYTE = 5121
+SHORT = 5122
+UNSIGNED_SHORT = 5123
+UNSIGNED_INT = 5125
+FLOAT = 5126
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+
+COMPONENT_TYPES = {np.dtype(np.int8): BYTE, np.dtype(np.uint8): UNSIGNED_BYTE,
+                   np.dtype(np.int16): SHORT, np.dtype(np.uint16): UNSIGNED_SHORT,
+                   np.dtype(np.uint32): UNSIGNED_INT, np.dtype(np.float32): FLOAT}
+ACCESSOR_TYPES = {1: 'SCALAR', 2: 'VEC2', 3: 'VEC3', 4: 'VEC4', 16: 'MAT4'}
+
+def get_triangle_corners(counts:np.ndarray, connects:np.ndarray, tri_counts:np.ndarray,
+                         tri_vertices:np.ndarray) -> np.ndarray:
+    '''
+    Maps the mesh triangulation to face-vertex indices, so normals and UVs can be fetched per corner.
+    Returns a (T*3,) int64 array of face-vertex indices.
+    '''
+    vertex_count=int(connects.max()) + 1 if len(connects) else 1
+    # every (face, vertex) pair is unique; look up each triangle corner in the sorted face-vertex keys
+    face_ids=np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+    keys=face_ids * vertex_count + connects
+    order=np.argsort(keys, kind='stable')
+
+    tri_faces=np.repeat(np.arange(len(tri_counts), dtype=np.int64), tri_counts * 3)
+    corner_keys=tri_faces * vertex_count + tri_vertices
+    return order[np.searchsorted(keys, corner_keys, sorter=order)]
+
+def optimize_vertex_fetch(indices:np.ndarray, vertex_count:int) -> tuple:
+    '''
+    Reorders vertices in the order the index buffer first references them (meshopt vertex fetch).
+    Returns the remapped indices and the new to old vertex order.
+    '''
+    _, first_use=np.unique(indices, return_index=True)
+    order=indices[np.sort(first_use)]
+    remap=np.empty(vertex_count, dtype=np.int64)
+    remap[order]=np.arange(len(order), dtype=np.int64)
+    return remap[indices], order
+
+def quantize_normals(normals:np.ndarray) -> np.ndarray:
+    ''' Quantizes unit normals to normalized int8, padded to 4 bytes per vertex. '''
+    quantized=np.zeros((len(normals), 4), dtype=np.int8)
+    quantized[:, :3]=np.round(np.clip(normals, -1.0, 1.0) * 127.0)
+    return quantized
+
+def quantize_uvs(uvs:np.ndarray) -> np.ndarray|None:
+    ''' Quantizes UVs in the [0, 1] range to normalized uint16; returns None for tiled UVs. '''
+    if len(uvs) and (uvs.min() < 0.0 or uvs.max() > 1.0):
+        return None
+    return np.round(uvs * 65535.0).astype(np.uint16)
+
+def get_world_matrix(dag_path:om.MDagPath, offset:np.ndarray|None=None) -> np.ndarray:
+    ''' Returns the world matrix (row vector layout) with the origin offset and unit scale applied. '''
+    matrix=np.array(dag_path.inclusiveMatrix(), dtype=np.float64).reshape(4, 4)
+    if offset is not None:
+        matrix[3, :3]-=offset
+    matrix[3, :3]*=UNIT_SCALE
+    return matrix
+
+class glbBuilder():
+    '''
+    Builds a binary glTF asset: JSON document and a single packed binary buffer.
+    Every buffer view is aligned to 4 bytes.
+    '''
+    def __init__(self):
+        ''' Initializes an empty glTF document. '''
+        self.document={'asset': {'version': '2.0', 'generator': 'MtoU'}, 'scene': 0, 'scenes': [{'nodes': []}],
+                       'nodes': [], 'meshes': [], 'materials': [], 'skins': [],
+                       'accessors': [], 'bufferViews': [], 'buffers': []}
+        self._chunks=[]
+        self._length=0
+        self._materials={}
+        self._extensions=set()
+
+    def add_view(self, array:np.ndarray, target:int|None=None, byte_stride:int|None=None) -> int:
+        ''' Appends the array bytes to the binary buffer; returns the buffer view index. '''
+        data=np.ascontiguousarray(array).tobytes()
+        view={'buffer': 0, 'byteOffset': self._length, 'byteLength': len(data)}
+        if target:
+            view['target']=target
+        if byte_stride:
+            view['byteStride']=byte_stride
+
+        self._chunks.append(data)
+        self._length+=len(data)
+        padding=(4 - self._length % 4) % 4
+        if padding:
+            self._chunks.append(b'\0' * padding)
+            self._length+=padding
+
+        self.document['bufferViews'].append(view)
+        return len(self.document['bufferViews']) - 1
+
+    def add_accessor(self, array:np.ndarray, target:int|None=None, normalized:bool=False,
+                     bounds:bool=False, components:int|None=None) -> int:
+        '''
+        Adds an accessor over a new buffer view of the array; returns the accessor index.
+        Components overrides the accessor element size of padded arrays (e.g. VEC3 stored as 4 bytes).
+        '''
+        element_size=1 if array.ndim == 1 else array.shape[1]
+        components=components or element_size
+        byte_stride=array.itemsize * element_size if target == ARRAY_BUFFER and components != element_size else None
+
+        accessor={'bufferView': self.add_view(array, target=target, byte_stride=byte_stride), 'byteOffset': 0,
+                  'componentType': COMPONENT_TYPES[array.dtype], 'count': len(array),
+                  'type': ACCESSOR_TYPES[components]}
+        if normalized:
+            accessor['normalized']=True
+        if bounds:
+            values=array.reshape(len(array), -1)[:, :components]
+            accessor['min']=values.min(axis=0).tolist()
+            accessor['max']=values.max(axis=0).tolist()
+
+        self.document['accessors'].append(accessor)
+        return len(self.document['accessors']) - 1
+
+    def add_node(self, node:dict, root:bool=True) -> int:
+        ''' Adds a node; root nodes are added to the scene. Returns the node index. '''
+        self.document['nodes'].append(node)
+        index=len(self.document['nodes']) - 1
+        if root:
+            self.document['scenes'][0]['nodes'].append(index)
+        return index
+
+    def get_material(self, shading_group:str) -> int:
+        ''' Returns the material index of the shading group, adding it on first use. '''
+        if shading_group not in self._materials:
+            values=objwriter.get_material_values(shading_group)
+            self.document['materials'].append({'name': shading_group,
+                                               'pbrMetallicRoughness': {'baseColorFactor': list(values['Kd']) + [1.0],
+                                                                        'metallicFactor': 0.0}})
+            self._materials[shading_group]=len(self.document['materials']) - 1
+        return self._materials[shading_group]
+
+    def use_extension(self, extension:str) -> None:
+        ''' Marks a required glTF extension. '''
+        self._extensions.add(extension)
+
+    def write(self, export_file:str) -> None:
+        ''' Writes the GLB container: 12 byte header, JSON chunk and binary chunk. '''
+        self.document['buffers']=[{'byteLength': self._length}]
+        if self._extensions:
+            self.document['extensionsUsed']=sorted(self._extensions)
+            self.document['extensionsRequired']=sorted(self._extensions)
+        # glTF does not allow empty top level arrays
+        document={key: value for key, value in self.document.items() if value != []}
+
+        json_chunk=json.dumps(document, separators=(',', ':')).encode('utf-8')
+        json_chunk+=b' ' * ((4 - len(json_chunk) % 4) % 4)
+        length=12 + 8 + len(json_chunk) + 8 + self._length
+
+        with open(export_file, 'wb') as file:
+            file.write(struct.pack('<4sII', b'glTF', 2, length))
+            file.write(struct.pack('<I4s', len(json_chunk), b'JSON'))
+            file.write(json_chunk)
+            file.write(struct.pack('<I4s', self._length, b'BIN\0'))
+            for chunk in self._chunks:
+                file.write(chunk)
+
+class gltfWriter():
+    '''
+    Collects Maya meshes, skins and joints into a binary glTF asset.
+    Joints shared by several skins are written once.
+    '''
+    def __init__(self, skins:bool=True, quantize:bool=False, reorder:bool=True):
+        ''' Initializes the writer settings and an empty glTF asset. '''
+        self._builder=glbBuilder()
+        self._skins=skins
+        self._quantize=quantize
+        self._reorder=reorder
+        self._joint_nodes={}
+        self._joint_worlds={}
+
+    def add_joint(self, joint_path:om.MDagPath, offset:np.ndarray|None=None) -> int:
+        ''' Adds the joint node and its joint parents; returns the joint node index. '''
+        full_path=joint_path.fullPathName()
+        if full_path in self._joint_nodes:
+            return self._joint_nodes[full_path]
+
+        parent_path=om.MDagPath(joint_path)
+        parent_path.pop()
+        parent_node=None
+        if parent_path.length() and parent_path.hasFn(om.MFn.kJoint):
+            parent_node=self.add_joint(parent_path, offset)
+
+        world=get_world_matrix(joint_path, offset)
+        local=world if parent_node is None else world @ np.linalg.inv(self._joint_worlds[parent_path.fullPathName()])
+        # a row vector matrix flattened by rows is the column major layout glTF expects
+        node=self._builder.add_node({'name': joint_path.partialPathName(), 'matrix': local.ravel().tolist()},
+                                    root=parent_node is None)
+        if parent_node is not None:
+            self._builder.document['nodes'][parent_node].setdefault('children', []).append(node)
+
+        self._joint_nodes[full_path]=node
+        self._joint_worlds[full_path]=world
+        return node
+
+    def add_skin(self, influences:list, offset:np.ndarray|None=None) -> int:
+        ''' Adds a skin over the influence joints; inverse bind matrices match the exported pose. '''
+        joints=[]
+        inverse_binds=[]
+        for influence in influences:
+            joint_path=meshdata.get_dag_path(influence)
+            joints.append(self.add_joint(joint_path, offset))
+            inverse_binds.append(np.linalg.inv(self._joint_worlds[joint_path.fullPathName()]).ravel())
+
+        matrices=self._builder.add_accessor(np.array(inverse_binds, dtype=np.float32), components=16)
+        self._builder.document['skins'].append({'joints': joints, 'inverseBindMatrices': matrices})
+        return len(self._builder.document['skins']) - 1
+
+    def add_mesh(self, shape_path:om.MDagPath, offset:np.ndarray|None=None) -> int:
+        ''' Adds a mesh shape in world space, one primitive per shading group; returns the mesh node index. '''
+        builder=self._builder
+        mesh_fn=om.MFnMesh(shape_path)
+
+        counts, connects=meshdata.get_topology(mesh_fn)
+        tri_counts, tri_vertices=mesh_fn.getTriangles()
+        tri_counts=np.array(tri_counts, dtype=np.int64)
+        corners=get_triangle_corners(counts, connects, tri_counts, np.array(tri_vertices, dtype=np.int64))
+
+        # unique (vertex, normal, uv) corners become the glTF vertices
+        _, normal_ids=mesh_fn.getNormalIds()
+        uvs, uv_counts, uv_ids=meshdata.get_uvs(mesh_fn)
+        has_uvs=len(uvs) and np.array_equal(uv_counts, counts)
+        keys=[connects[corners], np.array(normal_ids, dtype=np.int64)[corners]]
+        if has_uvs:
+            keys.append(uv_ids[corners])
+        corner_keys, indices=np.unique(np.column_stack(keys), axis=0, return_inverse=True)
+        indices=indices.ravel()
+
+        points=meshdata.get_points(mesh_fn, om.MSpace.kWorld)
+        if offset is not None:
+            points=points - offset
+        normals=np.array(mesh_fn.getNormals(om.MSpace.kWorld), dtype=np.float64).reshape(-1, 3)
+
+        positions=(points[corner_keys[:, 0]] * UNIT_SCALE).astype(np.float32)
+        vertex_normals=normals[corner_keys[:, 1]]
+        vertex_normals/=np.maximum(np.linalg.norm(vertex_normals, axis=1, keepdims=True), 1e-12)
+        vertex_uvs=None
+        if has_uvs:
+            # glTF UVs start at the top left corner
+            vertex_uvs=uvs[corner_keys[:, 2]] * np.array([1.0, -1.0], dtype=np.float32) + np.array([0.0, 1.0], dtype=np.float32)
+
+        if self._reorder:
+            indices, order=optimize_vertex_fetch(indices, len(corner_keys))
+            corner_keys, positions, vertex_normals=corner_keys[order], positions[order], vertex_normals[order]
+            if vertex_uvs is not None:
+                vertex_uvs=vertex_uvs[order]
+
+        attributes={'POSITION': builder.add_accessor(positions, target=ARRAY_BUFFER, bounds=True)}
+        if self._quantize:
+            builder.use_extension('KHR_mesh_quantization')
+            attributes['NORMAL']=builder.add_accessor(quantize_normals(vertex_normals), target=ARRAY_BUFFER,
+                                                      normalized=True, components=3)
+        else:
+            attributes['NORMAL']=builder.add_accessor(vertex_normals.astype(np.float32), target=ARRAY_BUFFER)
+        if vertex_uvs is not None:
+            quantized_uvs=quantize_uvs(vertex_uvs) if self._quantize else None
+            if quantized_uvs is not None:
+                attributes['TEXCOORD_0']=builder.add_accessor(quantized_uvs, target=ARRAY_BUFFER, normalized=True)
+            else:
+                attributes['TEXCOORD_0']=builder.add_accessor(vertex_uvs.astype(np.float32), target=ARRAY_BUFFER)
+
+        skin=None
+        if self._skins:
+            weights, influences=meshdata.get_skin_weights(shape_path)
+            if weights is not None:
+                # keep the 4 strongest influences of every vertex, renormalized
+                vertex_weights=weights[corner_keys[:, 0]]
+                joints=np.argsort(-vertex_weights, axis=1, kind='stable')[:, :4]
+                joint_weights=np.take_along_axis(vertex_weights, joints, axis=1)
+                if joints.shape[1] < 4:
+                    padding=4 - joints.shape[1]
+                    joints=np.pad(joints, ((0, 0), (0, padding)))
+                    joint_weights=np.pad(joint_weights, ((0, 0), (0, padding)))
+                joint_weights/=np.maximum(joint_weights.sum(axis=1, keepdims=True), 1e-12)
+
+                joint_type=np.uint8 if len(influences) <= 256 else np.uint16
+                attributes['JOINTS_0']=builder.add_accessor(joints.astype(joint_type), target=ARRAY_BUFFER)
+                attributes['WEIGHTS_0']=builder.add_accessor(joint_weights.astype(np.float32), target=ARRAY_BUFFER)
+                skin=self.add_skin(influences, offset)
+
+        # split the triangles into one primitive per shading group
+        shaders, face_shaders=objwriter.get_face_shaders(mesh_fn, shape_path.instanceNumber())
+        triangle_shaders=np.repeat(face_shaders, tri_counts)
+        index_type=np.uint16 if len(corner_keys) < 65536 else np.uint32
+        triangles=indices.reshape(-1, 3)
+
+        primitives=[]
+        for shader_index in np.unique(triangle_shaders).tolist():
+            primitive={'attributes': attributes, 'mode': 4,
+                       'indices': builder.add_accessor(triangles[triangle_shaders == shader_index].ravel().astype(index_type),
+                                                       target=ELEMENT_ARRAY_BUFFER)}
+            if shader_index >= 0:
+                primitive['material']=builder.get_material(shaders[shader_index])
+            primitives.append(primitive)
+
+        transform_path=om.MDagPath(shape_path)
+        transform_path.pop()
+        builder.document['meshes'].append({'name': transform_path.partialPathName(), 'primitives': primitives})
+        node={'name': transform_path.partialPathName(), 'mesh': len(builder.document['meshes']) - 1}
+        if skin is not None:
+            node['skin']=skin
+        return builder.add_node(node)
+
+    def write(self, export_file:str) -> None:
+        ''' Writes the collected asset as a '.glb' file. '''
+        self._builder.write(export_file)
+
+def write_glb(export_file:str, nodes:list, move_to_origin:bool=False, skins:bool=True,
+              quantize:bool=False, reorder:bool=True) -> int:
+    '''
+    Writes every mesh found under the provided nodes into a binary glTF file.
+    With move to origin, each node's meshes and joints are offset by the node's world rotate pivot.
+    Returns the number of written meshes.
+    '''
+    writer=gltfWriter(skins=skins, quantize=quantize, reorder=reorder)
+    visited=set()
+    for node in nodes:
+        offset=objwriter.get_origin_offset(node) if move_to_origin else None
+        for shape_path in meshdata.get_mesh_shapes([node]):
+            if shape_path.fullPathName() in visited:
+                continue
+            visited.add(shape_path.fullPathName())
+            writer.add_mesh(shape_path, offset)
+
+    writer.write(export_file)
+    return len(visited)
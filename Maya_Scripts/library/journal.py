@@ -0,0 +1,111 @@
+from ..library import datafiles
+import hashlib
+import socket
+import json
+import time
+import os
+
+# Append-only export job journal consumed by 'unrealLoader.py' (JSON Lines, one record per line):
+#   {"type": "settings", "id": "<settings ID>", "data": {...import settings...}}
+#   {"type": "batch", "id": "<batch ID>", "time": 0.0, "files": {"FBX": {"file.fbx": "<settings ID>"}}}
+#   {"type": "ack", "id": "<batch ID>", "time": 0.0}
+# Exports only append their batch and its new settings records; identical import settings are stored once
+# and referenced by ID. Batches queue up until the Unreal loader imports them; it then appends their 'ack'
+# record and compacts the journal down to the batches left to import. No Maya module is required.
+# Every exporter session stages its batches in its own journal file, 'importJournal.<session ID>.jsonl',
+# so parallel Maya sessions never wait on each other; the loader reads every 'importJournal*.jsonl' file.
+# Writers lock the journal file (see 'datafiles.py') against the loader compaction.
+
+JOURNAL_FILE_NAME = 'importJournal.jsonl'
+
+# journal file -> (stat key, stored settings IDs); appends by this session keep it current
+_settings_ids = {}
+
+def get_session_id() -> str:
+    ''' Returns the ID of the exporter session: host name and process ID. '''
+    host_name = ''.join(char if char.isalnum() else '-' for char in socket.gethostname())
+    return f'{host_name}-{os.getpid()}'
+
+def get_journal_file(data_path:str, session_id:str|None=None) -> str:
+    ''' Returns the staging journal file of the exporter session in the shared data path. '''
+    name, extension = os.path.splitext(JOURNAL_FILE_NAME)
+    return os.path.join(data_path, f'{name}.{session_id or get_session_id()}{extension}')
+
+def get_settings_id(import_settings:dict) -> str:
+    ''' Returns the ID of an import settings data set: the hash of its content. '''
+    settings = json.dumps(import_settings, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(settings, digest_size=8).hexdigest()
+
+def read_records(journal_file:str) -> list:
+    ''' Returns the journal records; an incomplete last line (journal being written) is ignored. '''
+    if not os.path.exists(journal_file):
+        return []
+
+    records = []
+    with open(journal_file, 'r', encoding='utf-8') as file:
+        for line in file:
+            if not line.endswith('\n'):
+                break
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # skip damaged records
+                continue
+    return records
+
+def _get_stat(journal_file:str):
+    ''' Returns the journal stat key (modification time, size, file ID); None if the file does not exist. '''
+    try:
+        stat = os.stat(journal_file)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+def get_settings_ids(journal_file:str) -> set:
+    '''
+    Returns the IDs of the settings records stored in the journal.
+    Parsed once per journal file and again only once its stat changes (the loader compacted or appended to it).
+    '''
+    stat = _get_stat(journal_file)
+    cached = _settings_ids.get(journal_file)
+    if cached is not None and cached[0] == stat:
+        return cached[1]
+
+    settings_ids = {record['id'] for record in read_records(journal_file) if record.get('type') == 'settings'}
+    _settings_ids[journal_file] = (stat, settings_ids)
+    return settings_ids
+
+def append_batch(data_path:str, import_data:dict, batch_id:str) -> int:
+    '''
+    Appends an export batch to the session journal: its file entries, and the settings records not stored yet.
+    Import data is keyed by importer type, then file name: {'FBX': {'file.fbx': {...import settings...}}}.
+    Returns the number of records written; empty batches are not journaled.
+    '''
+    files = {}
+    settings_records = {}
+    for handler, importer in import_data.items():
+        if not isinstance(importer, dict) or not importer:
+            continue
+        files[handler] = {}
+        for file_name, import_settings in importer.items():
+            settings_id = get_settings_id(import_settings)
+            settings_records[settings_id] = import_settings
+            files[handler][file_name] = settings_id
+    if not files:
+        return 0
+
+    journal_file = get_journal_file(data_path)
+    # the loader may compact the journal between reading the stored settings and appending
+    with datafiles.file_lock(journal_file):
+        known_ids = get_settings_ids(journal_file)
+        records = [{'type': 'settings', 'id': settings_id, 'data': import_settings}
+                   for settings_id, import_settings in settings_records.items() if settings_id not in known_ids]
+        records.append({'type': 'batch', 'id': batch_id, 'time': time.time(), 'files': files})
+
+        # a single write per batch
+        datafiles.append_text(journal_file, ''.join(json.dumps(record, sort_keys=True) + '\n' for record in records))
+        # the journal is still locked: its new stat covers exactly the stored settings
+        known_ids.update(record['id'] for record in records if record['type'] == 'settings')
+        _settings_ids[journal_file] = (_get_stat(journal_file), known_ids)
+
+    return len(records)
@@ -0,0 +1,164 @@
+import maya.api.OpenMayaAnim as oma
+import maya.api.OpenMaya as om
+import numpy as np
+
+# Mesh buffer library: reads mesh, UV and skin data straight from the Maya API as NumPy arrays
+
+def get_dag_path(node:str) -> om.MDagPath:
+    ''' Returns the DAG path of the provided node name. '''
+    sel_list=om.MSelectionList()
+    sel_list.add(node)
+    return sel_list.getDagPath(0)
+
+def get_mesh_shapes(nodes:list) -> list:
+    ''' Returns the DAG paths of every non-intermediate mesh shape found under the provided nodes. '''
+    shapes=[]
+    visited=set()
+    dag_iter=om.MItDag(om.MItDag.kDepthFirst, om.MFn.kMesh)
+    for node in nodes:
+        dag_iter.reset(get_dag_path(node), om.MItDag.kDepthFirst, om.MFn.kMesh)
+        while not dag_iter.isDone():
+            dag_path=dag_iter.getPath()
+            full_path=dag_path.fullPathName()
+            if full_path not in visited and not om.MFnDagNode(dag_path).isIntermediateObject:
+                visited.add(full_path)
+                shapes.append(dag_path)
+            dag_iter.next()
+
+    return shapes
+
+def get_points(mesh_fn:om.MFnMesh, space=om.MSpace.kObject) -> np.ndarray:
+    ''' Returns the mesh vertex positions as a (N, 3) float64 array. '''
+    points=mesh_fn.getPoints(space)
+    if not len(points):
+        return np.zeros((0, 3), dtype=np.float64)
+    return np.array(points, dtype=np.float64)[:, :3]
+
+def get_topology(mesh_fn:om.MFnMesh) -> tuple:
+    ''' Returns the per-face vertex counts and the face-vertex indices as int32 arrays. '''
+    counts, connects=mesh_fn.getVertices()
+    return np.array(counts, dtype=np.int32), np.array(connects, dtype=np.int32)
+
+def get_triangles(mesh_fn:om.MFnMesh) -> np.ndarray:
+    ''' Returns the mesh triangulation as a (T, 3) int32 array of vertex indices. '''
+    _, tri_vertices=mesh_fn.getTriangles()
+    return np.array(tri_vertices, dtype=np.int32).reshape(-1, 3)
+
+def get_normals(mesh_fn:om.MFnMesh, space=om.MSpace.kObject) -> tuple:
+    ''' Returns the mesh normals (N, 3) float32 array and the face-vertex normal indices. '''
+    normals=mesh_fn.getNormals(space)
+    _, normal_ids=mesh_fn.getNormalIds()
+    normals=np.array(normals, dtype=np.float32).reshape(-1, 3)
+    return normals, np.array(normal_ids, dtype=np.int32)
+
+def get_uvs(mesh_fn:om.MFnMesh, uv_set:str|None=None) -> tuple:
+    ''' Returns the uvs (N, 2) float32 array, face-vertex uv counts and face-vertex uv indices of a UV set (default: current). '''
+    uv_set=uv_set or mesh_fn.currentUVSetName()
+    u_values, v_values=mesh_fn.getUVs(uv_set)
+    uv_counts, uv_ids=mesh_fn.getAssignedUVs(uv_set)
+    uvs=np.column_stack([np.array(u_values, dtype=np.float32),
+                         np.array(v_values, dtype=np.float32)]).reshape(-1, 2)
+    return uvs, np.array(uv_counts, dtype=np.int32), np.array(uv_ids, dtype=np.int32)
+
+def get_uv_sets(mesh_fn:om.MFnMesh) -> dict:
+    ''' Returns every UV set: name -> (uvs (N, 2) float32 array, face-vertex uv counts, face-vertex uv indices). '''
+    return {uv_set: get_uvs(mesh_fn, uv_set) for uv_set in mesh_fn.getUVSetNames()}
+
+def get_skin_cluster(shape_path:om.MDagPath) -> om.MObject|None:
+    ''' Returns the first skin cluster found upstream of the mesh shape, if any. '''
+    graph_iter=om.MItDependencyGraph(shape_path.node(), om.MFn.kSkinClusterFilter,
+                                     om.MItDependencyGraph.kUpstream,
+                                     om.MItDependencyGraph.kDepthFirst,
+                                     om.MItDependencyGraph.kNodeLevel)
+    if graph_iter.isDone():
+        return None
+    return graph_iter.currentNode()
+
+def get_skin_weights(shape_path:om.MDagPath) -> tuple:
+    '''
+    Returns the mesh skin weights as a (N, influences) float64 array and the influence full path names.
+    Returns (None, []) when the mesh is not skinned.
+    '''
+    skin_node=get_skin_cluster(shape_path)
+    if skin_node is None:
+        return None, []
+
+    skin_fn=oma.MFnSkinCluster(skin_node)
+    influences=[influence.fullPathName() for influence in skin_fn.influenceObjects()]
+
+    # build a component holding every mesh vertex
+    components=om.MFnSingleIndexedComponent()
+    vertex_components=components.create(om.MFn.kMeshVertComponent)
+    components.setCompleteData(om.MFnMesh(shape_path).numVertices)
+
+    weights, influence_count=skin_fn.getWeights(shape_path, vertex_components)
+    weights=np.array(weights, dtype=np.float64).reshape(-1, max(influence_count, 1))
+    return weights, influences
+
+def get_corner_mesh(shape_path:om.MDagPath, uv_set:str|None=None) -> tuple:
+    '''
+    Returns the mesh as a triangle list with a vertex per distinct (vertex, uv) face corner, so UV seams are kept:
+    points (N, 3) float64, triangles (T, 3) int32 and uvs (N, 2) float32 (None if the faces are not fully mapped).
+    Faces are fan triangulated.
+    '''
+    mesh_fn=om.MFnMesh(shape_path)
+    points=get_points(mesh_fn)
+    counts, connects=get_topology(mesh_fn)
+
+    # fan triangles of every face, as face-vertex indices: (first, i + 1, i + 2)
+    offsets=np.cumsum(counts)-counts
+    triangle_counts=np.maximum(counts-2, 0)
+    faces=np.repeat(np.arange(len(counts)), triangle_counts)
+    fan=np.arange(len(faces))-np.repeat(np.cumsum(triangle_counts)-triangle_counts, triangle_counts)
+    corners=offsets[faces, None]+np.stack([np.zeros_like(fan), fan+1, fan+2], axis=1)
+
+    uvs=None
+    corner_keys=connects.astype(np.int64)
+    uv_count=1
+    if mesh_fn.numUVs(uv_set or mesh_fn.currentUVSetName()):
+        uv_values, uv_counts, uv_ids=get_uvs(mesh_fn, uv_set)
+        if np.array_equal(uv_counts, counts):
+            uv_count=len(uv_values)
+            corner_keys=corner_keys*uv_count+uv_ids
+            uvs=uv_values
+
+    keys, inverse=np.unique(corner_keys, return_inverse=True)
+    if uvs is not None:
+        uvs=uvs[keys % uv_count]
+    return points[keys // uv_count], inverse.reshape(-1)[corners].astype(np.int32), uvs
+
+def create_mesh(points:np.ndarray, triangles:np.ndarray, uvs:np.ndarray|None=None, name:str='mesh') -> str:
+    '''
+    Creates a triangle mesh, with a UV per vertex if provided, under a new transform.
+    Every edge is smooth. Returns the transform full path name.
+    '''
+    polygon_counts=[3]*len(triangles)
+    polygon_connects=np.asarray(triangles).ravel().tolist()
+    mesh_fn=om.MFnMesh()
+    if uvs is not None:
+        transform=mesh_fn.create([om.MPoint(point) for point in points.tolist()], polygon_counts, polygon_connects,
+                                 uvs[:, 0].tolist(), uvs[:, 1].tolist())
+        mesh_fn.assignUVs(polygon_counts, polygon_connects)
+    else:
+        transform=mesh_fn.create([om.MPoint(point) for point in points.tolist()], polygon_counts, polygon_connects)
+    mesh_fn.setEdgeSmoothings(list(range(mesh_fn.numEdges)), [True]*mesh_fn.numEdges)
+    mesh_fn.cleanupEdgeSmoothing()
+    mesh_fn.updateSurface()
+
+    transform_fn=om.MFnDagNode(transform)
+    transform_fn.setName(name)
+    return transform_fn.fullPathName()
+
+def get_shading_groups(shape_path:om.MDagPath) -> list:
+    ''' Returns the names of the shading groups assigned to the mesh shape. '''
+    shaders, _=om.MFnMesh(shape_path).getConnectedShaders(shape_path.instanceNumber())
+    return [om.MFnDependencyNode(shader).name() for shader in shaders]
+
+def get_shading_group(shape_path:om.MDagPath) -> str|None:
+    ''' Returns the first shading group assigned to the mesh shape, if any. '''
+    shading_groups=get_shading_groups(shape_path)
+    return shading_groups[0] if shading_groups else None
+
+def get_uv_counts(mesh_fn:om.MFnMesh) -> dict:
+    ''' Returns the face-vertex uv counts of every UV set, as int32 arrays: UV set name -> face uv counts. '''
+    return {uv_set: np.array(mesh_fn.getAssignedUVs(uv_set)[0], dtype=np.int32) for uv_set in mesh_fn.getUVSetNames()}
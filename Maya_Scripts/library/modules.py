@@ -1,4 +1,8 @@
+import maya.api.OpenMayaAnim as oma
+import maya.api.OpenMaya as om
 import maya.cmds as mc
+from ..library import datafiles
+from ..library import tracing
 from pathlib import Path
 import json
 import os
@@ -6,16 +10,78 @@ import os
 # Module/functions library for all the plugin modules
 
 # maya modules dependent functions
-def move_to_origin(mesh) -> None:
-    ''' Moves the provided mesh to the world origin (0,0,0) using its rotate pivot. '''
-    mc.move(0,0,0, mesh, rotatePivotRelative = True)
-
-def place_mesh_back(values, mesh) -> None:
-    ''' Moves the provided mesh back to its original position using provided values. '''
-    mc.move(values[0],
-            values[1],
-            values[2], mesh, absolute=True)
-    
+def get_movable_nodes(nodes:list) -> list:
+    ''' Returns the nodes that can be placed at the world origin: nodes not parented under a joint (root joints included). '''
+    movable_nodes=[]
+    for node in nodes:
+        parent=mc.listRelatives(node, parent=True, fullPath=True)
+        if not parent or mc.nodeType(parent[0]) != 'joint':
+            movable_nodes.append(node)
+    return movable_nodes
+
+@tracing.traced('modules.offset_to_origin')
+def offset_to_origin(nodes:list) -> om.MDGModifier:
+    '''
+    Places the provided nodes at the world origin (0,0,0) using their rotate pivot, as one batched translate edit.
+    The edit is not recorded in the undo queue: call undoIt() on the returned modifier to restore the nodes.
+    '''
+    sel_list=om.MSelectionList()
+    for node in nodes:
+        sel_list.add(node)
+
+    modifier=om.MDGModifier()
+    for index in range(len(nodes)):
+        dag_path=sel_list.getDagPath(index)
+        transform_fn=om.MFnTransform(dag_path)
+        # world pivot offset, converted into the parent space of the node
+        offset=om.MVector(transform_fn.rotatePivot(om.MSpace.kWorld)) * dag_path.exclusiveMatrixInverse()
+        translation=transform_fn.translation(om.MSpace.kTransform) - offset
+        for attr, value in zip(['translateX', 'translateY', 'translateZ'], [translation.x, translation.y, translation.z]):
+            modifier.newPlugValueDouble(transform_fn.findPlug(attr, False), value)
+    modifier.doIt()
+    return modifier
+
+@tracing.traced('modules.set_string_attributes')
+def set_string_attributes(values:dict) -> om.MDGModifier:
+    '''
+    Sets the string attributes, provided as 'node.attribute' -> value, as one batched edit.
+    The edit is not recorded in the undo queue: call undoIt() on the returned modifier to restore the values.
+    '''
+    sel_list=om.MSelectionList()
+    for attribute in values:
+        sel_list.add(attribute)
+
+    modifier=om.MDGModifier()
+    for index, value in enumerate(values.values()):
+        modifier.newPlugValueString(sel_list.getPlug(index), value)
+    modifier.doIt()
+    return modifier
+
+def get_instance_transforms(source:str, nodes:list, at_origin:bool=False) -> list:
+    '''
+    Returns the placement of every node relative to the exported source node, as row-major 4x4 matrices
+    (16 values, Maya world space): placing the source asset with it matches the node world transform.
+    At origin, the source is exported with its rotate pivot at the world origin (see offset_to_origin).
+    '''
+    sel_list=om.MSelectionList()
+    for node in [source, *nodes]:
+        sel_list.add(node)
+
+    source_path=sel_list.getDagPath(0)
+    source_matrix=om.MMatrix(source_path.inclusiveMatrix())
+    if at_origin:
+        pivot=om.MFnTransform(source_path).rotatePivot(om.MSpace.kWorld)
+        for column, value in enumerate([pivot.x, pivot.y, pivot.z]):
+            source_matrix.setElement(3, column, source_matrix.getElement(3, column) - value)
+    source_inverse=source_matrix.inverse()
+
+    transforms=[]
+    for index in range(1, len(nodes) + 1):
+        matrix=source_inverse * sel_list.getDagPath(index).inclusiveMatrix()
+        transforms.append([matrix[element] for element in range(16)])
+    return transforms
+
+@tracing.traced('modules.get_root_jnts')
 def get_root_jnts() -> list:
     ''' Returns a list of root joints found in the current scene. '''
     scene_joints=mc.ls(type='joint')
@@ -50,58 +116,94 @@ def select_root_jnt(root_jnt:str, contains_list:bool=False, jnts:list=[]) -> Non
         mc.select(root_jnt, add=True)
         print(f'{root_jnt} Selected')
 
-def get_unused_joints_in_hier(root_jtns:list):
+@tracing.traced('modules.get_joint_skin_clusters')
+def get_joint_skin_clusters() -> dict:
     ''' 
-    Returns a list of joints that have no bind data. 
-    Requires a joint hierarchy list.
+    Returns a map of every bound joint (full path) to the skin clusters it influences.
+    Built in a single Maya API pass over the scene skin clusters.
     '''
-    unbinded_jnts={}
-    for root_jnt in root_jtns:
-        if mc.nodeType(root_jnt) != 'joint':
-            continue
-        if not mc.objExists(root_jnt):
-            continue
+    joint_clusters={}
+    cluster_iter=om.MItDependencyNodes(om.MFn.kSkinClusterFilter)
+    while not cluster_iter.isDone():
+        skin_fn=oma.MFnSkinCluster(cluster_iter.thisNode())
+        cluster_name=skin_fn.name()
+        try:
+            influences=skin_fn.influenceObjects()
+        except RuntimeError:
+            # skip skin clusters without valid influence data
+            influences=[]
+        for influence in influences:
+            clusters=joint_clusters.setdefault(influence.fullPathName(), [])
+            if cluster_name not in clusters:
+                clusters.append(cluster_name)
+        cluster_iter.next()
+
+    return joint_clusters
 
-        hierarchy=mc.listRelatives(root_jnt, allDescendents=True, type='joint', fullPath=True)
+def get_joint_hierarchy(root_jnt:str) -> list:
+    ''' Returns the full paths of the root joint and every descendant joint, using a Maya API DAG iterator. '''
+    sel_list=om.MSelectionList()
+    sel_list.add(root_jnt)
+    dag_iter=om.MItDag(om.MItDag.kDepthFirst, om.MFn.kJoint)
+    dag_iter.reset(sel_list.getDagPath(0), om.MItDag.kDepthFirst, om.MFn.kJoint)
 
-        hierarchy.append(root_jnt)
+    hierarchy=[]
+    while not dag_iter.isDone():
+        hierarchy.append(dag_iter.fullPathName())
+        dag_iter.next()
 
-        unused_jnts = []
+    return hierarchy
 
-        for jnt in hierarchy:
-            is_bound=False
-            connections=mc.listConnections(f'{jnt}.worldMatrix[0]', type='skinCluster')
+@tracing.traced('modules.get_unused_joints_in_hier')
+def get_unused_joints_in_hier(root_jtns:list, joint_clusters:dict|None=None) -> dict:
+    ''' 
+    Returns a list of joints that have no bind data for each root joint. 
+    Requires a joint hierarchy list; a prebuilt joint to skin clusters map can be provided.
+    '''
+    if joint_clusters is None:
+        joint_clusters=get_joint_skin_clusters()
 
-            if connections:
-                is_bound=True
+    unbinded_jnts={}
+    for root_jnt in root_jtns:
+        if not mc.objExists(root_jnt):
+            continue
+        if mc.nodeType(root_jnt) != 'joint':
+            continue
 
-            if not is_bound:
-                unused_jnts.append(jnt)
-        unbinded_jnts[root_jnt]=unused_jnts
+        unbinded_jnts[root_jnt]=[jnt for jnt in get_joint_hierarchy(root_jnt) 
+                                 if jnt not in joint_clusters]
 
     return unbinded_jnts
 
-def bind_unused_joints(root_jnts_data:dict):
+@tracing.traced('modules.bind_unused_joints')
+def bind_unused_joints(root_jnts_data:dict, joint_clusters:dict|None=None) -> None:
     '''
-    Binds the joints that have no bind data.
-    Requires a dictionary of unused joints in hierarchy.
+    Binds the joints that have no bind data to the skin clusters of their hierarchy.
+    Requires a dictionary of unused joints in hierarchy; missing influences are added in bulk per cluster.
     '''
-    for root_jnt in root_jnts_data:
-        connections=mc.listConnections(f'{root_jnt}.worldMatrix[0]', type='skinCluster')
-        if not connections:
-            hierarchy=mc.listRelatives(root_jnt, allDescendents=True, type='joint', fullPath=True)
-            for jnt in hierarchy:
-                connections=mc.listConnections(f'{jnt}.worldMatrix[0]', type='skinCluster')
-                if connections:
-                    break
+    if joint_clusters is None:
+        joint_clusters=get_joint_skin_clusters()
+
+    for root_jnt, unbinded_joints in root_jnts_data.items():
+        if not unbinded_joints:
+            continue
+        # find every skin cluster bound to the root joint hierarchy
+        connections=[]
+        for jnt in get_joint_hierarchy(root_jnt):
+            for cluster in joint_clusters.get(jnt, []):
+                if cluster not in connections:
+                    connections.append(cluster)
         print(connections)
-    
-    for unbinded_joint in root_jnts_data.get(root_jnt):
+
         for connected_cluster in connections:
             mc.skinCluster(connected_cluster, edit=True, 
-                           addInfluence=unbinded_joint, 
+                           addInfluence=unbinded_joints, 
                            weight=0.0, lockWeights=False)
+        # register the new influences for the following hierarchies
+        for jnt in unbinded_joints:
+            joint_clusters[jnt]=list(connections)
 
+@tracing.traced('modules.get_skinned_meshes')
 def get_skinned_meshes(selection:list) -> list:
         ''' Returns a list of skinned meshes from the provided selection. '''
         skinned_meshes=[]
@@ -132,17 +234,21 @@ def del_non_deform_history(mesh_sl:list) -> None:
 
 # data handling related functions
 def save_data(path:str, file_name:str, data) -> None:
-    ''' Saves data into a json file: must include a path to store data. '''
+    ''' 
+    Saves data into a json file: must include a path to store data.
+    The file is replaced atomically under its lock; safe with other Maya sessions and the Unreal loader.
+    '''
     if not file_name.endswith('.json'):
         file_name+='.json'
 
-    with open(os.path.join(path, file_name), 'w') as file:
-        json.dump(data, file, indent=4, sort_keys=True)
+    with tracing.span('modules.save_data', file=file_name):
+        datafiles.save_json(os.path.join(path, file_name), data)
 
 def load_data(path:str, file_name:str) -> dict:
     ''' Loads a path data (dictionary) from a json file. '''
-    with open(os.path.join(path, file_name), 'r') as file:
-        stored_data = json.load(file)
+    with tracing.span('modules.load_data', file=file_name):
+        with open(os.path.join(path, file_name), 'r') as file:
+            stored_data = json.load(file)
 
     return stored_data
 
@@ -152,6 +258,10 @@ def get_documents_folder() -> str:
     documents_path = os.path.join(str(Path.home()), 'Documents')
     return documents_path
 
+def get_data_folder() -> str:
+    ''' Returns the shared UE data path: 'Documents/UE/Data'. '''
+    return os.path.join(get_documents_folder(), 'UE', 'Data')
+
 def path_exists(file_path: str) -> bool:
     ''' Checks if a path or file path exists. '''
     if os.path.exists(file_path):
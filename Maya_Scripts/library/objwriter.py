@@ -0,0 +1,201 @@
+from ..library import meshdata
+import maya.api.OpenMaya as om
+import maya.cmds as mc
+import numpy as np
+import os
+
+# Native OBJ writer: streams mesh buffers read from the Maya API straight to disk.
+# The scene is never modified; axis conversion and origin offset are applied in the writer.
+
+# rows formatted per write; keeps the text buffers small on multi-million-poly meshes
+CHUNK_SIZE = 65536
+# file write buffer size
+BUFFER_SIZE = 1 << 22
+
+def convert_axis(values:np.ndarray) -> np.ndarray:
+    ''' Converts Y-up (x, y, z) values to the Z-up (x, -z, y) layout expected by the Unreal OBJ importer. '''
+    return np.column_stack([values[:, 0], -values[:, 2], values[:, 1]])
+
+def get_origin_offset(node:str) -> np.ndarray:
+    ''' Returns the world rotate pivot of the node: the offset that places it at the world origin. '''
+    dag_path=meshdata.get_dag_path(node)
+    if not dag_path.hasFn(om.MFn.kTransform):
+        return np.zeros(3, dtype=np.float64)
+    pivot=om.MFnTransform(dag_path).rotatePivot(om.MSpace.kWorld)
+    return np.array([pivot.x, pivot.y, pivot.z], dtype=np.float64)
+
+def write_rows(file, row_format:str, rows:np.ndarray) -> None:
+    ''' Writes the rows of a 2D array with the row format, one chunk at a time. '''
+    for start in range(0, len(rows), CHUNK_SIZE):
+        chunk=rows[start:start+CHUNK_SIZE]
+        file.write((row_format * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+def get_face_formats(counts:np.ndarray, vertex_format:str) -> dict:
+    ''' Returns the face line format of every face vertex count found in the mesh. '''
+    return {count: 'f' + f' {vertex_format}' * count + '\n' for count in np.unique(counts).tolist()}
+
+def write_faces(file, counts:np.ndarray, offsets:np.ndarray, face_vertices:np.ndarray,
+                vertex_format:str, first:int, last:int) -> None:
+    '''
+    Writes the faces [first, last) one chunk at a time.
+    Face vertices is a (face-vertices, index columns) array of 1 based OBJ indices.
+    '''
+    face_formats=get_face_formats(counts[first:last], vertex_format)
+    for start in range(first, last, CHUNK_SIZE):
+        end=min(start+CHUNK_SIZE, last)
+        line_format=''.join([face_formats[count] for count in counts[start:end].tolist()])
+        values=face_vertices[offsets[start]:offsets[end]]
+        file.write(line_format % tuple(values.ravel().tolist()))
+
+def get_face_shaders(mesh_fn:om.MFnMesh, instance:int) -> tuple:
+    ''' Returns the shading group names and the per face shading group index (-1 when unassigned). '''
+    shaders, indices=mesh_fn.getConnectedShaders(instance)
+    names=[om.MFnDependencyNode(shader).name() for shader in shaders]
+    return names, np.array(indices, dtype=np.int32)
+
+def get_material_values(shading_group:str) -> dict:
+    ''' Returns the diffuse color and texture of the surface shader connected to the shading group. '''
+    values={'Kd': (0.5, 0.5, 0.5), 'map_Kd': None}
+    shaders=mc.listConnections(f'{shading_group}.surfaceShader', source=True, destination=False)
+    if not shaders:
+        return values
+
+    shader=shaders[0]
+    if mc.attributeQuery('color', node=shader, exists=True):
+        values['Kd']=mc.getAttr(f'{shader}.color')[0]
+        textures=mc.listConnections(f'{shader}.color', source=True, destination=False, type='file')
+        if textures:
+            values['map_Kd']=mc.getAttr(f'{textures[0]}.fileTextureName')
+
+    return values
+
+def write_materials(mtl_file:str, shading_groups:list, include_textures:bool=False) -> None:
+    ''' Writes the material library of the exported shading groups. '''
+    with open(mtl_file, 'w', encoding='utf-8') as file:
+        for shading_group in shading_groups:
+            values=get_material_values(shading_group)
+            file.write(f'newmtl {shading_group}\nillum 4\n')
+            file.write('Kd %.6f %.6f %.6f\n' % tuple(values['Kd']))
+            file.write('Ka 0.00 0.00 0.00\nTf 1.00 1.00 1.00\nNi 1.00\n')
+            if include_textures and values['map_Kd']:
+                file.write(f"map_Kd {values['map_Kd']}\n")
+            file.write('\n')
+
+class objWriter():
+    '''
+    Streams meshes into a single OBJ file.
+    Vertex, UV and normal indices are tracked across meshes so every mesh can be written in turn.
+    '''
+    def __init__(self, export_file:str, groups:bool=True, materials:bool=True, smoothing:bool=True,
+                 normals:bool=True, axis_conversion:bool=True):
+        ''' Opens the export file; materials are written to a '.mtl' library next to it. '''
+        self._export_file=export_file
+        self._groups=groups
+        self._materials=materials
+        self._smoothing=smoothing
+        self._normals=normals
+        self._axis_conversion=axis_conversion
+
+        self._vertex_offset=1
+        self._uv_offset=1
+        self._normal_offset=1
+        self._shading_groups=[]
+
+        self._file=open(export_file, 'w', encoding='utf-8', buffering=BUFFER_SIZE)
+        self._file.write('# This file uses centimeters as units for non-parametric coordinates.\n\n')
+        if materials:
+            self._file.write(f'mtllib {os.path.splitext(os.path.basename(export_file))[0]}.mtl\n')
+
+    def write_mesh(self, shape_path:om.MDagPath, offset:np.ndarray|None=None) -> None:
+        ''' Writes a mesh shape in world space, minus the optional origin offset. '''
+        mesh_fn=om.MFnMesh(shape_path)
+        file=self._file
+
+        points=meshdata.get_points(mesh_fn, om.MSpace.kWorld)
+        if offset is not None:
+            points-=offset
+        if self._axis_conversion:
+            points=convert_axis(points)
+        write_rows(file, 'v %.6f %.6f %.6f\n', points)
+
+        counts, connects=meshdata.get_topology(mesh_fn)
+        columns=[connects + self._vertex_offset]
+        vertex_format='%d'
+
+        # UVs of the current UV set; only written when every face is mapped
+        uvs, uv_counts, uv_ids=meshdata.get_uvs(mesh_fn)
+        has_uvs=len(uvs) and np.array_equal(uv_counts, counts)
+        if has_uvs:
+            write_rows(file, 'vt %.6f %.6f\n', uvs)
+            columns.append(uv_ids + self._uv_offset)
+            vertex_format+='/%d'
+
+        if self._normals:
+            mesh_normals, normal_ids=meshdata.get_normals(mesh_fn, om.MSpace.kWorld)
+            if self._axis_conversion:
+                mesh_normals=convert_axis(mesh_normals)
+            write_rows(file, 'vn %.6f %.6f %.6f\n', mesh_normals)
+            columns.append(normal_ids + self._normal_offset)
+            vertex_format+='/%d' if has_uvs else '//%d'
+
+        face_vertices=np.column_stack(columns)
+        offsets=np.zeros(len(counts)+1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        transform_path=om.MDagPath(shape_path)
+        transform_path.pop()
+        if self._groups:
+            file.write(f'g {transform_path.partialPathName()}\n')
+        file.write('s 1\n' if self._smoothing else 's off\n')
+
+        if self._materials:
+            shading_groups, face_shaders=get_face_shaders(mesh_fn, shape_path.instanceNumber())
+            # write a 'usemtl' statement at every run of faces sharing a shading group
+            runs=np.concatenate([[0], np.flatnonzero(np.diff(face_shaders)) + 1, [len(counts)]])
+            for first, last in zip(runs[:-1].tolist(), runs[1:].tolist()):
+                if first==last:
+                    continue
+                shader_index=face_shaders[first]
+                if shader_index >= 0:
+                    shading_group=shading_groups[shader_index]
+                    if shading_group not in self._shading_groups:
+                        self._shading_groups.append(shading_group)
+                    file.write(f'usemtl {shading_group}\n')
+                write_faces(file, counts, offsets, face_vertices, vertex_format, first, last)
+        else:
+            write_faces(file, counts, offsets, face_vertices, vertex_format, 0, len(counts))
+
+        self._vertex_offset+=len(points)
+        if has_uvs:
+            self._uv_offset+=len(uvs)
+        if self._normals:
+            self._normal_offset+=len(mesh_normals)
+
+    def close(self, include_textures:bool=False) -> None:
+        ''' Closes the export file and writes the material library of the exported meshes. '''
+        self._file.close()
+        if self._materials:
+            write_materials(os.path.splitext(self._export_file)[0] + '.mtl', self._shading_groups,
+                            include_textures=include_textures)
+
+def write_obj(export_file:str, nodes:list, move_to_origin:bool=False, groups:bool=True, materials:bool=True,
+              smoothing:bool=True, normals:bool=True, include_textures:bool=False) -> int:
+    '''
+    Writes every mesh found under the provided nodes into an OBJ file.
+    With move to origin, each node's meshes are offset by the node's world rotate pivot.
+    Returns the number of written meshes.
+    '''
+    writer=objWriter(export_file, groups=groups, materials=materials, smoothing=smoothing, normals=normals)
+    visited=set()
+    try:
+        for node in nodes:
+            offset=get_origin_offset(node) if move_to_origin else None
+            for shape_path in meshdata.get_mesh_shapes([node]):
+                if shape_path.fullPathName() in visited:
+                    continue
+                visited.add(shape_path.fullPathName())
+                writer.write_mesh(shape_path, offset)
+    finally:
+        writer.close(include_textures=include_textures)
+
+    return len(visited)
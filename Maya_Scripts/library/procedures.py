@@ -0,0 +1,698 @@
+from ..library import fingerprint
+from ..library import meshdata
+from ..library import modules as md
+from ..library import profiles
+from ..library import simplify
+from ..library import textures as tx
+from ..library import tracing
+from ..library import validation
+from contextlib import contextmanager
+import maya.cmds as mc
+import sys
+import os
+
+# Export procedures shared by the exporter UI and the headless batch driver.
+# Settings are plain dictionaries keyed with the exporter UI element IDs.
+
+# default values of the exporter UI elements, used when a setting is not provided
+FBX_DEFAULT_SETTINGS = {'smooth_groups': True, 'smooth_mesh': False, 'tangents': True, 'triangulate': False,
+                        'move_to_origin': True, 'embed_media': True, 'skins': True, 'blnd_shapes': True,
+                        'unused_jnts': False, 'export_anim': False, 'bake_anim': False, 'single_bake': True,
+                        'axis': 'Y-Up', 'fileType': 'Binary', 'version': 'FBX 2020',
+                        'imp_materials': True, 'imp_textures': True, 'use_source_name': False,
+                        'imp_static_mesh': True, 'imp_skeletal_mesh': True, 'imp_anim': False,
+                        'imp_only_anims': False, 'imp_meshes_bones': False, 'skeleton': 'None',
+                        'skip_unchanged': True, 'batch_export': False, 'prefix': '', 'suffix': '',
+                        'instance_meshes': True, 'place_instances': False,
+                        'export_lods': False, 'lod_ratios': [0.5, 0.25, 0.125], 'validate_meshes': True,
+                        'process_textures': False, 'texture_max_size': 2048, 'texture_format': 'PNG'}
+
+OBJ_DEFAULT_SETTINGS = {'move_to_origin': True, 'groups': True, 'pt_groups': True, 'materials': True,
+                        'smoothing': True, 'normals': True,
+                        'imp_materials': True, 'imp_textures': False, 'imp_static_mesh': True,
+                        'imp_skeletal_mesh': True, 'use_source_name': True,
+                        'skip_unchanged': True, 'batch_export': False, 'prefix': '', 'suffix': '',
+                        'validate_meshes': True,
+                        'process_textures': False, 'texture_max_size': 2048, 'texture_format': 'PNG'}
+
+GLTF_DEFAULT_SETTINGS = {'move_to_origin': True, 'skins': True, 'quantize': False, 'reorder': True,
+                         'imp_materials': True, 'imp_textures': False, 'imp_static_mesh': True,
+                         'imp_skeletal_mesh': True, 'use_source_name': False, 'skeleton': 'None',
+                         'skip_unchanged': True, 'batch_export': False, 'prefix': '', 'suffix': '',
+                         'validate_meshes': True}
+
+def build_file_name(file_name:str, prefix:str|None=None, suffix:str|None=None,
+                    extension:str='.obj', keep_extension:bool=True) -> str:
+    '''
+    Builds and returns the export file name with optional prefix and suffix string values.
+    Can only build with '.obj', '.fbx' or '.glb' extensions.
+    '''
+    avilable_extensions = ['.obj', '.fbx', '.glb']
+    if extension not in avilable_extensions:
+        mc.warning(f"Extension: '{extension}' not available. Available extensions: {avilable_extensions}")
+        return file_name
+
+    # concatenate prefix and/or prefix is value exists
+    if prefix:
+        file_name = prefix+file_name
+    if extension in file_name:
+        file_name = file_name.split(extension)[0]
+    if suffix:
+        file_name += suffix
+    # if the user didn't add extension at the end of the file name, add it
+    if keep_extension:
+        if not file_name.endswith(extension):
+            file_name += extension
+
+    return file_name
+
+def build_import_settings(settings:dict, importer:str='OBJ', animation_clips:list|None=None,
+                          skeleton_data:dict|None=None) -> dict:
+    '''
+    Handles the configuration of the import settings data set.
+    Defaults to OBJ importer unless otherwise specified.
+    '''
+    import_settings = {}
+
+    # overwrite values with the user settings
+    import_settings['Import Materials']=settings.get('imp_materials')
+    import_settings['Import Textures']=settings.get('imp_textures')
+    import_settings['Import Static Mesh']=settings.get('imp_static_mesh')
+    import_settings['Import Skeletal Mesh']=settings.get('imp_skeletal_mesh')
+    import_settings['Use Source Name']=settings.get('use_source_name')
+
+    # set FBX specific import settings
+    if importer=='FBX':
+        if import_settings['Import Static Mesh'] and not import_settings['Import Skeletal Mesh']:
+            import_settings['Force Mesh Type']=1
+        import_settings['Import Animations']=settings.get('imp_anim')
+        if import_settings['Import Animations']:
+            # set additional animation import settings
+            import_settings['Import Only Animations']=settings.get('imp_only_anims')
+            # get animation clips frame range
+            if animation_clips:
+                import_settings['Animation Range']=animation_clips
+            else:
+                import_settings['Animation Range']=None
+
+        # set skeleton asset from UE project skeletons data, if available
+        skeleton = settings.get('skeleton', 'None')
+        if skeleton and skeleton != 'None' and skeleton_data and skeleton in skeleton_data:
+            skeleton_asset=f'{skeleton_data.get(skeleton)}.{skeleton}'
+            import_settings['Skeleton']=skeleton_asset
+        else:
+            import_settings['Skeleton']=None
+        import_settings['Meshes in Bone Hierarchy']=settings.get('imp_meshes_bones')
+
+    # set GLTF specific import settings; skinned meshes can join an existing skeleton
+    if importer=='GLTF':
+        skeleton = settings.get('skeleton', 'None')
+        if skeleton and skeleton != 'None' and skeleton_data and skeleton in skeleton_data:
+            import_settings['Skeleton']=f'{skeleton_data.get(skeleton)}.{skeleton}'
+        else:
+            import_settings['Skeleton']=None
+
+    return import_settings
+
+@tracing.traced('procedures.apply_fbx_settings')
+def apply_fbx_settings(fbx, settings:dict) -> int:
+    '''
+    Applies the user's fbx settings on the provided fbx exporter before exporting.
+    Settings are compiled into their FBX plugin calls (see profiles.compile_fbx_settings); 
+    only the calls whose value changed since the previous export are issued.
+    Returns the number of issued calls.
+    '''
+    return fbx.apply_calls(profiles.compile_fbx_settings(settings))
+
+@tracing.traced('procedures.bind_selected_unused_joints')
+def bind_selected_unused_joints(selection:list) -> None:
+    ''' Binds the unused joints of the root joints found in the selection. '''
+    root_jnts=md.get_root_jnts()
+    selected_roots=[jnt for jnt in selection if jnt in root_jnts]
+    if not selected_roots:
+        return
+
+    # get the joint bind data once for every selected root joint
+    joint_clusters=md.get_joint_skin_clusters()
+    jnts_data=md.get_unused_joints_in_hier(selected_roots, joint_clusters)
+    if jnts_data:
+        # binds unused joints with 0 influence to skinned meshes before export
+        md.bind_unused_joints(jnts_data, joint_clusters) # experimental; requires further testing
+
+@tracing.traced('procedures.validate_selection')
+def validate_selection(selection:list, settings:dict) -> None:
+    '''
+    Validates every mesh shape of the selection when 'validate_meshes' is set (see 'validation.validate_mesh').
+    Raises validation.meshValidationError with the report of every invalid mesh; called before any file is written.
+    '''
+    if not settings.get('validate_meshes'):
+        return
+    reports=validation.validate_shapes(selection)
+    if reports:
+        raise validation.meshValidationError(reports)
+
+def get_asset_fingerprint(export_file:str, nodes:list, settings:dict, import_settings:dict) -> str:
+    ''' Returns the fingerprint of an exported asset, over the playback range (see 'fingerprint.asset_fingerprint'). '''
+    anim_range=[mc.playbackOptions(query=True, minTime=True), mc.playbackOptions(query=True, maxTime=True)]
+    with tracing.span('fingerprint.asset_fingerprint', file=export_file):
+        return fingerprint.asset_fingerprint(nodes, [settings, import_settings], anim_range)
+
+def export_selection(exporter, nodes:list, settings:dict, import_settings:dict, cache=None,
+                     asset_fingerprint:str|None=None, **export_kwargs) -> bool:
+    '''
+    Selects and exports the nodes with the provided exporter type.
+    When an export cache is provided, the export is skipped if the asset fingerprint is unchanged;
+    the fingerprint is only recorded once the file is exported. A fingerprint taken earlier can be provided.
+    Returns False if the export was skipped or failed: the file must not be imported.
+    '''
+    export_file=exporter.get_export_file()
+    if cache is not None:
+        if asset_fingerprint is None:
+            asset_fingerprint=get_asset_fingerprint(export_file, nodes, settings, import_settings)
+        if cache.is_unchanged(export_file, asset_fingerprint):
+            sys.stdout.write(f"Skipped unchanged asset: {export_file}\n")
+            return False
+
+    mc.select(nodes)
+    exported=exporter.export(**export_kwargs)
+    if exported and cache is not None:
+        cache.update(export_file, asset_fingerprint)
+
+    return exported
+
+def get_lod_shape(nodes:list):
+    ''' Returns the mesh shape LODs are built for: the single mesh shape of the nodes, if not skinned; None otherwise. '''
+    shapes=meshdata.get_mesh_shapes(nodes)
+    if len(shapes)!=1 or meshdata.get_skin_cluster(shapes[0]) is not None:
+        return None
+    return shapes[0]
+
+def get_lod_settings(file_name:str, ratios:list) -> list:
+    ''' Returns the LOD1..LODn import settings of an exported file: sidecar file name ('<name>_LOD<n>') and triangle ratio. '''
+    name, extension=os.path.splitext(file_name)
+    return [{'File': f'{name}_LOD{index}{extension}', 'Ratio': ratio}
+            for index, ratio in enumerate(sorted(ratios, reverse=True), start=1)]
+
+@tracing.traced('procedures.export_lods')
+def export_lods(fbx, shape_path, lods:list) -> int:
+    '''
+    Exports the LODs of the mesh shape, listed as LOD import settings (see 'get_lod_settings'), into sidecar FBX files.
+    LODs are simplified from the mesh at their triangle ratio (see 'simplify.build_lod_chain'); each is exported
+    from a temporary mesh placed and shaded as the source mesh, deleted once exported.
+    Returns the number of exported LODs.
+    '''
+    points, triangles, uvs=meshdata.get_corner_mesh(shape_path)
+    with tracing.span('simplify.build_lod_chain', triangles=len(triangles), lods=len(lods)):
+        lod_meshes=simplify.build_lod_chain(points, triangles, [lod['Ratio'] for lod in lods], attributes=uvs)
+
+    source=mc.listRelatives(shape_path.fullPathName(), parent=True, fullPath=True)[0]
+    world_matrix=mc.xform(source, query=True, matrix=True, worldSpace=True)
+    shading_group=meshdata.get_shading_group(shape_path)
+    exported=0
+    for lod, (lod_points, lod_triangles, lod_uvs) in zip(lods, lod_meshes):
+        lod_node=meshdata.create_mesh(lod_points, lod_triangles, lod_uvs,
+                                      name=os.path.splitext(lod['File'])[0])
+        try:
+            mc.xform(lod_node, matrix=world_matrix, worldSpace=True)
+            if shading_group:
+                mc.sets(lod_node, edit=True, forceElement=shading_group)
+            mc.select(lod_node)
+            fbx.set_file_name(lod['File'])
+            exported+=fbx.export()
+        finally:
+            mc.delete(lod_node)
+
+    return exported
+
+def get_texture_cache(data_path:str, settings:dict):
+    ''' Returns the processed texture cache of the export settings (see 'textures.textureCache'); None if texture processing is off. '''
+    if not settings.get('process_textures'):
+        return None
+    return tx.textureCache(data_path, max_size=int(settings.get('texture_max_size') or 2048),
+                           image_format=settings.get('texture_format') or 'PNG')
+
+def get_file_textures(nodes:list) -> dict:
+    ''' Returns the file textures of the shading networks assigned to the mesh shapes of the nodes: file node -> texture file. '''
+    shading_groups=set()
+    for shape_path in meshdata.get_mesh_shapes(nodes):
+        shading_groups.update(meshdata.get_shading_groups(shape_path))
+    if not shading_groups:
+        return {}
+
+    file_textures={}
+    for file_node in mc.ls(mc.listHistory(sorted(shading_groups)) or [], type='file'):
+        texture_file=mc.getAttr(f'{file_node}.fileTextureName')
+        if texture_file:
+            file_textures[file_node]=texture_file
+    return file_textures
+
+def get_texture_settings(nodes:list, processed:dict) -> list:
+    ''' Returns the processed texture copies used by the nodes, for their import settings; call while the copies are in use. '''
+    processed_files=set(processed.values())
+    return sorted({texture_file for texture_file in get_file_textures(nodes).values() if texture_file in processed_files})
+
+@contextmanager
+def processed_textures(textures, selection:list):
+    '''
+    Points the file textures of the selection at their processed copies for the enclosed exports,
+    processing every texture not cached yet at once (see 'textures.textureCache.process').
+    The texture file names are restored on exit, errors included; no undo entry is left behind.
+    Yields the processed copy of every source texture file; empty without a texture cache.
+    '''
+    if textures is None:
+        yield {}
+        return
+
+    file_textures=get_file_textures(selection)
+    with tracing.span('procedures.process_textures', textures=len(file_textures)):
+        processed=textures.process(list(file_textures.values()))
+        textures.save()
+    values={f'{file_node}.fileTextureName': processed[texture_file]
+            for file_node, texture_file in file_textures.items() if texture_file in processed}
+    modifier=md.set_string_attributes(values) if values else None
+    try:
+        yield processed
+    finally:
+        if modifier is not None:
+            modifier.undoIt()
+
+@tracing.traced('procedures.group_instances')
+def group_instances(selection:list) -> list:
+    '''
+    Groups the selected nodes holding the same mesh geometry (see 'fingerprint.geometry_fingerprint'),
+    whether duplicated or instanced. Returns (source node, nodes) pairs in selection order;
+    the first node of each group is its source. Only nodes whose own single mesh shape is not skinned
+    are grouped; any other node is a group of its own.
+    '''
+    groups={}
+    for node in selection:
+        group_key=('node', node)
+        shapes=meshdata.get_mesh_shapes([node])
+        if len(shapes)==1 and meshdata.get_skin_cluster(shapes[0]) is None:
+            node_shapes=mc.listRelatives(node, shapes=True, fullPath=True) or []
+            if shapes[0].fullPathName() in node_shapes:
+                group_key=('geometry', fingerprint.geometry_fingerprint(shapes[0]))
+        groups.setdefault(group_key, []).append(node)
+
+    return [(nodes[0], nodes) for nodes in groups.values()]
+
+def get_instance_groups(selection:list, settings:dict) -> list|None:
+    '''
+    Returns the instance groups of an FBX batch export with 'instance_meshes' on (see 'group_instances'):
+    one exported item per group. None if the export does not group instances (one item per selected node).
+    '''
+    if settings.get('batch_export') and settings.get('instance_meshes'):
+        return group_instances(selection)
+    return None
+
+@tracing.traced('procedures.export_batch_items')
+def export_batch_items(items:list, export_item, checkpoint=None, progress=None) -> dict:
+    '''
+    Exports batch items, provided as (node, file name) pairs, one at a time.
+    Export item is called with the node and file name; returns the import settings, or None if skipped.
+    Items recorded in the checkpoint by an earlier run are not exported again; every exported item
+    is recorded before the next one. The progress is updated per item and its cancel request
+    stops the batch before the next item.
+    Returns the import settings data set of every exported file.
+    '''
+    batch_import = {}
+    for node, file_name in items:
+        if checkpoint is not None and checkpoint.is_done(file_name):
+            import_settings=checkpoint.get_import_settings(file_name)
+            if import_settings is not None:
+                batch_import[file_name]=import_settings
+            if progress is not None:
+                progress.skip()
+            continue
+        if progress is not None:
+            if progress.is_cancelled():
+                sys.stdout.write(f"Batch export cancelled: {progress.get_status()}\n")
+                break
+            progress.start_item()
+
+        import_settings=export_item(node, file_name)
+        if import_settings is not None:
+            batch_import[file_name]=import_settings
+        if checkpoint is not None:
+            checkpoint.record(file_name, import_settings)
+        if progress is not None:
+            progress.finish_item()
+
+    return batch_import
+
+@tracing.traced('procedures.bake_animation')
+def bake_animation(nodes:list, start:int, end:int) -> None:
+    ''' Bakes every keyable attribute of the nodes and their descendants over the frame range. '''
+    mc.bakeResults(nodes, hierarchy='below', time=(start, end), sampleBy=1, simulation=True,
+                   preserveOutsideKeys=True, sparseAnimCurveBake=False, minimizeRotation=True,
+                   disableImplicitControl=True, removeBakedAttributeFromLayer=False, bakeOnOverrideLayer=False)
+
+@tracing.traced('procedures.export_clips_single_bake')
+def export_clips_single_bake(fbx, selection:list, settings:dict, clips:list, folder_name:str,
+                             skeleton_data:dict|None=None, cache=None) -> dict:
+    '''
+    Exports every clip from a single bake of the clips union frame range.
+    Unchanged clips are skipped before baking; only the range of the clips left is baked.
+    The bake is recorded in an undo chunk and undone once every clip is exported, and the bake export
+    setting is restored; each clip file only holds its own frame range as a split animation take.
+    Returns the FBX import settings data set of every exported clip, same as per clip baking.
+    '''
+    clips_import = {}
+
+    # get prefix and suffix text value
+    prefix_name=settings.get('prefix')
+    suffix_name=settings.get('suffix')
+
+    # fingerprint the clips on the original animation: unchanged clips do not pay for the bake
+    pending=[]
+    for clip_name, clip_start, clip_end in clips:
+        clip_file_name=build_file_name(clip_name, extension='.fbx',
+                                       prefix=prefix_name, suffix=suffix_name)
+        import_settings=build_import_settings(settings, importer='FBX', animation_clips=[clip_start, clip_end],
+                                              skeleton_data=skeleton_data)
+        # store folder path value
+        import_settings['Folder Path']=folder_name
+
+        asset_fingerprint=None
+        if cache is not None:
+            fbx.set_file_name(clip_file_name)
+            export_file=fbx.get_export_file()
+            asset_fingerprint=get_asset_fingerprint(export_file, selection, settings, import_settings)
+            if cache.is_unchanged(export_file, asset_fingerprint):
+                sys.stdout.write(f"Skipped unchanged asset: {export_file}\n")
+                continue
+        pending.append((clip_name, clip_start, clip_end, clip_file_name, import_settings, asset_fingerprint))
+    if not pending:
+        return clips_import
+
+    # undo must be enabled to restore the scene after baking (disabled by default in mayapy)
+    undo_state=mc.undoInfo(query=True, state=True)
+    mc.undoInfo(state=True)
+    mc.undoInfo(openChunk=True, chunkName='mtouSingleBake')
+    try:
+        bake_animation(selection, min(clip[1] for clip in pending), max(clip[2] for clip in pending))
+        # clips are exported from the baked curves; do not resample them again
+        fbx.export_bake_anim(value=False)
+
+        for clip_name, clip_start, clip_end, clip_file_name, import_settings, asset_fingerprint in pending:
+            fbx.split_animation_take(clip_name, clip_start, clip_end)
+
+            fbx.set_file_name(clip_file_name)
+            if export_selection(fbx, selection, settings, import_settings, cache=cache,
+                                asset_fingerprint=asset_fingerprint):
+                # store file name value; skipped (unchanged) and failed exports are not imported
+                clips_import[clip_file_name]=import_settings
+    finally:
+        fbx.clear_animation_takes()
+        fbx.export_bake_anim(value=bool(settings.get('bake_anim')))
+        mc.undoInfo(closeChunk=True)
+        # remove the baked curves; restores the original animation.
+        # undone whenever the bake was attempted: a bake failing partway has already edited the scene
+        mc.undo()
+        mc.undoInfo(state=undo_state)
+
+    return clips_import
+
+@tracing.traced('procedures.fbx_export_procedure')
+def fbx_export_procedure(fbx, selection:list, settings:dict, file_name:str, folder_name:str,
+                         clips:list|None=None, skeleton_data:dict|None=None, start_index:int=0,
+                         cache=None, checkpoint=None, progress=None, textures=None,
+                         instance_groups:list|None=None) -> dict:
+    '''
+    Handles the FBX export procedure of the provided selection.
+    The fbx exporter must have its UE project path set prior to calling.
+    Clips are provided as a list of [name, start, end] values.
+    Start index offsets the batch export file numbering of a selection shard.
+    An export cache skips the assets whose fingerprint is unchanged since their last export.
+    Batch exports resume from the checkpoint and report to the progress, if provided (see 'export_batch_items').
+    Instance groups already built for sizing the checkpoint and progress are reused (see 'get_instance_groups').
+    Raises validation.meshValidationError before any export if a selected mesh is invalid (see 'validate_selection').
+    Static meshes exported without animation get LOD sidecar files when 'export_lods' is set (see 'export_lods').
+    A texture cache exports the processed copies of the selection textures (see 'processed_textures').
+    Returns the FBX import settings data set of every exported file.
+    '''
+    fbx_import = {}
+
+    # fail before any file is written if a mesh is invalid
+    validate_selection(selection, settings)
+
+    # store initial playback start & end frame range
+    init_start_frame = mc.playbackOptions(query=True, minTime=True)
+    init_end_frame = mc.playbackOptions(query=True, maxTime=True)
+
+    # get move to origin bool value
+    move_mesh = settings.get('move_to_origin')
+
+    apply_fbx_settings(fbx, settings)
+
+    # get prefix and suffix text value
+    prefix_name=settings.get('prefix')
+    suffix_name=settings.get('suffix')
+
+    if settings.get('unused_jnts'):
+        bind_selected_unused_joints(selection)
+
+    # batch exports write meshes sharing their geometry once, recording every copy as an instance;
+    # instance placements are read before the selection is moved to the origin
+    sources=[]
+    instances={}
+    if instance_groups is None:
+        instance_groups=get_instance_groups(selection, settings)
+    if instance_groups is not None:
+        for source, nodes in instance_groups:
+            sources.append(source)
+            if len(nodes) > 1:
+                transforms=md.get_instance_transforms(source, nodes, at_origin=bool(move_mesh))
+                instances[source]=[{'Name': node.rsplit('|', 1)[-1], 'Transform': transform}
+                                   for node, transform in zip(nodes, transforms)]
+
+    # static meshes are exported with LOD1..LODn sidecar files and their processed textures,
+    # both recorded in their import settings
+    lod_ratios=settings.get('lod_ratios') or FBX_DEFAULT_SETTINGS['lod_ratios']
+    def export_asset(nodes:list, export_file_name:str, import_settings:dict) -> bool:
+        if processed:
+            import_settings['Textures']=get_texture_settings(nodes, processed)
+        lod_shape=get_lod_shape(nodes) if settings.get('export_lods') else None
+        if lod_shape is not None:
+            import_settings['LODs']=get_lod_settings(export_file_name, lod_ratios)
+        if not export_selection(fbx, nodes, settings, import_settings, cache=cache):
+            return False
+        if lod_shape is not None:
+            export_lods(fbx, lod_shape, import_settings['LODs'])
+        return True
+
+    # place the selection at world origin [0,0,0] for every export with one batched edit;
+    # the original placement is restored afterwards, even if an export fails;
+    # file textures point at their processed copies for every export the same way
+    with fbx.origin_offset(selection if move_mesh else []), processed_textures(textures, selection) as processed:
+        if settings.get('batch_export'):
+            def export_item(mesh:str, iter_file_name:str) -> dict|None:
+                # animation export and bake settings are applied once with the compiled settings
+                import_settings=build_import_settings(settings, importer='FBX', skeleton_data=skeleton_data)
+
+                # store folder path value
+                import_settings['Folder Path']=folder_name
+                if mesh in instances:
+                    import_settings['Instances']=instances[mesh]
+                    import_settings['Place Instances']=bool(settings.get('place_instances'))
+
+                fbx.set_file_name(iter_file_name)
+                # skipped (unchanged) and failed exports are not imported
+                if export_asset([mesh], iter_file_name, import_settings):
+                    return import_settings
+                return None
+
+            items=[(mesh, file_name + f"_{iter_val}.fbx")
+                   for iter_val, mesh in enumerate(sources or selection, start=start_index + 1)]
+            fbx_import.update(export_batch_items(items, export_item, checkpoint=checkpoint, progress=progress))
+
+        else:
+            # evaluate if animations will be exported
+            if settings.get('export_anim'):
+                # check created clips and export each one as a separate file
+                if clips and settings.get('bake_anim') and settings.get('single_bake') and len(clips) > 1:
+                    # bake the union range once, then slice every clip out of the bake
+                    fbx_import.update(export_clips_single_bake(fbx, selection, settings, clips, folder_name,
+                                                               skeleton_data=skeleton_data, cache=cache))
+                elif clips:
+                    for clip_name, clip_start, clip_end in clips:
+                        # set the animation range for export
+                        if settings.get('bake_anim'):
+                            fbx.export_bake_anim(value=True, start=clip_start, end=clip_end)
+
+                        clip_file_name=build_file_name(clip_name, extension='.fbx',
+                                                       prefix=prefix_name, suffix=suffix_name)
+                        import_settings=build_import_settings(settings, importer='FBX', animation_clips=[clip_start, clip_end],
+                                                              skeleton_data=skeleton_data)
+                        # store folder path value
+                        import_settings['Folder Path']=folder_name
+
+                        fbx.set_file_name(clip_file_name)
+                        if export_selection(fbx, selection, settings, import_settings, cache=cache):
+                            # store file name value; skipped (unchanged) and failed exports are not imported
+                            fbx_import[clip_file_name]=import_settings
+                else:
+                    # export animations without frame range; bake settings are applied with the compiled settings
+                    export_file_name=build_file_name(file_name, extension='.fbx',
+                                                     prefix=prefix_name, suffix=suffix_name)
+                    import_settings=build_import_settings(settings, importer='FBX', skeleton_data=skeleton_data)
+                    # store folder path value
+                    import_settings['Folder Path']=folder_name
+
+                    fbx.set_file_name(export_file_name)
+                    if export_selection(fbx, selection, settings, import_settings, cache=cache):
+                        # store file name value; skipped (unchanged) and failed exports are not imported
+                        fbx_import[export_file_name]=import_settings
+
+            else:
+                # do export without animation; animation is excluded with the compiled settings
+                export_file_name=build_file_name(file_name, extension='.fbx',
+                                                 prefix=prefix_name, suffix=suffix_name)
+
+                import_settings=build_import_settings(settings, importer='FBX', skeleton_data=skeleton_data)
+                # store folder path value
+                import_settings['Folder Path']=folder_name
+
+                fbx.set_file_name(export_file_name)
+                if export_asset(selection, export_file_name, import_settings):
+                    # store file name value; skipped (unchanged) and failed exports are not imported
+                    fbx_import[export_file_name]=import_settings
+
+    # restore initial playback frame range
+    mc.playbackOptions(edit=True, min=init_start_frame, max=init_end_frame)
+
+    return fbx_import
+
+@tracing.traced('procedures.obj_export_procedure')
+def obj_export_procedure(obj, selection:list, settings:dict, file_name:str, folder_name:str,
+                         start_index:int=0, cache=None, checkpoint=None, progress=None, textures=None) -> dict:
+    '''
+    Handles the OBJ export procedure of the provided selection.
+    The obj exporter must have its UE project path set prior to calling.
+    Start index offsets the batch export file numbering of a selection shard.
+    An export cache skips the assets whose fingerprint is unchanged since their last export.
+    Batch exports resume from the checkpoint and report to the progress, if provided (see 'export_batch_items').
+    A texture cache exports the processed copies of the selection textures (see 'processed_textures').
+    Raises validation.meshValidationError before any export if a selected mesh is invalid (see 'validate_selection').
+    Returns the OBJ import settings data set of every exported file.
+    '''
+    obj_import = {}
+
+    # fail before any file is written if a mesh is invalid
+    validate_selection(selection, settings)
+
+    move_mesh = settings.get('move_to_origin')
+
+    # evaluate the user's settings as bool integers for exporting
+    obj_groups=int(bool(settings.get('groups')))
+    obj_ptgroups=int(bool(settings.get('pt_groups')))
+    obj_materials=int(bool(settings.get('materials')))
+    obj_smoothing=int(bool(settings.get('smoothing')))
+    obj_normals=int(bool(settings.get('normals')))
+
+    # get prefix and suffix text value
+    prefix_name=settings.get('prefix')
+    suffix_name=settings.get('suffix')
+
+    # the native writer applies the axis conversion and origin offset; the scene is left untouched
+    export_kwargs={'groups': obj_groups, 'pt_groups': obj_ptgroups, 'materials': obj_materials,
+                   'smoothing': obj_smoothing, 'normals': obj_normals,
+                   'include_textures': settings.get('imp_textures'), 'move_to_origin': move_mesh}
+
+    # file textures point at their processed copies for every export, restored afterwards
+    with processed_textures(textures, selection) as processed:
+        if settings.get('batch_export'):
+            def export_item(mesh:str, iter_file_name:str) -> dict|None:
+                obj.set_file_name(iter_file_name)
+                import_settings=build_import_settings(settings)
+                # store folder path value
+                import_settings['Folder Path']=folder_name
+                if processed:
+                    import_settings['Textures']=get_texture_settings([mesh], processed)
+
+                # skipped (unchanged) and failed exports are not imported
+                if export_selection(obj, [mesh], settings, import_settings, cache=cache, **export_kwargs):
+                    return import_settings
+                return None
+
+            base_name=build_file_name(file_name, extension='.obj', keep_extension=False,
+                                      prefix=prefix_name, suffix=suffix_name)
+            items=[(mesh, base_name + f"_{iter_val}.obj")
+                   for iter_val, mesh in enumerate(selection, start=start_index + 1)]
+            obj_import.update(export_batch_items(items, export_item, checkpoint=checkpoint, progress=progress))
+
+        else:
+            export_file_name=build_file_name(file_name, extension='.obj',
+                                             prefix=prefix_name, suffix=suffix_name)
+            obj.set_file_name(export_file_name)
+
+            import_settings=build_import_settings(settings)
+            # store folder path value
+            import_settings['Folder Path']=folder_name
+            if processed:
+                import_settings['Textures']=get_texture_settings(selection, processed)
+
+            if export_selection(obj, selection, settings, import_settings, cache=cache, **export_kwargs):
+                # store file name value; skipped (unchanged) and failed exports are not imported
+                obj_import[export_file_name]=import_settings
+
+    return obj_import
+
+@tracing.traced('procedures.gltf_export_procedure')
+def gltf_export_procedure(gltf, selection:list, settings:dict, file_name:str, folder_name:str,
+                          skeleton_data:dict|None=None, start_index:int=0, cache=None,
+                          checkpoint=None, progress=None) -> dict:
+    '''
+    Handles the glTF export procedure of the provided selection.
+    The gltf exporter must have its UE project path set prior to calling.
+    Start index offsets the batch export file numbering of a selection shard.
+    An export cache skips the assets whose fingerprint is unchanged since their last export.
+    Batch exports resume from the checkpoint and report to the progress, if provided (see 'export_batch_items').
+    Raises validation.meshValidationError before any export if a selected mesh is invalid (see 'validate_selection').
+    Returns the GLTF import settings data set of every exported file.
+    '''
+    gltf_import = {}
+
+    # fail before any file is written if a mesh is invalid
+    validate_selection(selection, settings)
+
+    # the native writer applies the origin offset; the scene is left untouched
+    export_kwargs={'skins': bool(settings.get('skins')), 'quantize': bool(settings.get('quantize')),
+                   'reorder': bool(settings.get('reorder')), 'move_to_origin': bool(settings.get('move_to_origin'))}
+
+    # get prefix and suffix text value
+    prefix_name=settings.get('prefix')
+    suffix_name=settings.get('suffix')
+
+    if settings.get('batch_export'):
+        def export_item(mesh:str, iter_file_name:str) -> dict|None:
+            gltf.set_file_name(iter_file_name)
+            import_settings=build_import_settings(settings, importer='GLTF', skeleton_data=skeleton_data)
+            # store folder path value
+            import_settings['Folder Path']=folder_name
+
+            # skipped (unchanged) and failed exports are not imported
+            if export_selection(gltf, [mesh], settings, import_settings, cache=cache, **export_kwargs):
+                return import_settings
+            return None
+
+        base_name=build_file_name(file_name, extension='.glb', keep_extension=False,
+                                  prefix=prefix_name, suffix=suffix_name)
+        items=[(mesh, base_name + f"_{iter_val}.glb")
+               for iter_val, mesh in enumerate(selection, start=start_index + 1)]
+        gltf_import.update(export_batch_items(items, export_item, checkpoint=checkpoint, progress=progress))
+
+    else:
+        export_file_name=build_file_name(file_name, extension='.glb',
+                                         prefix=prefix_name, suffix=suffix_name)
+        gltf.set_file_name(export_file_name)
+
+        import_settings=build_import_settings(settings, importer='GLTF', skeleton_data=skeleton_data)
+        # store folder path value
+        import_settings['Folder Path']=folder_name
+
+        if export_selection(gltf, selection, settings, import_settings, cache=cache, **export_kwargs):
+            # store file name value; skipped (unchanged) and failed exports are not imported
+            gltf_import[export_file_name]=import_settings
+
+    return gltf_import
@@ -0,0 +1,131 @@
+from ..library import datafiles
+from pathlib import Path
+import json
+import os
+
+# Named export settings profiles, shared by the exporter UI and the headless batch exporters.
+# A profile is a JSON file holding an exporter type and settings keyed with the exporter UI element IDs:
+#   {"name": "Characters", "type": "FBX", "settings": {"skins": true, "version": "FBX 2020"}}
+# Profiles are stored in 'Documents/UE/Data/Profiles'; set 'MTOU_PROFILES' to a shared folder
+# to use the same profiles across a team. No Maya module is required to read or compile them.
+
+PROFILE_TYPES = ['FBX', 'OBJ', 'GLTF']
+
+# FBX versions: UI label -> 'FBXExportFileVersion' value
+FBX_VERSIONS = {"FBX 2020": "FBX202000", "FBX 2019": "FBX201900",
+                "FBX 2018": "FBX201800", "FBX 2016/2017": "FBX201600",
+                "FBX 2014/2015": "FBX201400", "FBX 2013": "FBX201300",
+                "FBX 2012": "FBX201200", "FBX 2011": "FBX201100",
+                "FBX 2010": "FBX201000", "FBX 2009": "FBX200900"}
+
+def get_profiles_folder() -> str:
+    ''' Returns the profiles folder: 'MTOU_PROFILES' environment value or 'Documents/UE/Data/Profiles'. '''
+    return os.environ.get('MTOU_PROFILES') or os.path.join(str(Path.home()), 'Documents', 'UE', 'Data', 'Profiles')
+
+def compile_fbx_settings(settings:dict) -> list:
+    '''
+    Compiles FBX export settings into the FBX plugin calls they require: a list of (command, args).
+    Animation calls cover the exclusion or the bake flags; clip frame ranges are set per export.
+    '''
+    version = settings.get('version', 'FBX 2020')
+    if version not in FBX_VERSIONS:
+        raise ValueError(f'FBX version [{version}] not found or non-existent')
+
+    calls = [('FBXExportSmoothingGroups', ('-v', bool(settings.get('smooth_groups')))),
+             ('FBXExportSmoothMesh', ('-v', bool(settings.get('smooth_mesh')))),
+             ('FBXExportTangents', ('-v', bool(settings.get('tangents')))),
+             ('FBXExportTriangulate', ('-v', bool(settings.get('triangulate')))),
+             ('FBXExportSkins', ('-v', bool(settings.get('skins')))),
+             ('FBXExportShapes', ('-v', bool(settings.get('blnd_shapes')))),
+             ('FBXExportEmbeddedTextures', ('-v', bool(settings.get('embed_media')))),
+             ('FBXExportUpAxis', ('y' if settings.get('axis', 'Y-Up') == 'Y-Up' else 'z',)),
+             ('FBXExportInAscii', ('-v', settings.get('fileType') == 'Ascii')),
+             ('FBXExportFileVersion', ('-v', FBX_VERSIONS[version]))]
+
+    if settings.get('export_anim'):
+        bake = bool(settings.get('bake_anim'))
+        calls += [('FBXProperty', ('Export|IncludeGrp|Animation', '-v', 1)),
+                  ('FBXExportBakeComplexAnimation', ('-v', bake)),
+                  ('FBXExportBakeResampleAnimation', ('-v', bake)),
+                  ('FBXExportBakeComplexStep', ('-v', 1))]
+    else:
+        calls += [('FBXExportAnimationOnly', ('-v', False)),
+                  ('FBXExportBakeComplexAnimation', ('-v', False)),
+                  ('FBXProperty', ('Export|IncludeGrp|Animation', '-v', 0))]
+
+    return calls
+
+class exportProfile():
+    '''
+    Named, serializable export settings of an exporter type.
+    FBX profiles are compiled once into their FBX plugin calls.
+    '''
+    def __init__(self, name:str, export_type:str='FBX', settings:dict|None=None):
+        if export_type not in PROFILE_TYPES:
+            raise ValueError(f"Profile type [{export_type}] not available. Available types: {PROFILE_TYPES}")
+        self.name = name
+        self.export_type = export_type
+        self._settings = dict(settings or {})
+        self._calls = None
+
+    def get_settings(self) -> dict:
+        ''' Returns a copy of the profile settings. '''
+        return dict(self._settings)
+
+    def compile(self) -> list:
+        ''' Returns the FBX plugin calls of the profile settings; compiled on first use. '''
+        if self.export_type != 'FBX':
+            return []
+        if self._calls is None:
+            self._calls = compile_fbx_settings(self._settings)
+        return list(self._calls)
+
+    def to_dict(self) -> dict:
+        ''' Returns the serializable profile data set. '''
+        return {'name': self.name, 'type': self.export_type, 'settings': self.get_settings()}
+
+    @classmethod
+    def from_dict(cls, data:dict):
+        ''' Builds a profile from its data set. '''
+        return cls(data['name'], data.get('type', 'FBX'), data.get('settings'))
+
+def get_profile_file(name:str, folder_path:str|None=None) -> str:
+    ''' Returns the file of a profile name; names ending in '.json' are used as file paths. '''
+    if name.endswith('.json'):
+        return name
+    return os.path.join(folder_path or get_profiles_folder(), f'{name}.json')
+
+def save_profile(profile:exportProfile, folder_path:str|None=None) -> str:
+    ''' Saves the profile into the profiles folder; returns the profile file. '''
+    profile_file = get_profile_file(profile.name, folder_path or get_profiles_folder())
+    # shared profile folders are written by several sessions
+    datafiles.save_json(profile_file, profile.to_dict())
+    return profile_file
+
+def load_profile(name:str, folder_path:str|None=None) -> exportProfile:
+    ''' Loads a profile by name (profiles folder) or by file path; raises ValueError if not found. '''
+    profile_file = get_profile_file(name, folder_path)
+    if not os.path.exists(profile_file):
+        raise ValueError(f'Export profile [{name}] not found: {profile_file}')
+
+    with open(profile_file, 'r') as file:
+        return exportProfile.from_dict(json.load(file))
+
+def list_profiles(export_type:str|None=None, folder_path:str|None=None) -> list:
+    ''' Returns the profile names in the profiles folder, optionally of a single exporter type. '''
+    folder_path = folder_path or get_profiles_folder()
+    if not os.path.exists(folder_path):
+        return []
+
+    names = []
+    for file_name in sorted(os.listdir(folder_path)):
+        if not file_name.endswith('.json'):
+            continue
+        try:
+            profile = load_profile(os.path.join(folder_path, file_name))
+        except (OSError, ValueError, KeyError):
+            # skip unreadable profiles
+            continue
+        if export_type is None or profile.export_type == export_type:
+            names.append(file_name[:-len('.json')])
+    return names
@@ -0,0 +1,79 @@
+from ..library import datafiles
+import os
+
+# Cached UE project data written by 'unrealLoader.py' ('Documents/UE/Data/ue_data.json'):
+#   {"Current Project": "<project path>", "Skeletons": {"<skeleton name>": "<package path>"}}
+# The file is parsed once and revalidated with a stat (modification time, size, file ID) on access;
+# the loader replaces it atomically, so every update changes its stat. No Maya module is required.
+
+UE_DATA_FILE_NAME = 'ue_data.json'
+
+class projectData():
+    '''
+    UE project data shared by the exporter UI and the batch exporters.
+    Parsed on first access and again only once the file changes on disk.
+    '''
+    def __init__(self, data_path:str, file_name:str=UE_DATA_FILE_NAME):
+        self._file_path = os.path.join(data_path, file_name)
+        self._stat = None
+        self._data = {}
+        self._skeleton_assets = {}
+
+    def get_file_path(self) -> str:
+        ''' Returns the UE project data file. '''
+        return self._file_path
+
+    def _get_stat(self):
+        ''' Returns the file stat key (modification time, size, file ID); None if the file does not exist. '''
+        try:
+            stat = os.stat(self._file_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def get_data(self) -> dict:
+        ''' Returns the UE project data set; reloaded only if the file changed since the last access. '''
+        stat = self._get_stat()
+        if stat != self._stat:
+            self._load(stat)
+        return self._data
+
+    def _load(self, stat) -> None:
+        ''' Parses the file and prebuilds the skeleton lookup. '''
+        data = {}
+        if stat is not None:
+            try:
+                data = datafiles.load_json(self._file_path, {}) or {}
+            except (OSError, ValueError):
+                # keep the last valid data set; retried on the next access
+                return
+        self._stat = stat
+        self._data = data
+        skeletons = data.get('Skeletons') or {}
+        self._skeleton_assets = {name: f'{path}.{name}' for name, path in skeletons.items()}
+
+    def invalidate(self) -> None:
+        ''' Forces the file to be parsed again on the next access. '''
+        self._stat = None
+
+    def exists(self) -> bool:
+        ''' Returns True if UE project data has been written by the Unreal loader. '''
+        return bool(self.get_data())
+
+    def get_project_path(self) -> str|None:
+        ''' Returns the current UE project path, if any. '''
+        return self.get_data().get('Current Project')
+
+    def get_skeletons(self) -> dict|None:
+        ''' Returns the project skeletons: skeleton name -> package path; None if not available. '''
+        return self.get_data().get('Skeletons')
+
+    def get_skeleton_names(self) -> list:
+        ''' Returns the project skeleton names. '''
+        self.get_data()
+        return list(self._skeleton_assets)
+
+    def get_skeleton_asset(self, name:str) -> str|None:
+        ''' Returns the skeleton asset reference ('<package path>.<name>') of a skeleton name, if any. '''
+        self.get_data()
+        return self._skeleton_assets.get(name)
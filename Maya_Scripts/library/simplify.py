@@ -0,0 +1,297 @@
+import numpy as np
+
+# Mesh simplification library: quadric error metric (QEM) edge collapse over NumPy vertex and triangle arrays.
+# Collapses run in parallel passes: every pass collapses a set of vertex-disjoint edges, each the cheapest edge
+# of both its vertices, skipping collapses that would fold a triangle over. Every step is a vectorized array
+# operation with a fixed order, so results are deterministic. No Maya module is required.
+
+# quadric coefficients of a plane (a, b, c, d), symmetric 4x4 matrix stored as its upper triangle;
+# quadric arrays are (10, N), one contiguous row per coefficient
+QUADRIC_SIZE = 10
+# weight of the boundary edge planes; keeps open borders and UV seams in place
+BOUNDARY_WEIGHT = 100.0
+# share of the vertices a single collapse pass may remove; lower is closer to a sequential collapse order
+PASS_RATIO = 0.25
+# share of the target triangle count a simplification may end above; the last passes only collapse a few edges
+TARGET_TOLERANCE = 0.005
+
+def plane_quadrics(normals:np.ndarray, offsets:np.ndarray, weights:np.ndarray) -> np.ndarray:
+    ''' Returns the (10, N) weighted quadrics of the planes n.p + d = 0 (unit normals). '''
+    a, b, c = normals[:, 0], normals[:, 1], normals[:, 2]
+    d = offsets
+    quadrics = np.stack([a*a, a*b, a*c, a*d, b*b, b*c, b*d, c*c, c*d, d*d])
+    return quadrics * weights
+
+def quadric_error(quadrics:np.ndarray, positions:np.ndarray) -> np.ndarray:
+    ''' Returns the error v^T Q v of every position (3, N) against its quadric (10, N). '''
+    x, y, z = positions
+    q = quadrics
+    error = (x*(q[0]*x + 2*(q[1]*y + q[2]*z + q[3]))
+             + y*(q[4]*y + 2*(q[5]*z + q[6]))
+             + z*(q[7]*z + 2*q[8]) + q[9])
+    return np.maximum(error, 0.0)
+
+def optimal_positions(quadrics:np.ndarray) -> tuple:
+    '''
+    Returns the positions minimizing each quadric (Cramer's rule on its 3x3 system)
+    and a mask of the well conditioned systems; other positions are undefined.
+    '''
+    q = quadrics
+    a11, a12, a13, a22, a23, a33 = q[0], q[1], q[2], q[4], q[5], q[7]
+    b1, b2, b3 = -q[3], -q[6], -q[8]
+    c11 = a22*a33 - a23*a23
+    c12 = a13*a23 - a12*a33
+    c13 = a12*a23 - a13*a22
+    determinant = a11*c11 + a12*c12 + a13*c13
+    scale = np.maximum(np.abs(a11) + np.abs(a22) + np.abs(a33), 1e-30)
+    valid = np.abs(determinant) > 1e-9 * scale**3
+    safe = np.where(valid, determinant, 1.0)
+    c22 = a11*a33 - a13*a13
+    c23 = a12*a13 - a11*a23
+    c33 = a11*a22 - a12*a12
+    positions = np.stack([c11*b1 + c12*b2 + c13*b3,
+                          c12*b1 + c22*b2 + c23*b3,
+                          c13*b1 + c23*b2 + c33*b3]) / safe
+    return positions, valid
+
+def face_normals(points:np.ndarray, triangles:np.ndarray) -> np.ndarray:
+    ''' Returns the (T, 3) unnormalized normals (twice the area) of the triangles. '''
+    # per coordinate gathers; avoids the (T, 3, 3) corner array
+    x, y, z = points.T
+    first, second, third = triangles.T
+    ax, ay, az = x[second] - x[first], y[second] - y[first], z[second] - z[first]
+    bx, by, bz = x[third] - x[first], y[third] - y[first], z[third] - z[first]
+    return np.stack([ay*bz - az*by, az*bx - ax*bz, ax*by - ay*bx], axis=1)
+
+def vertex_quadrics(points:np.ndarray, triangles:np.ndarray, boundary_weight:float=BOUNDARY_WEIGHT) -> np.ndarray:
+    '''
+    Returns the (10, N) quadric of every vertex: the area weighted planes of its triangles,
+    plus heavily weighted planes through its boundary edges, perpendicular to their triangle.
+    '''
+    quadrics = np.zeros((QUADRIC_SIZE, len(points)), dtype=np.float64)
+    normals = face_normals(points, triangles)
+    areas = np.linalg.norm(normals, axis=1)
+    valid = areas > 0.0
+    unit_normals = normals[valid] / areas[valid, None]
+    offsets = -np.einsum('ij,ij->i', unit_normals, points[triangles[valid, 0]])
+    face_quadrics = plane_quadrics(unit_normals, offsets, 0.5 * areas[valid])
+    for corner in range(3):
+        for row in range(QUADRIC_SIZE):
+            quadrics[row] += np.bincount(triangles[valid, corner], face_quadrics[row], minlength=len(points))
+
+    # boundary edges belong to a single triangle
+    edges = np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])
+    edge_faces = np.tile(np.arange(len(triangles)), 3)
+    keys = edge_keys(edges, len(points))
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    boundary = (counts[inverse] == 1) & valid[edge_faces]
+    if np.any(boundary):
+        starts, ends = points[edges[boundary, 0]], points[edges[boundary, 1]]
+        directions = ends - starts
+        planes = np.cross(directions, normals[edge_faces[boundary]])
+        lengths = np.linalg.norm(planes, axis=1)
+        usable = lengths > 0.0
+        planes = planes[usable] / lengths[usable, None]
+        offsets = -np.einsum('ij,ij->i', planes, starts[usable])
+        weights = boundary_weight * np.einsum('ij,ij->i', directions[usable], directions[usable])
+        edge_quadrics = plane_quadrics(planes, offsets, weights)
+        for side in range(2):
+            for row in range(QUADRIC_SIZE):
+                quadrics[row] += np.bincount(edges[boundary][usable, side], edge_quadrics[row], minlength=len(points))
+
+    return quadrics
+
+def edge_keys(edges:np.ndarray, vertex_count:int) -> np.ndarray:
+    ''' Returns an int64 key per undirected edge (E, 2): lowest vertex * vertex count + highest vertex. '''
+    starts, ends = edges[:, 0].astype(np.int64), edges[:, 1].astype(np.int64)
+    return np.minimum(starts, ends) * vertex_count + np.maximum(starts, ends)
+
+def unique_edges(triangles:np.ndarray, vertex_count:int) -> tuple:
+    ''' Returns the (E, 2) undirected edges of the triangles, lowest vertex first, and their sorted keys. '''
+    edges = np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])
+    keys = np.sort(edge_keys(edges, vertex_count))
+    keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])]
+    return np.stack([keys // vertex_count, keys % vertex_count], axis=1), keys
+
+def collapse_candidates(points:np.ndarray, quadrics:np.ndarray, edges:np.ndarray) -> tuple:
+    '''
+    Returns the collapse position (E, 3), cost and interpolation weight (0: first vertex, 1: second) of every edge.
+    Candidates are both end points and the optimal position of the summed quadric, when well conditioned.
+    '''
+    edge_quadrics = quadrics[:, edges[:, 0]] + quadrics[:, edges[:, 1]]
+    starts, ends = points[edges[:, 0]].T, points[edges[:, 1]].T
+
+    start_costs = quadric_error(edge_quadrics, starts)
+    end_costs = quadric_error(edge_quadrics, ends)
+    use_ends = end_costs < start_costs
+    position = np.where(use_ends, ends, starts)
+    cost = np.where(use_ends, end_costs, start_costs)
+    weight = use_ends.astype(np.float64)
+
+    optimal, valid = optimal_positions(edge_quadrics)
+    optimal_costs = quadric_error(edge_quadrics, optimal)
+    use_optimal = valid & (optimal_costs < cost)
+    position = np.where(use_optimal, optimal, position)
+    cost = np.where(use_optimal, optimal_costs, cost)
+    # attributes of the optimal position: projected on the edge
+    directions = ends - starts
+    lengths = np.maximum(np.einsum('ij,ij->j', directions, directions), 1e-30)
+    projected = np.clip(np.einsum('ij,ij->j', optimal - starts, directions) / lengths, 0.0, 1.0)
+    weight = np.where(use_optimal, projected, weight)
+    return position.T, cost, weight
+
+def select_collapses(edges:np.ndarray, costs:np.ndarray, vertex_count:int, limit:int, rounds:int=8) -> np.ndarray:
+    '''
+    Returns the indices of up to limit vertex-disjoint edges to collapse, picked among the cheapest edges.
+    Every round picks the edges that are the cheapest edge of both their free vertices (ties broken
+    by edge order), until the limit or the round count is reached.
+    '''
+    # candidate pool: the cheapest edges, four times the collapses wanted, cheapest first (ties by edge order)
+    pool_size = min(len(edges), 4 * limit)
+    pool = np.arange(len(edges))
+    if pool_size < len(edges):
+        threshold = np.partition(costs, pool_size - 1)[pool_size - 1]
+        pool = np.flatnonzero(costs <= threshold)
+    pool = pool[np.argsort(costs[pool], kind='stable')][:pool_size]
+    ranks = np.arange(len(pool), dtype=np.int64)
+    starts, ends = edges[pool, 0], edges[pool, 1]
+
+    free = np.ones(vertex_count, dtype=bool)
+    selected = []
+    active = np.ones(len(pool), dtype=bool)
+    for _ in range(rounds):
+        active &= free[starts] & free[ends]
+        if not np.any(active):
+            break
+        vertex_ranks = np.full(vertex_count, len(pool), dtype=np.int64)
+        np.minimum.at(vertex_ranks, starts[active], ranks[active])
+        np.minimum.at(vertex_ranks, ends[active], ranks[active])
+        picked = np.flatnonzero(active & (vertex_ranks[starts] == ranks) & (vertex_ranks[ends] == ranks))
+        selected.append(picked)
+        free[starts[picked]] = False
+        free[ends[picked]] = False
+        if sum(len(indices) for indices in selected) >= limit:
+            break
+
+    selected = np.sort(np.concatenate(selected)) if selected else np.zeros(0, dtype=np.int64)
+    return pool[selected[:limit]]
+
+def reject_fold_overs(points:np.ndarray, triangles:np.ndarray, edges:np.ndarray,
+                      positions:np.ndarray) -> np.ndarray:
+    ''' Returns a mask of the collapses (edges, target positions) that keep every triangle facing the same way. '''
+    collapse_ids = np.full(len(points), -1, dtype=np.int64)
+    collapse_ids[edges[:, 0]] = np.arange(len(edges))
+    collapse_ids[edges[:, 1]] = np.arange(len(edges))
+
+    corner_ids = collapse_ids[triangles]
+    moved = np.any(corner_ids >= 0, axis=1)
+    moved_triangles = triangles[moved]
+    corner_ids = corner_ids[moved]
+    # triangles holding a collapsed edge are removed, not folded
+    removed = ((corner_ids[:, 0] >= 0) & ((corner_ids[:, 0] == corner_ids[:, 1]) | (corner_ids[:, 0] == corner_ids[:, 2]))
+               | (corner_ids[:, 1] >= 0) & (corner_ids[:, 1] == corner_ids[:, 2]))
+
+    new_points = points.copy()
+    new_points[edges[:, 0]] = positions
+    new_points[edges[:, 1]] = positions
+    before = face_normals(points, moved_triangles)
+    after = face_normals(new_points, moved_triangles)
+    folded = (np.einsum('ij,ij->i', before, after) <= 0.0) & ~removed
+
+    accepted = np.ones(len(edges), dtype=bool)
+    folded_ids = corner_ids[folded].ravel()
+    accepted[folded_ids[folded_ids >= 0]] = False
+    return accepted
+
+def compact(points:np.ndarray, triangles:np.ndarray, attributes:np.ndarray|None) -> tuple:
+    ''' Drops the vertices no triangle uses; returns the reindexed points, triangles and attributes. '''
+    used = np.zeros(len(points), dtype=bool)
+    used[triangles.ravel()] = True
+    remap = np.cumsum(used) - 1
+    attributes = attributes[used] if attributes is not None else None
+    return points[used], remap[triangles].astype(np.int32), attributes
+
+def collapse_edges(points:np.ndarray, triangles:np.ndarray, attributes:np.ndarray|None, quadrics:np.ndarray,
+                   target_count:int, pass_ratio:float=PASS_RATIO, max_passes:int=200) -> tuple:
+    '''
+    Collapses edges in place on the (points, attributes, quadrics) arrays until about target_count triangles are left.
+    Removed vertices stay in the arrays, unused; returns the remaining (T, 3) triangles.
+    '''
+    vertex_count = len(points)
+    # collapse candidates of the previous pass, by edge key; only edges of changed vertices are evaluated again
+    cached_keys = cached_positions = cached_costs = cached_weights = None
+    changed = np.ones(vertex_count, dtype=bool)
+    for _ in range(max_passes):
+        if len(triangles) <= target_count * (1.0 + TARGET_TOLERANCE):
+            break
+        edges, keys = unique_edges(triangles, vertex_count)
+        stale = changed[edges[:, 0]] | changed[edges[:, 1]]
+        if cached_keys is None:
+            positions, costs, weights = collapse_candidates(points, quadrics, edges)
+        else:
+            # stale edges may be new: their lookup is clipped and overwritten below
+            cached = np.minimum(np.searchsorted(cached_keys, keys), len(cached_keys) - 1)
+            positions, costs, weights = cached_positions[cached], cached_costs[cached], cached_weights[cached]
+            stale = np.flatnonzero(stale)
+            positions[stale], costs[stale], weights[stale] = collapse_candidates(points, quadrics, edges[stale])
+        cached_keys, cached_positions, cached_costs, cached_weights = keys, positions, costs, weights
+        # an interior collapse removes two triangles; a pass collapses at most a share of the vertices
+        limit = max(min((len(triangles) - target_count + 1) // 2, int(len(cached_keys) * pass_ratio / 3)), 1)
+        selected = select_collapses(edges, costs, vertex_count, limit)
+        if not len(selected):
+            break
+        edges, positions, weights = edges[selected], positions[selected], weights[selected]
+        accepted = reject_fold_overs(points, triangles, edges, positions)
+        if not np.any(accepted):
+            break
+        edges, positions, weights = edges[accepted], positions[accepted], weights[accepted]
+
+        # the first vertex of every edge takes the collapsed position; the second one is merged into it
+        kept, merged = edges[:, 0], edges[:, 1]
+        changed = np.zeros(vertex_count, dtype=bool)
+        changed[kept] = True
+        points[kept] = positions
+        if attributes is not None:
+            attributes[kept] = attributes[kept] * (1.0 - weights[:, None]) + attributes[merged] * weights[:, None]
+        quadrics[:, kept] += quadrics[:, merged]
+
+        remap = np.arange(vertex_count)
+        remap[merged] = kept
+        triangles = remap[triangles]
+        degenerate = ((triangles[:, 0] == triangles[:, 1]) | (triangles[:, 1] == triangles[:, 2])
+                      | (triangles[:, 2] == triangles[:, 0]))
+        triangles = triangles[~degenerate]
+
+    return triangles
+
+def simplify(points:np.ndarray, triangles:np.ndarray, target_count:int, attributes:np.ndarray|None=None,
+             boundary_weight:float=BOUNDARY_WEIGHT, pass_ratio:float=PASS_RATIO, max_passes:int=200) -> tuple:
+    '''
+    Simplifies a triangle mesh down to about target_count triangles with quadric error metric edge collapses.
+    Points are (N, 3), triangles (T, 3) vertex indices; per vertex attributes (N, K), e.g. UVs, are interpolated
+    along the collapsed edges. Returns the simplified (points, triangles, attributes).
+    '''
+    return build_lod_chain(points, triangles, [target_count / max(len(triangles), 1)], attributes=attributes,
+                           boundary_weight=boundary_weight, pass_ratio=pass_ratio, max_passes=max_passes)[0]
+
+def build_lod_chain(points:np.ndarray, triangles:np.ndarray, ratios:list, attributes:np.ndarray|None=None,
+                    boundary_weight:float=BOUNDARY_WEIGHT, pass_ratio:float=PASS_RATIO, max_passes:int=200) -> list:
+    '''
+    Returns the LOD1..LODn meshes, as (points, triangles, attributes), at the target triangle ratios of the base mesh,
+    highest ratio first (see 'simplify'). Every LOD carries on simplifying the previous one, with its accumulated
+    quadrics, so the chain costs about one simplification.
+    '''
+    points = np.asarray(points, dtype=np.float64).copy()
+    triangles = np.asarray(triangles, dtype=np.int64)
+    if attributes is not None:
+        attributes = np.asarray(attributes, dtype=np.float64).copy()
+    quadrics = vertex_quadrics(points, triangles, boundary_weight)
+
+    lods = []
+    base_count = len(triangles)
+    for ratio in sorted(ratios, reverse=True):
+        target_count = max(int(base_count * ratio), 1)
+        triangles = collapse_edges(points, triangles, attributes, quadrics, target_count,
+                                   pass_ratio=pass_ratio, max_passes=max_passes)
+        lods.append(compact(points, triangles, attributes))
+    return lods
@@ -0,0 +1,189 @@
+from ..library import datafiles
+from ..library import tracing
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import importlib.util
+import hashlib
+import sys
+import os
+
+# Texture stage: the file textures of the exported shading networks are resized to a power-of-two size
+# within a maximum dimension and converted to the target format, in a process pool, before export.
+# Processed copies are stored in a content addressed cache ('Documents/UE/Data/TextureCache'),
+# named '<source content hash>_<max size>.<format>': unchanged textures are never processed again.
+# The cache index ('textureCache.json') remembers the content hash of every source by its file stat,
+# so unchanged sources are not even read again:
+#   {"<source path>": {"stat": [<modification time ns>, <size>], "hash": "<content hash>"}}
+# Image processing requires Pillow in the Maya Python environment; no Maya module is required.
+
+TEXTURE_CACHE_FOLDER = 'TextureCache'
+TEXTURE_INDEX_FILE_NAME = 'textureCache.json'
+# target format -> file extension
+TEXTURE_FORMATS = {'PNG': '.png', 'TGA': '.tga'}
+# textures processed in the exporter process below this count; a pool is not worth its start up
+POOL_MIN_TEXTURES = 2
+
+def is_available() -> bool:
+    ''' Returns True if Pillow, required to process textures, is installed. '''
+    return importlib.util.find_spec('PIL') is not None
+
+def get_power_of_two_size(width:int, height:int, max_size:int) -> tuple:
+    '''
+    Returns the processed size of a texture: scaled down to fit the maximum dimension (keeping its aspect),
+    then every dimension rounded to the nearest power of two, up to the maximum dimension.
+    '''
+    scale = min(1.0, max_size / max(width, height, 1))
+    size = []
+    for dimension in [width, height]:
+        power = max(int(round(max(dimension * scale, 1.0))).bit_length() - 1, 0)
+        # nearest of the powers of two around the scaled dimension
+        lower = 1 << power
+        nearest = lower * 2 if dimension * scale - lower > lower * 2 - dimension * scale else lower
+        size.append(min(nearest, max_size))
+    return tuple(size)
+
+def hash_file(file_path:str, chunk_size:int=1 << 20) -> str:
+    ''' Returns the content hash of a file, read in chunks. '''
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def process_texture(source:str, folder_path:str, max_size:int, image_format:str) -> tuple:
+    '''
+    Process pool worker: hashes the source texture and writes its processed copy into the cache folder,
+    unless a copy of the same content already exists. Returns the (content hash, processed file).
+    '''
+    content_hash = hash_file(source)
+    output = os.path.join(folder_path, f'{content_hash}_{max_size}{TEXTURE_FORMATS[image_format]}').replace('\\', '/')
+    if os.path.exists(output):
+        return content_hash, output
+
+    from PIL import Image
+    with Image.open(source) as image:
+        image.load()
+        # PNG and TGA hold 8 bit RGB(A) channels
+        if image.mode not in ('RGB', 'RGBA'):
+            has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+        size = get_power_of_two_size(image.width, image.height, max_size)
+        if size != image.size:
+            image = image.resize(size, Image.LANCZOS)
+        # written next to the copy, then renamed: a cached copy is always complete
+        temp_path = f'{output}.{os.getpid()}.tmp'
+        image.save(temp_path, format=image_format)
+    datafiles.replace_file(temp_path, output)
+    return content_hash, output
+
+def get_pool_context():
+    '''
+    Returns the process pool start context: spawned processes, started with mayapy when running
+    inside the Maya application (its executable cannot run Python scripts).
+    '''
+    context = multiprocessing.get_context('spawn')
+    executable_name = os.path.basename(sys.executable).lower()
+    if executable_name.startswith('maya') and not executable_name.startswith('mayapy'):
+        mayapy = os.path.join(os.path.dirname(sys.executable), 'mayapy.exe' if os.name == 'nt' else 'mayapy')
+        if os.path.exists(mayapy):
+            context.set_executable(mayapy)
+    return context
+
+class textureCache():
+    '''
+    Persistent cache of processed textures: source texture -> processed copy, for one target size and format.
+    Textures are processed in parallel; sources whose stat and processed copy are unchanged are not read.
+    '''
+    def __init__(self, data_path:str, max_size:int=2048, image_format:str='PNG', workers:int|None=None):
+        if image_format not in TEXTURE_FORMATS:
+            raise ValueError(f'Texture format [{image_format}] not available. Available formats: {list(TEXTURE_FORMATS)}')
+        self._data_path = data_path
+        self._folder_path = os.path.join(data_path, TEXTURE_CACHE_FOLDER).replace('\\', '/')
+        self._max_size = int(max_size)
+        self._image_format = image_format
+        self._workers = workers
+        self._index = datafiles.load_json(os.path.join(self._folder_path, TEXTURE_INDEX_FILE_NAME), {}) or {}
+        self._updated = {}
+
+    def get_folder_path(self) -> str:
+        ''' Returns the cache folder of the processed copies. '''
+        return self._folder_path
+
+    def get_output_file(self, content_hash:str) -> str:
+        ''' Returns the processed copy of a source content hash. '''
+        return os.path.join(self._folder_path, f'{content_hash}_{self._max_size}'
+                                               f'{TEXTURE_FORMATS[self._image_format]}').replace('\\', '/')
+
+    def _get_stat(self, source:str) -> list|None:
+        ''' Returns the stat key (modification time, size) of a source texture; None if it does not exist. '''
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def get_cached(self, source:str) -> str|None:
+        ''' Returns the processed copy of an unchanged source texture, if any; the source is not read. '''
+        record = self._index.get(source)
+        if not record or record.get('stat') != self._get_stat(source):
+            return None
+        output = self.get_output_file(record['hash'])
+        return output if os.path.exists(output) else None
+
+    def process(self, sources:list) -> dict:
+        '''
+        Processes the source textures not found in the cache, in a process pool when there are several.
+        Returns the processed copy of every source; missing or unreadable sources are left out (exported unchanged).
+        '''
+        processed = {}
+        pending = []
+        for source in dict.fromkeys(sources):
+            output = self.get_cached(source)
+            if output:
+                processed[source] = output
+            elif self._get_stat(source) is not None:
+                pending.append(source)
+        if not pending:
+            return processed
+        if not is_available():
+            sys.stderr.write(f'Pillow is not installed: {len(pending)} texture(s) exported unchanged\n')
+            return processed
+
+        os.makedirs(self._folder_path, exist_ok=True)
+        args = (self._folder_path, self._max_size, self._image_format)
+        with tracing.span('textureCache.process', textures=len(pending)):
+            if len(pending) < POOL_MIN_TEXTURES or self._workers == 1:
+                results = [self._run(process_texture, source, *args) for source in pending]
+            else:
+                workers = min(self._workers or os.cpu_count() or 1, len(pending))
+                with ProcessPoolExecutor(max_workers=workers, mp_context=get_pool_context()) as pool:
+                    futures = [pool.submit(process_texture, source, *args) for source in pending]
+                    results = [self._run(future.result) for future in futures]
+
+        for source, result in zip(pending, results):
+            if result is None:
+                continue
+            content_hash, output = result
+            processed[source] = output
+            self._index[source] = self._updated[source] = {'stat': self._get_stat(source), 'hash': content_hash}
+        return processed
+
+    def _run(self, function, *args) -> tuple|None:
+        ''' Runs a texture job; a failed texture is reported and left out. '''
+        try:
+            return function(*args)
+        except Exception as e:
+            sys.stderr.write(f'Texture processing failed, exported unchanged: {e}\n')
+            return None
+
+    def save(self) -> None:
+        ''' Saves the updated index records, merged with the ones stored by other exporters since loading. '''
+        if not self._updated:
+            return
+        def merge(index:dict) -> dict:
+            index.update(self._updated)
+            return index
+
+        # merged under the file lock; parallel exporters keep each other's records
+        self._index = datafiles.update_json(os.path.join(self._folder_path, TEXTURE_INDEX_FILE_NAME), merge, default={})
+        self._updated = {}
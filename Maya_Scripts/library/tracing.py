@@ -0,0 +1,186 @@
+from pathlib import Path
+import threading
+import atexit
+import uuid
+import json
+import time
+import os
+
+# Lightweight span tracing of the export pipeline, written as a Chrome trace (JSON Array Format).
+# Open the trace file in Perfetto (ui.perfetto.dev) or chrome://tracing.
+# Disabled by default: set 'MTOU_TRACE' to 1 (default trace file) or to a trace file path, or call enable().
+# 'unrealLoader.py' appends its spans to the same file; both sides are correlated by the batch ID
+# of the journaled (or pushed) export batch, so a whole export/import round trip shows on one timeline.
+
+TRACE_FILE_NAME = 'mtouTrace.json'
+BATCH_ID_KEY = 'Batch ID'
+
+def get_default_trace_file() -> str:
+    ''' Returns the trace file shared with the Unreal loader: 'Documents/UE/Data/mtouTrace.json'. '''
+    return os.path.join(str(Path.home()), 'Documents', 'UE', 'Data', TRACE_FILE_NAME)
+
+class traceRecorder():
+    '''
+    Buffers trace events and appends them to the trace file on flush.
+    Timestamps are wall clock microseconds, shared by every process on the machine.
+    The closing bracket of the JSON Array Format is optional, so several processes can append to one file.
+    '''
+    def __init__(self, trace_file:str, process_name:str='Maya'):
+        self._trace_file = trace_file
+        self._process_name = process_name
+        self._pid = os.getpid()
+        self._events = []
+        self._lock = threading.Lock()
+        self._named = False
+
+    def get_trace_file(self) -> str:
+        ''' Returns the trace file the events are appended to. '''
+        return self._trace_file
+
+    def add_event(self, event:dict) -> None:
+        ''' Buffers a trace event of the current process and thread. '''
+        event['pid'] = self._pid
+        event['tid'] = threading.get_ident()
+        with self._lock:
+            self._events.append(event)
+
+    def complete(self, name:str, start:float, duration:float, args:dict|None=None) -> None:
+        ''' Buffers a complete span event; start is a time.time() value, duration in seconds. '''
+        self.add_event({'name': name, 'cat': 'mtou', 'ph': 'X', 'ts': start * 1e6, 'dur': duration * 1e6,
+                        'args': args or {}})
+
+    def flow(self, batch_id:str, start:bool=True) -> None:
+        ''' Buffers a flow start (or end) event linking the export and import spans of a batch. '''
+        self.add_event({'name': 'batch', 'cat': 'mtou', 'ph': 's' if start else 'f', 'bp': 'e',
+                        'id': batch_id, 'ts': time.time() * 1e6})
+
+    def flush(self) -> None:
+        ''' Appends the buffered events to the trace file. '''
+        with self._lock:
+            events, self._events = self._events, []
+        if not events:
+            return
+        if not self._named:
+            events.insert(0, {'name': 'process_name', 'ph': 'M', 'pid': self._pid, 'tid': 0,
+                              'args': {'name': f'{self._process_name} ({self._pid})'}})
+            self._named = True
+
+        trace_path = os.path.dirname(self._trace_file)
+        if trace_path and not os.path.exists(trace_path):
+            os.makedirs(trace_path)
+        text = ''.join(json.dumps(event) + ',\n' for event in events)
+        with open(self._trace_file, 'a') as file:
+            # a new trace file opens the JSON array
+            if file.tell() == 0:
+                text = '[\n' + text
+            file.write(text)
+
+class traceSpan():
+    ''' Context manager recording a complete span; arguments can be added while it is open. '''
+    __slots__ = ('_recorder', '_name', '_args', '_start', '_counter')
+
+    def __init__(self, recorder:traceRecorder, name:str, args:dict):
+        self._recorder = recorder
+        self._name = name
+        self._args = args
+
+    def set(self, **args) -> None:
+        ''' Adds arguments to the span. '''
+        self._args.update(args)
+
+    def __enter__(self):
+        self._start = time.time()
+        self._counter = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self._args['error'] = repr(exc_value)
+        self._recorder.complete(self._name, self._start, time.perf_counter() - self._counter, self._args)
+        return False
+
+class nullSpan():
+    ''' Shared no-op span returned while tracing is disabled. '''
+    __slots__ = ()
+
+    def set(self, **args) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NULL_SPAN = nullSpan()
+
+# active recorder; None while tracing is disabled
+_recorder = None
+
+def enable(trace_file:str|None=None) -> traceRecorder:
+    ''' Enables tracing into the trace file (default: shared data folder); returns the recorder. '''
+    global _recorder
+    trace_file = trace_file or get_default_trace_file()
+    if _recorder is None or _recorder.get_trace_file() != trace_file:
+        disable()
+        _recorder = traceRecorder(trace_file)
+    return _recorder
+
+def disable() -> None:
+    ''' Flushes the buffered events and disables tracing. '''
+    global _recorder
+    if _recorder is not None:
+        _recorder.flush()
+    _recorder = None
+
+def is_enabled() -> bool:
+    ''' Returns True while tracing is enabled. '''
+    return _recorder is not None
+
+def span(name:str, **args):
+    '''
+    Returns a span context manager recording the enclosed block.
+    While tracing is disabled, the shared no-op span is returned.
+    '''
+    if _recorder is None:
+        return _NULL_SPAN
+    return traceSpan(_recorder, name, args)
+
+def traced(name:str|None=None):
+    ''' Decorator: records every call of the decorated function as a span. '''
+    def decorator(function):
+        span_name = name or function.__name__
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return function(*args, **kwargs)
+            with traceSpan(_recorder, span_name, {}):
+                return function(*args, **kwargs)
+        wrapper.__name__ = function.__name__
+        wrapper.__doc__ = function.__doc__
+        return wrapper
+    return decorator
+
+def new_batch_id() -> str:
+    '''
+    Returns a new export batch ID: the import journal batch ID, and 'Batch ID' of pushed data sets.
+    When tracing, the flow from this export to its Unreal import is started.
+    '''
+    batch_id = uuid.uuid4().hex
+    if _recorder is not None:
+        _recorder.flow(batch_id)
+    return batch_id
+
+def flush() -> None:
+    ''' Appends the buffered events to the trace file. '''
+    if _recorder is not None:
+        _recorder.flush()
+
+def enable_from_environment() -> None:
+    ''' Enables tracing when 'MTOU_TRACE' is set: 1 for the default trace file, or a trace file path. '''
+    value = os.environ.get('MTOU_TRACE', '').strip()
+    if not value or value.lower() in ['0', 'false', 'off']:
+        return
+    enable(None if value.lower() in ['1', 'true', 'on'] else value)
+
+enable_from_environment()
+atexit.register(flush)
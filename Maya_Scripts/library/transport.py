@@ -0,0 +1,179 @@
+import threading
+import socket
+import uuid
+import json
+import time
+import os
+
+# Local socket transport between the exporter and 'unrealLoader.py'.
+# Messages are JSON objects, one per line, sent over a localhost TCP connection:
+#   exporter -> loader: {'type': 'export_batch', 'batch_id': str, 'import_data': dict}
+#   loader -> exporter: {'type': 'accepted', 'batch_id': str}
+#   loader -> exporter: {'type': 'import_done', 'batch_id': str, 'results': list, 'duration': float}
+# The JSON file handoff stays the fallback whenever no loader is listening.
+
+DEFAULT_PORT = 52173
+
+def get_port() -> int:
+    ''' Returns the transport port: 'MTOU_PORT' environment value or the default port. '''
+    return int(os.environ.get('MTOU_PORT', DEFAULT_PORT))
+
+def encode_message(message:dict) -> bytes:
+    ''' Encodes a message as a single JSON line. '''
+    return (json.dumps(message) + '\n').encode('utf-8')
+
+def read_messages(sock:socket.socket, buffer:bytearray):
+    ''' Yields every complete message received on the socket; blocks until data arrives. '''
+    while True:
+        data = sock.recv(65536)
+        if not data:
+            return
+        buffer.extend(data)
+        while b'\n' in buffer:
+            line, _, rest = bytes(buffer).partition(b'\n')
+            buffer[:] = rest
+            if line.strip():
+                yield json.loads(line)
+
+class transportClient():
+    '''
+    Exporter side of the transport: pushes export batches to the Unreal loader.
+    Returns None from every call when no loader is listening, so callers keep the file handoff.
+    '''
+    def __init__(self, host:str='127.0.0.1', port:int|None=None, connect_timeout:float=0.25,
+                 accept_timeout:float=0.5):
+        '''
+        Stores the loader address; no connection is opened until a batch is sent.
+        The accept timeout bounds the wait for the 'accepted' reply, which blocks the calling (UI) thread.
+        '''
+        self._address = (host, port or get_port())
+        self._connect_timeout = connect_timeout
+        self._accept_timeout = accept_timeout
+
+    def _connect(self) -> socket.socket|None:
+        ''' Returns a connection to the loader, or None if nothing is listening. '''
+        try:
+            return socket.create_connection(self._address, timeout=self._connect_timeout)
+        except OSError:
+            return None
+
+    def is_server_listening(self) -> bool:
+        ''' Returns True if a loader accepts connections. '''
+        sock = self._connect()
+        if sock is None:
+            return False
+        sock.close()
+        return True
+
+    def send_batch(self, import_data:dict, batch_id:str|None=None, wait:bool=False,
+                   timeout:float=600.0, on_done=None) -> dict|None:
+        '''
+        Pushes an export batch (import settings data set) to the loader.
+        Returns the 'accepted' message, or the 'import_done' message when wait is set.
+        Without wait, on_done is called with the 'import_done' message from a background thread.
+        Only the 'import_done' message is waited for up to the timeout; the batch must be accepted within the accept timeout.
+        Returns None when no loader is listening or the batch was not accepted in time.
+        '''
+        sock = self._connect()
+        if sock is None:
+            return None
+
+        batch_id = batch_id or uuid.uuid4().hex
+        buffer = bytearray()
+        try:
+            # a busy loader not ticking must not freeze the caller: short accept handshake
+            sock.settimeout(self._accept_timeout)
+            sock.sendall(encode_message({'type': 'export_batch', 'batch_id': batch_id, 'import_data': import_data}))
+            messages = read_messages(sock, buffer)
+            accepted = next(messages, None)
+        except (OSError, ValueError):
+            sock.close()
+            return None
+
+        if not accepted or accepted.get('type') != 'accepted':
+            sock.close()
+            return None
+        # the import itself runs for as long as the batch takes
+        sock.settimeout(timeout)
+
+        if wait:
+            try:
+                return self._wait_done(sock, messages)
+            finally:
+                sock.close()
+
+        if on_done:
+            def wait_in_background():
+                try:
+                    done = self._wait_done(sock, messages)
+                finally:
+                    sock.close()
+                if done:
+                    on_done(done)
+            threading.Thread(target=wait_in_background, daemon=True).start()
+        else:
+            sock.close()
+
+        return accepted
+
+    def _wait_done(self, sock:socket.socket, messages) -> dict|None:
+        ''' Waits for the 'import_done' message of the sent batch. '''
+        try:
+            for message in messages:
+                if message.get('type') == 'import_done':
+                    return message
+        except (OSError, ValueError):
+            pass
+        return None
+
+class localServer():
+    '''
+    In-process stand-in for the Unreal loader server, for testing the transport without Unreal.
+    Every received batch is passed to the handler, whose return value is sent back as the results.
+    '''
+    def __init__(self, handler=None, host:str='127.0.0.1', port:int=0):
+        ''' Binds the server; port 0 picks a free port (see get_port). '''
+        self._handler = handler or (lambda import_data: [])
+        self._sock = socket.create_server((host, port))
+        self._thread = None
+        self.batches = []
+
+    def get_port(self) -> int:
+        ''' Returns the port the server listens on. '''
+        return self._sock.getsockname()[1]
+
+    def start(self) -> None:
+        ''' Serves connections on a background thread. '''
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                connection, _ = self._sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(connection,), daemon=True).start()
+
+    def _handle(self, connection:socket.socket) -> None:
+        ''' Acknowledges a batch, runs the handler and replies with its results and duration. '''
+        with connection:
+            try:
+                for message in read_messages(connection, bytearray()):
+                    if message.get('type') != 'export_batch':
+                        continue
+                    batch_id = message.get('batch_id')
+                    self.batches.append(message)
+                    connection.sendall(encode_message({'type': 'accepted', 'batch_id': batch_id}))
+
+                    start_time = time.perf_counter()
+                    results = self._handler(message.get('import_data', {}))
+                    connection.sendall(encode_message({'type': 'import_done', 'batch_id': batch_id,
+                                                       'results': results,
+                                                       'duration': time.perf_counter() - start_time}))
+            except (OSError, ValueError):
+                pass
+
+    def close(self) -> None:
+        ''' Stops accepting connections. '''
+        self._sock.close()
@@ -0,0 +1,172 @@
+import numpy as np
+
+# Pre-export mesh validation: every check is a vectorized pass over the topology and attribute buffers
+# of a mesh (face vertex counts, face-vertex indices, points, per UV set face uv counts), read once per mesh.
+# Checks return the indices of the offending components; a mesh with any is reported before a file is written.
+# Only 'validate_shapes' requires Maya.
+
+# Unreal meshes hold up to 8 UV channels
+MAX_UV_SETS = 8
+# faces with an area below this share of the squared mesh bounding box diagonal are zero-area
+AREA_TOLERANCE = 1e-12
+# component indices listed per issue in a report
+REPORT_SAMPLE = 8
+
+# check name -> (report label, component name)
+CHECKS = {'nan_vertices': ('vertices with a NaN or infinite position', 'vtx'),
+          'non_manifold_edges': ('non-manifold edges (shared by more than two faces)', 'edge'),
+          'lamina_faces': ('lamina faces (sharing all their vertices with another face)', 'f'),
+          'zero_area_faces': ('zero-area faces', 'f'),
+          'missing_uvs': ('faces without UVs', 'f'),
+          'uv_sets': (f'UV sets over the limit of {MAX_UV_SETS}', 'uvSet')}
+
+class meshValidationError(ValueError):
+    ''' Raised before exporting meshes that failed validation; holds the per mesh reports (see 'validate_shapes'). '''
+    def __init__(self, reports:list):
+        self.reports = reports
+        super().__init__(format_reports(reports))
+
+def get_face_ids(counts:np.ndarray) -> np.ndarray:
+    ''' Returns the face index of every face-vertex. '''
+    return np.repeat(np.arange(len(counts)), counts)
+
+def get_next_face_vertices(counts:np.ndarray) -> np.ndarray:
+    ''' Returns the next face-vertex of every face-vertex, around its face. '''
+    offsets = np.cumsum(counts) - counts
+    following = np.arange(1, int(counts.sum()) + 1)
+    # the last face-vertex of a face closes it
+    following[offsets[counts > 0] + counts[counts > 0] - 1] = offsets[counts > 0]
+    return following
+
+def get_face_edges(counts:np.ndarray, connects:np.ndarray) -> np.ndarray:
+    ''' Returns the (C, 2) directed edge of every face-vertex: the vertex and the next vertex of its face. '''
+    return np.stack([connects, connects[get_next_face_vertices(counts)]], axis=1)
+
+def check_nan_vertices(points:np.ndarray) -> np.ndarray:
+    ''' Returns the vertices holding a NaN or infinite coordinate. '''
+    return np.flatnonzero(~np.isfinite(points).all(axis=1))
+
+def check_non_manifold_edges(counts:np.ndarray, connects:np.ndarray) -> np.ndarray:
+    ''' Returns the (E, 2) vertex pairs of the edges shared by more than two faces. '''
+    if not len(connects):
+        return np.zeros((0, 2), dtype=np.int64)
+    edges = get_face_edges(counts, connects).astype(np.int64)
+    # undirected edge key: lowest vertex * vertex count + highest vertex
+    vertex_count = int(connects.max()) + 1
+    keys = edges.min(axis=1) * vertex_count + edges.max(axis=1)
+    # in sorted order, a key equal to the key two places further is used by three faces or more
+    keys = np.sort(keys)
+    shared = np.unique(keys[:-2][keys[:-2] == keys[2:]])
+    return np.stack([shared // vertex_count, shared % vertex_count], axis=1)
+
+def hash_vertices(vertices:np.ndarray) -> np.ndarray:
+    ''' Returns a well mixed uint64 hash of every vertex index (splitmix64 finalizer). '''
+    hashes = (vertices.astype(np.uint64) + np.uint64(1)) * np.uint64(0x9E3779B97F4A7C15)
+    hashes ^= hashes >> np.uint64(30)
+    hashes *= np.uint64(0xBF58476D1CE4E5B9)
+    hashes ^= hashes >> np.uint64(27)
+    hashes *= np.uint64(0x94D049BB133111EB)
+    return hashes ^ (hashes >> np.uint64(31))
+
+def check_lamina_faces(counts:np.ndarray, connects:np.ndarray) -> np.ndarray:
+    ''' Returns the faces using the same vertices as another face. '''
+    if not len(connects):
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.cumsum(counts) - counts
+    # order independent face hash: the sum of its vertex hashes; only faces sharing a hash are compared
+    face_hashes = np.add.reduceat(hash_vertices(connects), offsets[counts > 0])
+    unique_hashes, inverse, hash_counts = np.unique(face_hashes, return_inverse=True, return_counts=True)
+    candidates = np.flatnonzero(counts > 0)[hash_counts[inverse.reshape(-1)] > 1]
+
+    lamina = np.zeros(len(counts), dtype=bool)
+    # faces can only match faces of the same size: one pass per face size
+    for size in np.unique(counts[candidates]):
+        faces = candidates[counts[candidates] == size]
+        if len(faces) < 2:
+            continue
+        rows = np.sort(connects[offsets[faces, None] + np.arange(size)], axis=1)
+        _, inverse, row_counts = np.unique(rows, axis=0, return_inverse=True, return_counts=True)
+        lamina[faces] = row_counts[inverse.reshape(-1)] > 1
+    return np.flatnonzero(lamina)
+
+def check_zero_area_faces(points:np.ndarray, counts:np.ndarray, connects:np.ndarray) -> np.ndarray:
+    ''' Returns the faces whose area is zero, relative to the mesh size; faces with invalid points are left out. '''
+    finite = np.isfinite(points).all(axis=1)
+    if not np.any(finite):
+        return np.zeros(0, dtype=np.int64)
+    scale = np.linalg.norm(points[finite].max(axis=0) - points[finite].min(axis=0))
+
+    # area vector of every polygon: half the sum of its edge cross products, relative to its first vertex
+    face_ids = get_face_ids(counts)
+    offsets = np.cumsum(counts) - counts
+    first = connects[offsets][face_ids]
+    x, y, z = (coordinates[connects] - coordinates[first] for coordinates in points.T)
+    following = get_next_face_vertices(counts)
+    next_x, next_y, next_z = x[following], y[following], z[following]
+    crosses = [y*next_z - z*next_y, z*next_x - x*next_z, x*next_y - y*next_x]
+    area_vectors = np.stack([np.bincount(face_ids, cross, minlength=len(counts)) for cross in crosses], axis=1)
+    areas = 0.5 * np.linalg.norm(area_vectors, axis=1)
+    return np.flatnonzero(areas <= AREA_TOLERANCE * max(scale * scale, 1e-30))
+
+def check_missing_uvs(counts:np.ndarray, uv_counts:dict) -> np.ndarray:
+    ''' Returns the faces not fully mapped in the first UV set; every face if the mesh has no UV set. '''
+    if not uv_counts:
+        return np.arange(len(counts))
+    first_uv_counts = next(iter(uv_counts.values()))
+    return np.flatnonzero(first_uv_counts != counts)
+
+def check_uv_sets(uv_counts:dict) -> list:
+    ''' Returns the UV sets over the Unreal UV channel limit. '''
+    return list(uv_counts)[MAX_UV_SETS:]
+
+def validate_mesh(points:np.ndarray, counts:np.ndarray, connects:np.ndarray, uv_counts:dict) -> dict:
+    '''
+    Runs every check on the mesh buffers: points (N, 3), face vertex counts, face-vertex indices
+    and the face uv counts of every UV set, in UV set order.
+    Returns the issues found: check name -> offending components.
+    '''
+    issues = {'nan_vertices': check_nan_vertices(points),
+              'non_manifold_edges': check_non_manifold_edges(counts, connects),
+              'lamina_faces': check_lamina_faces(counts, connects),
+              'zero_area_faces': check_zero_area_faces(points, counts, connects),
+              'missing_uvs': check_missing_uvs(counts, uv_counts),
+              'uv_sets': check_uv_sets(uv_counts)}
+    return {name: components for name, components in issues.items() if len(components)}
+
+def validate_shapes(nodes:list) -> list:
+    '''
+    Validates every mesh shape found under the nodes.
+    Returns the report of every invalid mesh: {'mesh': shape full path, 'issues': check name -> offending components}.
+    '''
+    from ..library import meshdata
+    import maya.api.OpenMaya as om
+
+    reports = []
+    for shape_path in meshdata.get_mesh_shapes(nodes):
+        mesh_fn = om.MFnMesh(shape_path)
+        counts, connects = meshdata.get_topology(mesh_fn)
+        uv_counts = meshdata.get_uv_counts(mesh_fn)
+        issues = validate_mesh(meshdata.get_points(mesh_fn), counts, connects, uv_counts)
+        if issues:
+            reports.append({'mesh': shape_path.fullPathName(), 'issues': issues})
+    return reports
+
+def format_component(component, component_name:str) -> str:
+    ''' Returns the Maya component name of an offending component; edges are listed by their vertices. '''
+    if component_name == 'edge':
+        return f'vtx[{component[0]}]-vtx[{component[1]}]'
+    if component_name == 'uvSet':
+        return str(component)
+    return f'{component_name}[{component}]'
+
+def format_reports(reports:list) -> str:
+    ''' Returns the readable validation report: one line per mesh issue, with a sample of its components. '''
+    lines = [f'{len(reports)} mesh(es) failed validation; nothing was exported:']
+    for report in reports:
+        lines.append(f"  {report['mesh']}")
+        for name, components in report['issues'].items():
+            label, component_name = CHECKS[name]
+            sample = ', '.join(format_component(component, component_name) for component in components[:REPORT_SAMPLE])
+            more = ', ...' if len(components) > REPORT_SAMPLE else ''
+            lines.append(f'    {len(components)} {label}: {sample}{more}')
+    return '\n'.join(lines)
@@ -0,0 +1,27 @@
+import maya.cmds as mc
+import importlib
+
+# Plugin menu; the only module imported at plugin load.
+# The exporter UI and its library modules are imported the first time the menu item is used.
+
+MENU_ID = 'UExporterMenu'
+
+def run_mtou(*args):
+    ''' Load Maya to Unreal Exporter UI and dependant modules. '''
+    print('Run mtou module')
+
+    mtouExporter = importlib.import_module('.mtouExporter', __package__)
+    mtouExporter.mtouExporterUI()
+
+def delete_menu():
+    ''' Deletes the plugin menu from the main Maya Window. '''
+    if mc.menu(MENU_ID, exists=True):
+        mc.deleteUI(MENU_ID, menu=True)
+
+def build_menu():
+    ''' Builds the plugin menu in the main Maya Window; replaces any previous one. '''
+    delete_menu()
+
+    main_menu = mc.menu(MENU_ID, label='Exporter Tools', parent='MayaWindow', tearOff=True)
+
+    mc.menuItem(label='MayaToUnreal', command=run_mtou, parent=main_menu)
@@ -1,9 +1,20 @@
+from contextlib import contextmanager
 import maya.cmds as mc
+import maya.utils
 import os
 import sys
 # import package dependent modules
 from .library import modules as md
 from .library import exporter
+from .library import procedures
+from .library import fingerprint
+from .library import checkpoint
+from .library import journal
+from .library import profiles
+from .library import projectdata
+from .library import transport
+from .library import tracing
+from .library import validation
 
 class clipsElementsUI():
     ''' Class to handle animation clip UI elements inside the main exporter UI.'''
@@ -194,12 +205,17 @@ class mtouExporterUI():
 
         # locate the user's home\Documents path
         self.folder_path = os.path.join(md.get_documents_folder(), 'UE', 'Data')
+        # UE project data, parsed once and reloaded only when the Unreal loader updates it
+        self.ue_data = projectdata.projectData(self.folder_path)
         
         # import exporter classes
         self.fbx = exporter.fbx()
         self.obj = exporter.obj()
+        self.gltf = exporter.gltf()
         # import animation clips settings UI
         self.clipsUI = clipsElementsUI()
+        # connect to the Unreal loader transport, when listening
+        self.transport = transport.transportClient()
 
         self.window_ID = "EXPORTER"
         self.title = "Maya to Unreal Exporter v0.3"
@@ -217,7 +233,11 @@ class mtouExporterUI():
 
         self.windowDisplay = mc.window(self.window_ID, 
                                        title=self.title, 
-                                       widthHeight=self.size, sizeable=True)
+                                       widthHeight=self.size, sizeable=True, menuBar=True)
+
+        # export profiles menu, rebuilt from the profiles folder whenever it opens
+        self.profiles_menu = mc.menu(label='Profiles', parent=self.windowDisplay,
+                                     postMenuCommand=self.build_profiles_menu)
 
         # form layout to allow precision in handling UI elements 
         self.main_layout = mc.formLayout(parent=self.windowDisplay)
@@ -227,6 +247,7 @@ class mtouExporterUI():
                                             changeCommand=self.change_export_type)
         mc.menuItem(label="FBX")
         mc.menuItem(label="OBJ")
+        mc.menuItem(label="GLTF")
 
         # create fields to input the file and folder name of the exported asset  
         self.filename_field = mc.textFieldGrp('filename_field', label='File Name:', 
@@ -347,12 +368,17 @@ class mtouExporterUI():
         # build check box elements for export settings 
         self.create_or_show_checkbox('smooth_groups', 'maya', label='Smoothing Groups', position='left', checkerValue=True)
         self.create_or_show_checkbox('smooth_mesh', 'maya', label='Smooth Mesh', position='left', checkerValue=False)
+        self.create_or_show_checkbox('skip_unchanged', 'maya', label='Skip Unchanged', position='left', checkerValue=True)
+        self.create_or_show_checkbox('process_textures', 'maya', label='Resize Textures', position='left', checkerValue=False)
         self.create_or_show_checkbox('tangents', 'maya', label='Tangents and Binormals', position='centerLeft', checkerValue=True)
         self.create_or_show_checkbox('triangulate', 'maya', label='Triangulate', position='centerLeft', checkerValue=False)
+        self.create_or_show_checkbox('instance_meshes', 'maya', label='Instance Duplicates', position='centerLeft', checkerValue=True)
         self.create_or_show_checkbox('move_to_origin', 'maya', label='Move to Origin', position='centerRight', checkerValue=True)
         self.create_or_show_checkbox('embed_media', 'maya', label='Embed Textures', position='centerRight', checkerValue=True)
+        self.create_or_show_checkbox('validate_meshes', 'maya', label='Validate Meshes', position='centerRight', checkerValue=True)
         self.create_or_show_checkbox('skins', 'maya', label='Skinning', position='right', checkerValue=True)
         self.create_or_show_checkbox('blnd_shapes', 'maya', label='Blend Shapes', position='right', checkerValue=True)
+        self.create_or_show_checkbox('export_lods', 'maya', label='Export LODs', position='right', checkerValue=False)
 
         if mc.control('middle_separator_01', exists=True):
             mc.control('middle_separator_01', edit=True, visible=True)
@@ -403,11 +429,13 @@ class mtouExporterUI():
         self.create_or_show_menu('axis', 'maya', label='Up Axis:', items=['Y-Up', 'Z-Up'])
         self.create_or_show_menu('fileType', 'maya', label='FBX File Type:', items=['Binary', 'Ascii'])
         self.create_or_show_menu('version', 'maya', label='FBX Version:', items=self.fbx_versions)
+        self.build_texture_menus()
 
         # build check box elements for import settings 
         self.create_or_show_checkbox('imp_materials', 'unreal', label='Include Materials', position='centerLeft', checkerValue=True)
         self.create_or_show_checkbox('imp_textures', 'unreal', label='Include Textures', position='centerLeft', checkerValue=True)
         self.create_or_show_checkbox('use_source_name', 'unreal', label='Use Source Name', position='left', checkerValue=False)
+        self.create_or_show_checkbox('place_instances', 'unreal', label='Place Duplicates in Level', position='left', checkerValue=False)
         self.create_or_show_checkbox('imp_static_mesh', 'unreal', label='Import Static Mesh', position='right', checkerValue=True)
         self.create_or_show_checkbox('imp_skeletal_mesh', 'unreal', label='Import Skeletal Mesh', position='right', checkerValue=True)
 
@@ -433,11 +461,7 @@ class mtouExporterUI():
 
         # get skeleton data from current UE project
         # build skeleton selection menu
-        skeletons = ['None']
-        skeletons_data = self.get_ue_data('skeletons')
-        if skeletons_data:
-            for skeleton in skeletons_data:
-                skeletons.append(skeleton)
+        skeletons = ['None'] + self.ue_data.get_skeleton_names()
         self.create_or_show_menu('skeleton', label='Select Skeleton:', layoutID='imp_anim_column',
                                  items=skeletons, separator=False, )
 
@@ -469,11 +493,15 @@ class mtouExporterUI():
         mc.control('batch_export', edit=True, en=True)
         # build export settings checker objects
         self.create_or_show_checkbox('move_to_origin', 'maya', label='Move to Origin', position='left', checkerValue=True)
+        self.create_or_show_checkbox('skip_unchanged', 'maya', label='Skip Unchanged', position='left', checkerValue=True)
         self.create_or_show_checkbox('groups', 'maya', label='Groups', position='centerLeft', checkerValue=True)
         self.create_or_show_checkbox('pt_groups', 'maya', label='Point Groups', position='centerLeft', checkerValue=True)
         self.create_or_show_checkbox('materials', 'maya', label='Materials', position='centerRight', checkerValue=True)
+        self.create_or_show_checkbox('validate_meshes', 'maya', label='Validate Meshes', position='centerRight', checkerValue=True)
         self.create_or_show_checkbox('smoothing', 'maya', label='Smoothing', position='right', checkerValue=True)
         self.create_or_show_checkbox('normals', 'maya', label='Normals', position='right', checkerValue=True)
+        self.create_or_show_checkbox('process_textures', 'maya', label='Resize Textures', position='left', checkerValue=False)
+        self.build_texture_menus()
 
         # build import settings checker objects
         self.create_or_show_checkbox('imp_materials', 'unreal', label='Include Materials', position='left', checkerValue=True)
@@ -482,6 +510,35 @@ class mtouExporterUI():
         self.create_or_show_checkbox('imp_skeletal_mesh', 'unreal', label='Import Skeletal Mesh', position='centerLeft', checkerValue=True)
         self.create_or_show_checkbox('use_source_name', 'unreal', label='Import Asset with File Name', position='right', checkerValue=True)
 
+    def build_gltf_ui_settings(self):
+        ''' Handles the UI elements of the glTF export and import settings. '''
+        # re-enable exporter UI elements if they were disabled by clips UI
+        mc.control(self.filename_field, edit=True, vis=True)
+        mc.control('batch_export', edit=True, en=True)
+        # build export settings checker objects
+        self.create_or_show_checkbox('move_to_origin', 'maya', label='Move to Origin', position='left', checkerValue=True)
+        self.create_or_show_checkbox('skip_unchanged', 'maya', label='Skip Unchanged', position='left', checkerValue=True)
+        self.create_or_show_checkbox('skins', 'maya', label='Skinning', position='centerLeft', checkerValue=True)
+        self.create_or_show_checkbox('quantize', 'maya', label='Quantize Normals/UVs', position='centerRight', checkerValue=False)
+        self.create_or_show_checkbox('validate_meshes', 'maya', label='Validate Meshes', position='centerRight', checkerValue=True)
+        self.create_or_show_checkbox('reorder', 'maya', label='Optimize Vertex Order', position='right', checkerValue=True)
+
+        # build import settings checker objects
+        self.create_or_show_checkbox('imp_materials', 'unreal', label='Include Materials', position='left', checkerValue=True)
+        self.create_or_show_checkbox('imp_textures', 'unreal', label='Include Textures', position='centerLeft', checkerValue=False)
+        self.create_or_show_checkbox('imp_static_mesh', 'unreal', label='Import Static Mesh', position='left', checkerValue=True)
+        self.create_or_show_checkbox('imp_skeletal_mesh', 'unreal', label='Import Skeletal Mesh', position='centerLeft', checkerValue=True)
+        self.create_or_show_checkbox('use_source_name', 'unreal', label='Use Source Name', position='right', checkerValue=False)
+
+        # build skeleton selection menu from current UE project skeletons data
+        skeletons = ['None'] + self.ue_data.get_skeleton_names()
+        self.create_or_show_menu('skeleton', 'unreal', label='Select Skeleton:', items=skeletons, separator=False)
+
+    def build_texture_menus(self):
+        ''' Builds the option menus of the texture processing stage: maximum texture size and target format. '''
+        self.create_or_show_menu('texture_max_size', 'maya', label='Max Texture Size:', items=['2048', '4096', '1024', '512'])
+        self.create_or_show_menu('texture_format', 'maya', label='Texture Format:', items=['PNG', 'TGA'])
+
     def create_or_show_checkbox(self, checkerID:str, layoutID:str, position:str|None=None, label:str="checkerName", 
                                 checkerValue:bool=False, separator:bool=True, onCommand=None, offCommand=None):
         '''
@@ -593,9 +650,12 @@ class mtouExporterUI():
         # build bake anim checkbox and anim clips layout
         self.create_or_show_checkbox('bake_anim', self.maya_rowColumn, label='Bake Animation', checkerValue=False,
                                      separator=False)
+        self.create_or_show_checkbox('single_bake', self.maya_rowColumn, label='Bake Clips Once', checkerValue=True,
+                                     separator=False)
         self.anim_build_state('maya', 'export_anim', 'maya_anim_frame', state=state)
-        # show or hide bake anim checkbox element depending on state
+        # show or hide bake anim checkbox elements depending on state
         mc.control('bake_anim', edit=True, vis=state)
+        mc.control('single_bake', edit=True, vis=state)
 
     def anim_build_state(self, section:str, checkerID:str, elementID:str, state:bool=False):
         ''' Builds or unhides animation related UI elements depending on the requested section. '''
@@ -648,6 +708,14 @@ class mtouExporterUI():
             self.build_obj_ui_settings()
             
             mc.button(self.export_button, edit=True, command=self.do_OBJ_export)
+
+        elif export_type=='GLTF':
+            mc.textFieldGrp(self.filename_field, edit=True, placeholderText='Name your .glb file')
+            self.disable_ui_elements()
+
+            self.build_gltf_ui_settings()
+
+            mc.button(self.export_button, edit=True, command=self.do_GLTF_export)
         
         elif export_type=='FBX':
             mc.textFieldGrp(self.filename_field, edit=True, placeholderText='Name your .fbx file')
@@ -658,27 +726,21 @@ class mtouExporterUI():
             mc.button(self.export_button, edit=True, command=self.do_FBX_export)
 
     def get_ue_data(self, dataID:str='path'):
-        ''' Loads and returns UE project data. '''
+        ''' Returns cached UE project data; the data file is parsed again only once it changes. '''
         available_IDs = ['path', 'skeletons']
         if dataID not in available_IDs:
             mc.warning(f"Data ID: '{dataID}' not available. Available IDs: {available_IDs}")
-        
-        # verify UE project data exists
-        ue_data_exists = md.path_exists(os.path.join(self.folder_path, 'ue_data.json'))
+
         # return None if no UE project data has been loaded, else return requested data
-        if not ue_data_exists:
-            return None
-        else:
-            ue_dict = md.load_data(self.folder_path, 'ue_data.json')
-            if dataID=='path':
-                ue_data = ue_dict.get("Current Project")
-            elif dataID=='skeletons':
-                ue_data = ue_dict.get("Skeletons")
-                
-            return ue_data
+        if dataID=='path':
+            return self.ue_data.get_project_path()
+        elif dataID=='skeletons':
+            return self.ue_data.get_skeletons()
+        return None
 
     def reload_ue_data(self, *args):
         ''' Retrieves the most recent UE project path and skeletons data. '''
+        self.ue_data.invalidate()
         ue_path = self.get_ue_data()
 
         # clear previous skeleton menu items
@@ -692,11 +754,9 @@ class mtouExporterUI():
             return
         else:
             self.print_UE_project_path()
-            skeletons_data = self.get_ue_data('skeletons')
-            if skeletons_data:
-                # repopulate skeleton menu items
-                for skeleton in skeletons_data:
-                    mc.menuItem(label=skeleton, parent='skeleton')
+            # repopulate skeleton menu items
+            for skeleton in self.ue_data.get_skeleton_names():
+                mc.menuItem(label=skeleton, parent='skeleton')
 
     def print_UE_project_path(self):
         ''' Logs the currently active UE project path. '''
@@ -706,6 +766,115 @@ class mtouExporterUI():
         # print and write path to script editor and command line 
         sys.stdout.write(f"Current UE Project: {ue_project_path}\n")
 
+    def get_export_settings(self) -> dict:
+        ''' Returns the user's exporter settings: check box values, menu values and name affixes. '''
+        settings=dict(self.checkerSettings)
+        # store the option menu values of the current exporter type
+        for menuID in ['axis', 'fileType', 'version', 'skeleton', 'texture_max_size', 'texture_format']:
+            if menuID in self.menuSettings and mc.optionMenu(self.menuSettings[menuID], query=True, exists=True):
+                settings[menuID]=mc.optionMenu(self.menuSettings[menuID], query=True, value=True)
+        # get prefix and suffix text value
+        settings['prefix']=mc.textFieldGrp(self.prefix_field, query=True, text=True)
+        settings['suffix']=mc.textFieldGrp(self.suffix_field, query=True, text=True)
+
+        return settings
+
+    def build_profiles_menu(self, *args):
+        ''' Rebuilds the profiles menu: save action and the saved profiles of the current exporter type. '''
+        mc.menu(self.profiles_menu, edit=True, deleteAllItems=True)
+        export_type = mc.optionMenu(self.exportType_menu, query=True, value=True)
+
+        mc.menuItem(label='Save Settings as Profile...', command=self.save_export_profile, parent=self.profiles_menu)
+        mc.menuItem(divider=True, parent=self.profiles_menu)
+
+        profile_names = profiles.list_profiles(export_type)
+        if not profile_names:
+            mc.menuItem(label=f'No {export_type} Profiles', enable=False, parent=self.profiles_menu)
+        for profile_name in profile_names:
+            mc.menuItem(label=profile_name, parent=self.profiles_menu,
+                        command=lambda arg, profile_name=profile_name: self.load_export_profile(profile_name))
+
+    def save_export_profile(self, *args):
+        ''' Saves the current exporter settings as a named profile of the current exporter type. '''
+        result = mc.promptDialog(title='Save Export Profile', message='Profile Name:',
+                                 button=['Save', 'Cancel'], defaultButton='Save',
+                                 cancelButton='Cancel', dismissString='Cancel')
+        if result != 'Save':
+            return
+        profile_name = mc.promptDialog(query=True, text=True).strip()
+        if not profile_name:
+            mc.warning('Please provide a name for the export profile.')
+            return
+
+        export_type = mc.optionMenu(self.exportType_menu, query=True, value=True)
+        profile_file = profiles.save_profile(profiles.exportProfile(profile_name, export_type, self.get_export_settings()))
+        sys.stdout.write(f"Export Profile Saved: {profile_file}\n")
+
+    def load_export_profile(self, profile_name:str):
+        ''' Loads a saved profile into the exporter settings UI elements. '''
+        try:
+            profile = profiles.load_profile(profile_name)
+        except ValueError as e:
+            mc.warning(str(e))
+            return
+        export_type = mc.optionMenu(self.exportType_menu, query=True, value=True)
+        if profile.export_type != export_type:
+            mc.warning(f"Profile '{profile_name}' is a {profile.export_type} profile, switch the exporter type to load it.")
+            return
+
+        # animation states build their dependant elements first
+        settings = sorted(profile.get_settings().items(), key=lambda item: item[0] not in ['export_anim', 'imp_anim'])
+        for elementID, value in settings:
+            if elementID in ['prefix', 'suffix']:
+                field = self.prefix_field if elementID == 'prefix' else self.suffix_field
+                mc.textFieldGrp(field, edit=True, text=value or '')
+            elif elementID in self.menuSettings and mc.optionMenu(self.menuSettings[elementID], query=True, exists=True):
+                menu_items = mc.optionMenu(self.menuSettings[elementID], query=True, itemListLong=True) or []
+                if value in [mc.menuItem(item, query=True, label=True) for item in menu_items]:
+                    mc.optionMenu(self.menuSettings[elementID], edit=True, value=value)
+            elif elementID in self.checkerSettings and mc.control(elementID, exists=True):
+                mc.checkBox(elementID, edit=True, value=bool(value))
+                if elementID == 'export_anim':
+                    self.export_anim_state(state=bool(value))
+                elif elementID == 'imp_anim':
+                    self.anim_build_state('unreal', elementID, 'imp_only_anims', state=bool(value))
+                else:
+                    self.switch_bool_state(elementID, state=bool(value))
+
+        sys.stdout.write(f"Export Profile Loaded: {profile_name}\n")
+
+    def get_clips_values(self) -> list|None:
+        ''' 
+        Returns the created animation clips as a list of [name, start, end] values.
+        Returns None if any clip has no file name.
+        '''
+        clips=[]
+        clips_data=self.clipsUI.get_clips_created()
+        if not clips_data:
+            return clips
+
+        for clip in clips_data:
+            clips_value=[]
+            # get values from each clip element and store them 
+            for clip_element in clips_data.get(clip):
+                if 'Add' in clip_element:
+                    continue
+                elif 'Start' in clip_element:
+                    clip_start=mc.intFieldGrp(clip_element, query=True, value1=True)
+                    clips_value.append(clip_start)
+                elif 'End' in clip_element:
+                    clip_end=mc.intFieldGrp(clip_element, query=True, value1=True)
+                    clips_value.append(clip_end)
+                else:
+                    clip_file_name=mc.textFieldGrp(clip_element, query=True, text=True)
+                    clips_value.append(clip_file_name)
+            if not clips_value[0]:
+                mc.warning('Please provide a file name for each animation clip.')
+                return None
+            clips.append(clips_value)
+
+        return clips
+
     def do_FBX_export(self, *args):
         '''
         Handles the FBX export procedure. 
@@ -745,220 +914,64 @@ class mtouExporterUI():
             mc.warning('Please provide a folder name to export.')
             return
 
-        # store initial playback start & end frame range
-        init_start_frame = mc.playbackOptions(query=True, minTime=True)
-        init_end_frame = mc.playbackOptions(query=True, maxTime=True)
-
-        # get move to origin bool value
-        move_mesh = self.checkerSettings.get('move_to_origin')
-
-        # evaluate user's fbx settings before exporting mesh 
-        # evaluate if the mesh will be exported with Smoothing Groups information data
-        self.fbx.export_smoothing_groups(self.checkerSettings.get('smooth_groups'))
-
-        # evaluate if the mesh will be Subdivided once exported
-        self.fbx.export_smooth_mesh(self.checkerSettings.get('smooth_mesh'))
-
-        # evaluate if the mesh will contain Tangents & Binormals information data 
-        self.fbx.export_tangents_binormals(self.checkerSettings.get('tangents'))
-
-        # evaluate if the mesh will get Triangulated before exporting
-        self.fbx.triangulate(self.checkerSettings.get('triangulate'))
-
-        # evaluate if the mesh will be exported with Skin Deformation data
-        self.fbx.export_skinWeights(self.checkerSettings.get('skins'))
-
-        # evaluate if the mesh will contain geometry Blend Shapes from the current scene
-        self.fbx.export_blendShapes(self.checkerSettings.get('blnd_shapes'))
-
-        # evaluate if the mesh will be exported with Embedded Media (textures)
-        self.fbx.export_embedded_textures(self.checkerSettings.get('embed_media'))
-
-        # evaluate the primary axis the mesh will be exported with (Y-Up or Z-Up)
-        axisValue = mc.optionMenu(self.menuSettings['axis'], query=True, value=True)
-        if axisValue == 'Y-Up':
-            self.fbx.up_axis(True)
-        else:
-            self.fbx.up_axis()
-
-        # evaluate if the file will be exported as Ascii or Binary
-        fbxFileType=mc.optionMenu(self.menuSettings['fileType'], query=True, value=True)
-        if fbxFileType == "Ascii":
-            self.fbx.file_type(True)
-        else:
-            self.fbx.file_type()
-
-        # evaluate which FBX maya version will the mesh be exported in    
-        fbxVersion = mc.optionMenu(self.menuSettings['version'], query=True, value=True)
-        print(fbxVersion)
-        self.fbx.file_version(fbxVersion)
-
-        # get prefix and suffix text value
-        prefix_name=mc.textFieldGrp(self.prefix_field, query=True, text=True)
-        suffix_name=mc.textFieldGrp(self.suffix_field, query=True, text=True)
-
-        # get batch export bool value
-        batch_export=self.checkerSettings.get('batch_export')
-
-        # check if import data has been generated prior
-        import_data_exists = md.path_exists(os.path.join(self.folder_path, 'importSettings.json'))
-        if import_data_exists:
-            # load and store import settings data set
-            import_data = md.load_data(self.folder_path, 'importSettings.json')
-        else:
-            # create empty import settings data set
-            import_data = {}
-
-        # clear data set; avoids conflict with latest version of importer script
-        import_data.clear()
-        # create fbx import settings data set
-        fbx_import = {}
-        import_data['FBX'] = fbx_import
-
-        if self.checkerSettings.get('unused_jnts'):
-            for mesh in mesh_selection:
-                if mesh in md.get_root_jnts():
-                    # get the root joints from selection and get their unused joints
-                    jnts_data=md.get_unused_joints_in_hier([mesh])
-                    if jnts_data:
-                        # binds unused joints with 0 influence to skinned meshes before export
-                        md.bind_unused_joints(jnts_data) # experimental; requires further testing
-
-        if batch_export:
-            iter_val=0
-            for mesh in mesh_selection:
-                main_name=mesh_file
-                iter_val+=1
-                mc.select(mesh)
-                if move_mesh:
-                    if mesh in md.get_root_jnts() or mc.nodeType(mesh) != 'joint':
-                        self.fbx.move_sel_to_origin(mesh)
-
-                # evaluate if animations will be exported
-                if self.checkerSettings.get('export_anim'):
-                    if self.checkerSettings.get('bake_anim'):
-                        # bake every animation frame 
-                        self.fbx.export_bake_anim(value=True)
-                else:
-                    # do export without animation
-                    self.fbx.exclude_anim()
+        clips=self.get_clips_values()
+        if clips is None:
+            return
 
-                file_name=self.set_export_file_name(mesh_file, extension='.fbx', keep_extension=False,
-                                                    prefix=prefix_name, suffix=suffix_name)
+        settings=self.get_export_settings()
+        # copies of the same mesh are exported once: the batch is sized with the exported items
+        instance_groups=procedures.get_instance_groups(mesh_selection, settings)
+        total=len(instance_groups) if instance_groups is not None else None
+        # processed texture copies are cached across exports
+        textures=procedures.get_texture_cache(self.folder_path, settings)
+        self.run_export('FBX', procedures.fbx_export_procedure, self.fbx, mesh_selection, mesh_file, folder_name,
+                        settings, total=total, clips=clips, skeleton_data=self.get_ue_data('skeletons'),
+                        textures=textures, instance_groups=instance_groups)
 
-                iter_file_name = main_name + f"_{iter_val}.fbx"
+    def do_OBJ_export(self, *args):
+        '''
+        Handles the OBJ export procedure. 
+        Ensures no input error before executing exporter type methods.
+        '''
+        # load project path data
+        ue_project_path = self.get_ue_data()
+        # verify UE project path exists
+        if not ue_project_path:
+            mc.warning('No UE project has been loaded for export!')
+            return
 
-                import_settings=self.create_import_data(importer='FBX', skeleton_data=self.get_ue_data('skeletons'),) 
- 
-                # change & store file name and folder path values 
-                fbx_import[iter_file_name]=import_settings
-                import_settings['Folder Path']=folder_name
+        # create a list of the selected mesh/es
+        mesh_selection = mc.ls(selection = True)
 
-                self.fbx.set_file_name(iter_file_name)
-                mc.select(mesh)
-                self.fbx.export()
+        if not mesh_selection:
+            mc.warning("Please select a mesh to export.")
+            return
+        
+        # query the user's file & folder name
+        mesh_file = mc.textFieldGrp(self.filename_field, query=True, text=True)
+        folder_name = mc.textFieldGrp(self.foldername_field, query=True, text=True)
 
-                if move_mesh:
-                    # move mesh selection back to the original location prior to placing it at world origin
-                    if mesh in md.get_root_jnts() or mc.nodeType(mesh) != 'joint':
-                        self.fbx.place_sel_to_original_pos(mesh)
+        if not mesh_file:
+            mc.warning('Please name your file for export.')
+            return
 
+        if folder_name:
+            folder_name=folder_name.replace('\\', '/')
+            # create a path inside the UE's project contents folder where the mesh will be exported to
+            self.obj.set_UE_project_path(ue_project_path, folder_name)
         else:
-            if move_mesh:
-                # move mesh selection to world origin [0,0,0]
-                for mesh in mesh_selection:
-                    if mesh in md.get_root_jnts() or mc.nodeType(mesh) != 'joint':
-                        self.fbx.move_sel_to_origin(mesh)
-
-            # evaluate if animations will be exported
-            if self.checkerSettings.get('export_anim'):
-                # check created clips and export each one as a separate file
-                if clips_data:
-                    for clip in clips_data:
-                        clips_value=[]
-                        # get values from each clip element and store them 
-                        for clip_element in clips_data.get(clip):
-                            if 'Add' in clip_element:
-                                continue
-                            elif 'Start' in clip_element:
-                                clip_start=mc.intFieldGrp(clip_element, query=True, value1=True)
-                                clips_value.append(clip_start)
-                            elif 'End' in clip_element:
-                                clip_end=mc.intFieldGrp(clip_element, query=True, value1=True)
-                                clips_value.append(clip_end)
-                            else:
-                                clip_file_name=mc.textFieldGrp(clip_element, query=True, text=True)
-                                if not clip_file_name:
-                                    clips_value.append(None)
-                                clips_value.append(clip_file_name)
-                        if not clips_value[0]:
-                            mc.warning('Please provide a file name for each animation clip.')
-                            return
-                        # set the animation range for export
-                        if self.checkerSettings.get('bake_anim'):
-                            self.fbx.export_bake_anim(value=True, start=clips_value[1], end=clips_value[2])
-
-                        file_name=self.set_export_file_name(clips_value[0], extension='.fbx',
-                                                            prefix=prefix_name, suffix=suffix_name)
-                        import_settings=self.create_import_data(importer='FBX', animation_clips=[clips_value[1], clips_value[2]],
-                                                                skeleton_data=self.get_ue_data('skeletons'),)
-                        # change & store file name and folder path values 
-                        fbx_import[file_name]=import_settings
-                        import_settings['Folder Path']=folder_name
-
-                        self.fbx.set_file_name(file_name)
-                        mc.select(mesh_selection)
-                        self.fbx.export()
-                else:
-                    # export animations without frame range
-                    if self.checkerSettings.get('bake_anim'):
-                        # bake every animation frame 
-                        self.fbx.export_bake_anim(value=True)
-
-                    file_name=self.set_export_file_name(mesh_file, extension='.fbx',
-                                                        prefix=prefix_name, suffix=suffix_name)
-                    import_settings=self.create_import_data(importer='FBX', skeleton_data=self.get_ue_data('skeletons'),)
-                    # change & store file name and folder path values 
-                    fbx_import[file_name]=import_settings
-                    import_settings['Folder Path']=folder_name
-
-                    self.fbx.set_file_name(file_name)
-                    mc.select(mesh_selection)
-                    self.fbx.export()
+            mc.warning('Please provide a folder name to export.')
+            return     
 
-            else:
-                # do export without animation
-                self.fbx.exclude_anim()
-                file_name=self.set_export_file_name(mesh_file, extension='.fbx',
-                                                    prefix=prefix_name, suffix=suffix_name)
-                        
-                import_settings=self.create_import_data(importer='FBX', 
-                                                        skeleton_data=self.get_ue_data('skeletons')) 
-                # change & store file name and folder path values 
-                fbx_import[file_name]=import_settings
-                import_settings['Folder Path']=folder_name
-
-                self.fbx.set_file_name(file_name)
-                mc.select(mesh_selection)
-                self.fbx.export()
-
-            if move_mesh:
-                # move mesh selection back to the original location prior placing it at world origin
-                for mesh in mesh_selection:
-                    if mesh in md.get_root_jnts() or mc.nodeType(mesh) != 'joint':
-                        self.fbx.place_sel_to_original_pos(mesh)
-
-        # save the user import settings for unreal importer
-        md.save_data(self.folder_path, 'importSettings.json', import_data)
-
-        # restore initial playback frame range
-        mc.playbackOptions(edit=True, min=init_start_frame, max=init_end_frame)
-
-        mc.select(cl=True)
+        settings=self.get_export_settings()
+        # processed texture copies are cached across exports
+        textures=procedures.get_texture_cache(self.folder_path, settings)
+        self.run_export('OBJ', procedures.obj_export_procedure, self.obj, mesh_selection, mesh_file, folder_name,
+                        settings, textures=textures)
 
-    def do_OBJ_export(self, *args):
+    def do_GLTF_export(self, *args):
         '''
-        Handles the OBJ export procedure. 
+        Handles the glTF export procedure.
         Ensures no input error before executing exporter type methods.
         '''
         # load project path data
@@ -974,7 +987,7 @@ class mtouExporterUI():
         if not mesh_selection:
             mc.warning("Please select a mesh to export.")
             return
-        
+
         # query the user's file & folder name
         mesh_file = mc.textFieldGrp(self.filename_field, query=True, text=True)
         folder_name = mc.textFieldGrp(self.foldername_field, query=True, text=True)
@@ -986,162 +999,138 @@ class mtouExporterUI():
         if folder_name:
             folder_name=folder_name.replace('\\', '/')
             # create a path inside the UE's project contents folder where the mesh will be exported to
-            self.obj.set_UE_project_path(ue_project_path, folder_name)
+            self.gltf.set_UE_project_path(ue_project_path, folder_name)
         else:
             mc.warning('Please provide a folder name to export.')
-            return     
+            return
 
-        move_mesh = self.checkerSettings['move_to_origin']
+        settings=self.get_export_settings()
+        self.run_export('GLTF', procedures.gltf_export_procedure, self.gltf, mesh_selection, mesh_file, folder_name,
+                        settings, skeleton_data=self.get_ue_data('skeletons'))
 
-        # evaluate if mesh will contain group information data
-        if self.checkerSettings['groups']:
-            obj_groups=1
-        
-        # evaluate if mesh will contain point groups information data
-        if self.checkerSettings['pt_groups']:
-            obj_ptgroups=1
-
-        # evaluate if mesh will contain material information data
-        if self.checkerSettings['materials']:            
-            obj_materials=1
-
-        # evaluate if mesh will contain smoothing groups information data
-        if self.checkerSettings['smoothing']:
-            obj_smoothing=1
-
-        # evaluate if mesh will contain normals information data
-        if self.checkerSettings['normals']:
-            obj_normals=1
-
-        # check if import data has been generated prior
-        import_data_exists = md.path_exists(os.path.join(self.folder_path, 
-                                                              'importSettings.json'))
-        if import_data_exists:
-            # load and store import settings data set
-            import_data = md.load_data(self.folder_path, 'importSettings.json')
-        else:
-            # create empty import settings data set
+    def run_export(self, export_type:str, export_procedure, exporter, mesh_selection:list, mesh_file:str,
+                   folder_name:str, settings:dict, total:int|None=None, **procedure_kwargs):
+        '''
+        Runs the export procedure of an exporter type on the selection, then journals and pushes its export batch.
+        The procedure is called with the exporter, the export cache and the batch checkpoint and progress;
+        keyword arguments are passed through. Nothing is journaled if validation fails.
+        '''
+        # trace the export batch; the batch ID correlates it with the Unreal import
+        with tracing.span(f'mtouExporter.do_{export_type}_export', folder=folder_name) as export_span:
+            batch_id=tracing.new_batch_id()
+            export_span.set(batch_id=batch_id)
+
+            # load export fingerprints to skip unchanged assets
+            cache=fingerprint.exportCache(self.folder_path) if settings.get('skip_unchanged') else None
+
+            # create import settings data set; avoids conflict with latest version of importer script
             import_data = {}
+            # batch exports are checkpointed per item and can be cancelled from the progress window
+            try:
+                with self.batch_progress(export_type, mesh_selection, mesh_file, folder_name, settings,
+                                         total=total) as (batch_checkpoint, progress):
+                    import_data[export_type] = export_procedure(exporter, mesh_selection, settings,
+                                                                mesh_file, folder_name, cache=cache,
+                                                                checkpoint=batch_checkpoint, progress=progress,
+                                                                **procedure_kwargs)
+            except validation.meshValidationError as error:
+                # invalid meshes: nothing was exported
+                self.show_validation_report(error)
+                return
+            if cache:
+                cache.save()
 
-        # clear data set; avoids conflict with latest version of importer script
-        import_data.clear()
-        # create obj import settings data set
-        obj_import = {}
-        import_data['OBJ'] = obj_import
+            # queue the export batch in the import journal for unreal importer
+            journal.append_batch(self.folder_path, import_data, batch_id)
+            self.finish_batch(batch_checkpoint, progress, import_data)
+            self.push_import_data(import_data, batch_id)
 
-        # get prefix and suffix text value
-        prefix_name=mc.textFieldGrp(self.prefix_field, query=True, text=True)
-        suffix_name=mc.textFieldGrp(self.suffix_field, query=True, text=True)
-
-        batch_export=self.checkerSettings['batch_export']
-
-        if batch_export:
-            iter_val=0
-            for mesh in mesh_selection:
-                iter_val+=1
-                mc.select(mesh)
-                # create temporary transform node 
-                tempGrp=mc.group(empty=True)
-                # parent mesh to transform node and rotate the node 90 degrees
-                mc.parent(mesh, tempGrp)
-                mc.rotate(90,0,0, tempGrp)
-
-                if move_mesh:
-                    # move mesh selection to world origin [0,0,0]
-                    self.obj.move_sel_to_origin(mesh)
-
-                file_name=self.set_export_file_name(mesh_file, extension='.obj', keep_extension=False,
-                                                    prefix=prefix_name, suffix=suffix_name)
-
-                iter_file_name = file_name + f"_{iter_val}.obj"
-                self.obj.set_file_name(iter_file_name)
-                import_settings=self.create_import_data()
-                # change & store file name and folder path values 
-                obj_import[iter_file_name]=import_settings
-                import_settings['Folder Path']=folder_name
-
-                # evaluate the user's settings and store them in a tuple for exporting
-                self.obj.export(obj_groups, obj_ptgroups, obj_materials, 
-                                obj_smoothing, obj_normals, 
-                                include_textures=self.checkerSettings['imp_textures'])
-
-                # undo rotation of temporary transform node
-                mc.rotate(0,0,0, tempGrp)
-                # unparent mesh to transform node and delete the node 
-                mc.parent(mesh, world=True)
-                mc.delete(tempGrp)
-
-                if move_mesh:
-                    # move mesh selection back to the original location prior placing it at world origin
-                    self.obj.place_sel_to_original_pos(mesh)
-
-        else: 
-            # create temporary transform node 
-            tempGrp=mc.group(empty=True)
-            for mesh in mesh_selection:
-                # parent mesh to transform node and rotate the node 90 degrees
-                mc.parent(mesh, tempGrp)
-            mc.rotate(90,0,0, tempGrp)
-
-            if move_mesh:
-            # move mesh selection to world origin [0,0,0]
-                for mesh in mesh_selection:
-                    self.obj.move_sel_to_origin(mesh)
-            file_name=self.set_export_file_name(mesh_file, extension='.obj', 
-                                                prefix=prefix_name, suffix=suffix_name)
-            self.obj.set_file_name(file_name)
-
-            import_settings=self.create_import_data()
-            # change & store file name and folder path values 
-            obj_import[file_name]=import_settings
-            import_settings['Folder Path']=folder_name
-
-            # evaluate the user's settings and store them in a tuple for exporting
-            self.obj.export(obj_groups, obj_ptgroups, obj_materials, 
-                            obj_smoothing, obj_normals, 
-                            include_textures=self.checkerSettings['imp_textures'])
-        
-            # undo rotation of temporary transform node
-            mc.rotate(0,0,0, tempGrp)
-            for mesh in mesh_selection:
-                # unparent mesh to transform node and delete the node 
-                mc.parent(mesh, world=True)
-            mc.delete(tempGrp)
+            mc.select(cl=True)
+        tracing.flush()
 
-            # move mesh selection back to the original location prior to placing it at world origin
-            if move_mesh:
-                for mesh in mesh_selection:
-                    self.obj.place_sel_to_original_pos(mesh)
+    @contextmanager
+    def batch_progress(self, export_type:str, selection:list, file_name:str, folder_name:str, settings:dict,
+                       total:int|None=None):
+        '''
+        Yields the checkpoint and progress of a batch export, shown in an interruptible progress window;
+        (None, None) if batch export is off. A checkpoint left by an interrupted run of the same batch is resumed.
+        Both are sized with the total of exported items; one per selected node by default.
+        '''
+        if not settings.get('batch_export'):
+            yield None, None
+            return
+
+        total=len(selection) if total is None else total
+        batch_key=checkpoint.get_batch_key(export_type, selection, file_name, folder_name, settings)
+        batch_checkpoint=checkpoint.exportCheckpoint(self.folder_path, batch_key, total=total)
+        if batch_checkpoint.get_resumed_count():
+            sys.stdout.write(f"Resuming batch export: {batch_checkpoint.get_resumed_count()} of "
+                             f"{total} items already exported\n")
+
+        def report(progress):
+            mc.progressWindow(edit=True, progress=progress.get_percent(), status=progress.get_status())
+
+        def cancel() -> bool:
+            return mc.progressWindow(query=True, isCancelled=True)
+
+        progress=checkpoint.batchProgress(total, report=report, cancel=cancel)
+        mc.progressWindow(title='MtoU Batch Export', progress=0, status=f'0/{total} items',
+                          isInterruptable=True)
+        try:
+            yield batch_checkpoint, progress
+        finally:
+            mc.progressWindow(endProgress=True)
+
+    def show_validation_report(self, error:validation.meshValidationError):
+        ''' Shows the per mesh report of a failed validation: full report in the script editor, summary in a dialog. '''
+        sys.stdout.write(f'{error}\n')
+        meshes='\n'.join(report['mesh'].rsplit('|', 1)[-1] for report in error.reports[:10])
+        more=f"\n... and {len(error.reports) - 10} more" if len(error.reports) > 10 else ''
+        mc.confirmDialog(title='MtoU Mesh Validation', button=['OK'],
+                         message=f'{len(error.reports)} mesh(es) failed validation, nothing was exported:\n'
+                                 f'{meshes}{more}\n\nSee the Script Editor for the full report.')
+        mc.warning(f'Export cancelled: {len(error.reports)} mesh(es) failed validation.')
+
+    def finish_batch(self, batch_checkpoint, progress, import_data:dict):
+        '''
+        Completes the checkpoint of a journaled batch export.
+        The checkpoint of a cancelled batch is kept for resuming, with its journaled items marked.
+        '''
+        if batch_checkpoint is None:
+            return
+        if progress.cancelled:
+            batch_checkpoint.mark_journaled([file_name for importer in import_data.values() for file_name in importer])
+            mc.warning(f'Batch export cancelled at {progress.done}/{progress.total} items. '
+                       'Export the same selection again to resume.')
+        else:
+            batch_checkpoint.complete()
+            sys.stdout.write(f"Batch export done: {progress.get_status()}\n")
 
-        # save the user import settings for unreal importer
-        md.save_data(self.folder_path, 'importSettings.json', import_data)
+    def push_import_data(self, import_data:dict, batch_id:str|None=None):
+        ''' Pushes the export batch to a listening Unreal loader; the journaled batch remains the fallback. '''
+        if not any(import_data.values()):
+            return
+
+        def import_done(message:dict):
+            imported=len([result for result in message.get('results', []) if result.get('imported')])
+            # log from Maya's main thread
+            maya.utils.executeDeferred(sys.stdout.write, f"Unreal Import Done: {imported} file(s) imported "
+                                                         f"in {message.get('duration', 0.0):.2f}s\n")
 
-        mc.select(cl=True)
+        # the pushed data set carries the batch ID, same as the saved one
+        batch_id=batch_id or tracing.new_batch_id()
+        if self.transport.send_batch(dict(import_data, **{tracing.BATCH_ID_KEY: batch_id}), batch_id=batch_id,
+                                     on_done=import_done):
+            sys.stdout.write("Export batch sent to the Unreal loader\n")
 
     def set_export_file_name(self, file_name:str, prefix:str|None=None, suffix:str|None=None,
                              extension:str='.obj', keep_extension:bool=True):
         ''' 
         Builds and returns the export file name with optional prefix and suffix string values.
-        Can only build with '.obj' or '.fbx' extensions.
+        Can only build with '.obj', '.fbx' or '.glb' extensions.
         '''
-        avilable_extensions = ['.obj', '.fbx']
-        if extension not in avilable_extensions:
-            mc.warning(f"Extension: '{extension}' not available. Available extensions: {avilable_extensions}")
-            return file_name
-        
-        # concatenate prefix and/or prefix is value exists
-        if prefix:
-            file_name = prefix+file_name
-        if extension in file_name:
-            file_name = file_name.split(extension)[0]
-        if suffix:
-            file_name += suffix
-        # if the user didn't add extension at the end of the file name, add it
-        if keep_extension:
-            if not file_name.endswith(extension):
-                file_name += extension
-
-        return file_name
+        return procedures.build_file_name(file_name, prefix=prefix, suffix=suffix,
+                                          extension=extension, keep_extension=keep_extension)
 
     def create_import_data(self, importer:str='OBJ', animation_clips:list|None=None, 
                            skeleton_data:dict|None=None):
@@ -1149,39 +1138,8 @@ class mtouExporterUI():
         Handles the configuration of the import settings data set.
         Defaults to OBJ importer unless otherwise specified.
         '''
-        import_settings = {}
-        
-        # overwrite values with check box selection (user settings)
-        import_settings['Import Materials']=self.checkerSettings.get('imp_materials')
-        import_settings['Import Textures']=self.checkerSettings.get('imp_textures')
-        import_settings['Import Static Mesh']=self.checkerSettings.get('imp_static_mesh')
-        import_settings['Import Skeletal Mesh']=self.checkerSettings.get('imp_skeletal_mesh')
-        import_settings['Use Source Name']=self.checkerSettings.get('use_source_name')
-
-        # set FBX specific import settings
-        if importer=='FBX':
-            if import_settings['Import Static Mesh'] and not import_settings['Import Skeletal Mesh']:
-                import_settings['Force Mesh Type']=1
-            import_settings['Import Animations']=self.checkerSettings.get('imp_anim')
-            if import_settings['Import Animations']:
-                # set additional animation import settings 
-                import_settings['Import Only Animations']=self.checkerSettings.get('imp_only_anims')
-                # get animation clips frame range
-                if animation_clips:
-                    import_settings['Animation Range']=animation_clips
-                else:
-                    import_settings['Animation Range']=None
-
-            # query and set skeleton asset from UE project skeletons data, if available
-            skeleton = mc.optionMenu(self.menuSettings['skeleton'], query=True, value=True)
-            if skeleton != 'None' and skeleton_data:
-                skeleton_asset=f'{skeleton_data.get(skeleton)}.{skeleton}'
-                import_settings['Skeleton']=skeleton_asset
-            else:
-                import_settings['Skeleton']=None
-            import_settings['Meshes in Bone Hierarchy']=self.checkerSettings.get('imp_meshes_bones')
-
-        return import_settings
+        return procedures.build_import_settings(self.get_export_settings(), importer=importer,
+                                                animation_clips=animation_clips, skeleton_data=skeleton_data)
 
         
 
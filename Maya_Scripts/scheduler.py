@@ -0,0 +1,276 @@
+'''
+Multi-process batch export scheduler.
+Splits a batch manifest by scene and asset into shards, runs them on a pool of warm
+mayapy workers ('batch.py --worker') and merges every per-file result into a single
+export batch of the import journal. Runs on any Python 3 interpreter; only the workers require Maya.
+
+Usage:
+    python -m Maya_Scripts.scheduler manifest.json [--workers N] [--mayapy PATH] [--shard-size N]
+    python -m Maya_Scripts.scheduler manifest.json --benchmark 1,2,4,8
+
+Benchmark mode runs the whole manifest once per pool size and reports the wall time,
+speedup and parallel efficiency against the first (smallest) pool size.
+'''
+from .batch import load_manifest, merge_import_data, WORKER_READY, WORKER_RESULT
+from .library import journal
+from .library import tracing
+from collections import deque
+from pathlib import Path
+import subprocess
+import threading
+import argparse
+import queue
+import json
+import time
+import sys
+import os
+
+def get_default_mayapy() -> str:
+    ''' Returns the mayapy executable next to the running interpreter, or the interpreter itself. '''
+    executable_dir = os.path.dirname(sys.executable)
+    for name in ['mayapy.exe', 'mayapy']:
+        mayapy = os.path.join(executable_dir, name)
+        if os.path.exists(mayapy):
+            return mayapy
+    return sys.executable
+
+def shard_jobs(jobs:list, defaults:dict|None=None, shard_size:int=1) -> list:
+    '''
+    Splits manifest jobs into independent shards.
+    Batch export jobs are split per asset (shard_size assets per shard); file numbering is
+    kept through each shard's 'start_index'. Every shard carries its merged settings.
+    Copies of the same mesh ('instance_meshes') are only exported once within a shard: the geometry
+    is compared by the workers, so copies in different shards are each exported by their own shard.
+    Use a shard size covering the whole selection to export every copy once.
+    '''
+    shards = []
+    for job in jobs:
+        settings = dict(defaults or {})
+        settings.update(job.get('settings', {}))
+        job = dict(job, settings=settings)
+
+        selection = job.get('selection')
+        if settings.get('batch_export') and selection and len(selection) > shard_size:
+            for index in range(0, len(selection), shard_size):
+                shards.append(dict(job, selection=selection[index:index+shard_size], start_index=index))
+        else:
+            shards.append(job)
+
+    for job_id, shard in enumerate(shards):
+        shard['job_id'] = job_id
+
+    return shards
+
+class exportWorker():
+    ''' A warm mayapy export worker process; results are read on a background thread. '''
+    def __init__(self, worker_id:int, mayapy:str, results:queue.Queue, project_path:str|None=None,
+                 data_path:str|None=None, cwd:str|None=None):
+        ''' Starts the worker process and its result reader thread. '''
+        self.worker_id = worker_id
+        self.current_scene = None
+        self.busy = False
+        self.ready = False
+
+        command = [mayapy, '-m', 'Maya_Scripts.batch', '--worker']
+        if project_path:
+            command += ['--project', project_path]
+        if data_path:
+            command += ['--data-path', data_path]
+
+        self._results = results
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                         cwd=cwd, text=True, bufsize=1)
+        self._reader = threading.Thread(target=self._read_results, daemon=True)
+        self._reader.start()
+
+    def _read_results(self) -> None:
+        ''' Forwards the worker ready and result lines to the scheduler queue. '''
+        for line in self._process.stdout:
+            if line.startswith(WORKER_READY):
+                self._results.put((self.worker_id, 'ready', None))
+            elif line.startswith(WORKER_RESULT):
+                self._results.put((self.worker_id, 'result', json.loads(line[len(WORKER_RESULT):])))
+        self._results.put((self.worker_id, 'exit', self._process.wait()))
+
+    def send(self, job:dict) -> None:
+        ''' Sends a job to the worker. '''
+        self.busy = True
+        self.current_scene = job.get('scene')
+        self._process.stdin.write(json.dumps(job) + '\n')
+        self._process.stdin.flush()
+
+    def close(self) -> None:
+        ''' Asks the worker to quit and waits for the process to end. '''
+        if self._process.poll() is None:
+            try:
+                self._process.stdin.write(json.dumps({'command': 'quit'}) + '\n')
+                self._process.stdin.close()
+            except OSError:
+                pass
+        self._process.wait()
+
+class workerPool():
+    '''
+    Pool of warm mayapy export workers.
+    Idle workers pull the next shard, preferring shards of the scene they already have open.
+    '''
+    def __init__(self, size:int, mayapy:str|None=None, project_path:str|None=None, data_path:str|None=None):
+        ''' Starts the workers and waits until every standalone session is initialized. '''
+        self._results = queue.Queue()
+        # run workers from the plug-ins folder so 'Maya_Scripts' is importable
+        plugin_path = str(Path(__file__).resolve().parent.parent)
+        mayapy = mayapy or get_default_mayapy()
+
+        start_time = time.perf_counter()
+        self.workers = [exportWorker(worker_id, mayapy, self._results, project_path=project_path,
+                                     data_path=data_path, cwd=plugin_path) for worker_id in range(size)]
+        while not all(worker.ready for worker in self.workers):
+            worker_id, message, payload = self._results.get()
+            if message == 'exit':
+                raise RuntimeError(f'Export worker {worker_id} exited during startup with code {payload}.')
+            self.workers[worker_id].ready = True
+        self.startup_time = time.perf_counter() - start_time
+
+    def next_shard(self, worker:exportWorker, pending:deque) -> dict:
+        ''' Pops the next shard for the worker, preferring its currently open scene. '''
+        for shard in pending:
+            if shard.get('scene') == worker.current_scene:
+                pending.remove(shard)
+                return shard
+        return pending.popleft()
+
+    def run(self, shards:list) -> list:
+        ''' Runs every shard on the pool; returns the shard results in shard order. '''
+        pending = deque(shards)
+        results = {}
+
+        for worker in self.workers:
+            if pending:
+                worker.send(self.next_shard(worker, pending))
+
+        while len(results) < len(shards):
+            worker_id, message, payload = self._results.get()
+            worker = self.workers[worker_id]
+            if message == 'exit':
+                raise RuntimeError(f'Export worker {worker_id} exited with code {payload}.')
+            if message != 'result':
+                continue
+
+            results[payload['job_id']] = payload
+            payload['worker'] = worker_id
+            worker.busy = False
+            if pending:
+                worker.send(self.next_shard(worker, pending))
+
+        return [results[shard['job_id']] for shard in shards]
+
+    def close(self) -> None:
+        ''' Stops every worker. '''
+        for worker in self.workers:
+            worker.close()
+
+def run_schedule(manifest:dict, workers:int, mayapy:str|None=None, project_path:str|None=None,
+                 data_path:str|None=None, shard_size:int=1) -> tuple:
+    '''
+    Exports the manifest on a pool of workers.
+    Returns the merged import settings data set, the shard results and the timings.
+    '''
+    shards = shard_jobs(manifest['jobs'], defaults=manifest.get('settings'), shard_size=shard_size)
+
+    pool = workerPool(workers, mayapy=mayapy, project_path=project_path or manifest.get('project'),
+                      data_path=data_path)
+    try:
+        start_time = time.perf_counter()
+        results = pool.run(shards)
+        export_time = time.perf_counter() - start_time
+    finally:
+        pool.close()
+
+    import_data = {}
+    for result in results:
+        merge_import_data(import_data, result)
+
+    timings = {'workers': workers, 'shards': len(shards), 'startup': pool.startup_time, 'export': export_time}
+    return import_data, results, timings
+
+def run_benchmark(manifest:dict, pool_sizes:list, **kwargs) -> list:
+    '''
+    Runs the manifest once per pool size; logs wall time, speedup and efficiency.
+    Unchanged assets are not skipped, so every run exports the whole manifest.
+    '''
+    # the first run's export fingerprints would otherwise skip every asset in the later runs
+    jobs = [dict(job, settings=dict(job.get('settings', {}), skip_unchanged=False)) for job in manifest['jobs']]
+    manifest = dict(manifest, jobs=jobs)
+
+    benchmark = []
+    for size in pool_sizes:
+        _, results, timings = run_schedule(manifest, size, **kwargs)
+        timings['failed'] = len([result for result in results if result['status'] != 'ok'])
+        benchmark.append(timings)
+
+    base = benchmark[0]
+    sys.stdout.write(f"{'workers':>8} {'shards':>8} {'startup':>10} {'export':>10} {'speedup':>8} {'efficiency':>10}\n")
+    for timings in benchmark:
+        speedup = base['export'] * base['workers'] / timings['export'] if timings['export'] else 0.0
+        timings['speedup'] = speedup
+        timings['efficiency'] = speedup / timings['workers']
+        sys.stdout.write(f"{timings['workers']:>8} {timings['shards']:>8} {timings['startup']:>9.2f}s "
+                         f"{timings['export']:>9.2f}s {speedup:>7.2f}x {timings['efficiency']:>9.0%}\n")
+
+    return benchmark
+
+def main(argv:list|None=None) -> int:
+    ''' Command line entry point: schedules a manifest across workers and journals its export batch. '''
+    parser = argparse.ArgumentParser(prog='Maya_Scripts.scheduler', description='MtoU multi-process batch exporter.')
+    parser.add_argument('manifest', help='batch manifest (JSON) file')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='number of mayapy workers')
+    parser.add_argument('--mayapy', help='mayapy executable; defaults to the one next to this interpreter')
+    parser.add_argument('--project', help='UE project path; defaults to the manifest or ue_data.json project')
+    parser.add_argument('--data-path', help="folder of the import journal; defaults to 'Documents/UE/Data'")
+    parser.add_argument('--shard-size', type=int, default=1, help='assets per batch export shard')
+    parser.add_argument('--report', help='optional path to save the per shard results (JSON)')
+    parser.add_argument('--benchmark', help='comma separated pool sizes to benchmark, e.g. 1,2,4,8')
+    parser.add_argument('--push', action='store_true', help='push the batch to a listening Unreal loader and wait for its import')
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest(args.manifest)
+    options = {'mayapy': args.mayapy, 'project_path': args.project, 'data_path': args.data_path,
+               'shard_size': max(1, args.shard_size)}
+
+    if args.benchmark:
+        pool_sizes = [int(size) for size in args.benchmark.split(',') if size.strip()]
+        benchmark = run_benchmark(manifest, pool_sizes, **options)
+        if args.report:
+            with open(args.report, 'w') as file:
+                json.dump(benchmark, file, indent=4)
+        return 0
+
+    # trace the export batch; the batch ID correlates it with the Unreal import
+    with tracing.span('scheduler.run_schedule', workers=max(1, args.workers)) as schedule_span:
+        batch_id = tracing.new_batch_id()
+        schedule_span.set(batch_id=batch_id)
+        import_data, results, timings = run_schedule(manifest, max(1, args.workers), **options)
+        data_path = args.data_path or os.path.join(str(Path.home()), 'Documents', 'UE', 'Data')
+        # queue the merged export batch in the import journal for unreal importer
+        journal.append_batch(data_path, import_data, batch_id)
+
+    if args.push and any(import_data.values()):
+        from .library import transport
+        done = transport.transportClient().send_batch(dict(import_data, **{tracing.BATCH_ID_KEY: batch_id}),
+                                                      batch_id=batch_id, wait=True)
+        if done is None:
+            sys.stdout.write('No Unreal loader listening; export batch journaled for manual import\n')
+        else:
+            sys.stdout.write(f"Unreal import done: {len(done.get('results', []))} file(s) in {done.get('duration', 0.0):.2f}s\n")
+
+    if args.report:
+        with open(args.report, 'w') as file:
+            json.dump(results, file, indent=4)
+
+    failed = [result for result in results if result['status'] != 'ok']
+    sys.stdout.write(f"Scheduled export finished: {timings['shards']} shard(s) on {timings['workers']} worker(s) "
+                     f"in {timings['export']:.2f}s ({timings['startup']:.2f}s startup), {len(failed)} failed\n")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
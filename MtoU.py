@@ -1,9 +1,6 @@
-import maya.cmds as mc
 import maya.api.OpenMaya as om
 import importlib
-import runpy
 import sys
-import os 
 
 def maya_useNewAPI():
     """
@@ -24,7 +21,8 @@ def initializePlugin(pluginObject):
         sys.path.append(plugin_path)
 
     print(f'Running MtoU from: {plugin_path}')
-    runpy.run_module('Maya_Scripts', run_name="__main__")
+    # only the menu is registered at plugin load; the exporter modules are imported on first use
+    importlib.import_module('Maya_Scripts.menu').build_menu()
 
 def uninitializePlugin(pluginObject):
     ''' 
@@ -35,9 +33,8 @@ def uninitializePlugin(pluginObject):
 
     # load the plugin path to remove the 'Maya_Scripts' from active scripts directory
     plugin_path=plugin_data.loadPath()
-    scripts_path = os.path.join(plugin_path, 'Maya_Scripts')
-    if plugin_path not in sys.path:
-        sys.path.remove(plugin_path)
 
-    if mc.menu('UExporterMenu', exists = True):
-        mc.deleteUI('UExporterMenu', menu = True)
+    importlib.import_module('Maya_Scripts.menu').delete_menu()
+
+    if plugin_path in sys.path:
+        sys.path.remove(plugin_path)
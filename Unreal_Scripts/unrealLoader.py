@@ -1,11 +1,378 @@
 # import modules
+from contextlib import contextmanager
 from pathlib import Path
+import tempfile
+import hashlib
 import unreal
+import threading
+import select
+import socket
 import json
+import time
+import glob
 import os
 
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
 unreal.log('unrealLoader.py: Scripts & Modules Initialized.')
 
+# importer types of the import settings data set, in import order
+IMPORTER_TYPES = ['OBJ', 'FBX', 'GLTF']
+
+# span tracing, shared with the Maya exporter (Maya_Scripts/library/tracing.py): Chrome trace, JSON Array Format
+TRACE_FILE_NAME = 'mtouTrace.json'
+# key of the export batch ID in the import settings data set; correlates the exporter and loader spans
+BATCH_ID_KEY = 'Batch ID'
+# append-only export job journals written by the Maya exporter sessions (Maya_Scripts/library/journal.py)
+JOURNAL_FILE_NAME = 'importJournal.jsonl'
+# emptied journals of exporter sessions idle for longer are removed, with their lock file
+STALE_JOURNAL_AGE = 7 * 24 * 3600.0
+# seconds to wait for a data file lock held by an exporter session
+LOCK_TIMEOUT = 10.0
+# seconds an import batch runs before its progress dialog is shown; short batches never show it
+PROGRESS_DIALOG_DELAY = 1.0
+# Unreal axis of every Maya axis: Maya Y-up, right-handed (x, y, z) -> Unreal Z-up, left-handed (x, z, y)
+MAYA_TO_UE_AXES = [0, 2, 1]
+
+class TraceRecorder:
+    '''
+    Buffers trace events and appends them to the trace file shared with the Maya exporter.
+    Timestamps are wall clock microseconds, so both processes line up on one timeline
+    (open the file in Perfetto or chrome://tracing).
+    '''
+    def __init__(self, trace_file:str) -> None:
+        self._trace_file = trace_file
+        self._pid = os.getpid()
+        self._events = []
+        self._lock = threading.Lock()
+        self._named = False
+
+    def get_trace_file(self) -> str:
+        ''' Returns the trace file the events are appended to. '''
+        return self._trace_file
+
+    def add_event(self, event:dict) -> None:
+        ''' Buffers a trace event of the current process and thread. '''
+        event['pid'] = self._pid
+        event['tid'] = threading.get_ident()
+        with self._lock:
+            self._events.append(event)
+
+    def complete(self, name:str, start:float, duration:float, args:dict|None=None) -> None:
+        ''' Buffers a complete span event; start is a time.time() value, duration in seconds. '''
+        self.add_event({'name': name, 'cat': 'mtou', 'ph': 'X', 'ts': start * 1e6, 'dur': duration * 1e6,
+                        'args': args or {}})
+
+    def async_span(self, name:str, span_id:str, start:float, duration:float, args:dict|None=None) -> None:
+        ''' Buffers an async span; used for overlapping spans such as in flight Interchange imports. '''
+        self.add_event({'name': name, 'cat': 'mtou', 'ph': 'b', 'id': span_id, 'ts': start * 1e6, 'args': args or {}})
+        self.add_event({'name': name, 'cat': 'mtou', 'ph': 'e', 'id': span_id, 'ts': (start + duration) * 1e6})
+
+    def flow(self, batch_id:str, start:bool=True, timestamp:float|None=None) -> None:
+        ''' Buffers a flow start (or end) event linking the export and import spans of a batch. '''
+        self.add_event({'name': 'batch', 'cat': 'mtou', 'ph': 's' if start else 'f', 'bp': 'e',
+                        'id': batch_id, 'ts': (timestamp or time.time()) * 1e6})
+
+    def flush(self) -> None:
+        ''' Appends the buffered events to the trace file. '''
+        with self._lock:
+            events, self._events = self._events, []
+        if not events:
+            return
+        if not self._named:
+            events.insert(0, {'name': 'process_name', 'ph': 'M', 'pid': self._pid, 'tid': 0,
+                              'args': {'name': f'Unreal ({self._pid})'}})
+            self._named = True
+
+        trace_path = os.path.dirname(self._trace_file)
+        if trace_path and not os.path.exists(trace_path):
+            os.makedirs(trace_path)
+        text = ''.join(json.dumps(event) + ',\n' for event in events)
+        with open(self._trace_file, 'a') as file:
+            # a new trace file opens the JSON array; the closing bracket is optional
+            if file.tell() == 0:
+                text = '[\n' + text
+            file.write(text)
+
+class TraceSpan:
+    ''' Context manager recording a complete span; arguments can be added while it is open. '''
+    __slots__ = ('_recorder', '_name', '_args', '_start', '_counter')
+
+    def __init__(self, recorder:TraceRecorder, name:str, args:dict) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._args = args
+
+    def set(self, **args) -> None:
+        ''' Adds arguments to the span. '''
+        self._args.update(args)
+
+    def __enter__(self):
+        self._start = time.time()
+        self._counter = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self._args['error'] = repr(exc_value)
+        self._recorder.complete(self._name, self._start, time.perf_counter() - self._counter, self._args)
+        return False
+
+class NullSpan:
+    ''' Shared no-op span returned while tracing is disabled. '''
+    __slots__ = ()
+
+    def set(self, **args) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NULL_SPAN = NullSpan()
+
+# active trace recorder; None while tracing is disabled
+_trace_recorder = None
+
+def get_trace_recorder():
+    ''' Returns the active trace recorder, or None while tracing is disabled. '''
+    return _trace_recorder
+
+def trace_span(name:str, **args):
+    ''' Returns a span context manager recording the enclosed block; a shared no-op while tracing is disabled. '''
+    if _trace_recorder is None:
+        return _NULL_SPAN
+    return TraceSpan(_trace_recorder, name, args)
+
+def enable_tracing(trace_file:str|None=None) -> TraceRecorder:
+    ''' Enables tracing into the trace file (default: 'Documents/UE/Data/mtouTrace.json'); returns the recorder. '''
+    global _trace_recorder
+    trace_file = trace_file or os.path.join(str(Path.home()), 'Documents', 'UE', 'Data', TRACE_FILE_NAME)
+    if _trace_recorder is None or _trace_recorder.get_trace_file() != trace_file:
+        disable_tracing()
+        _trace_recorder = TraceRecorder(trace_file)
+    return _trace_recorder
+
+def disable_tracing() -> None:
+    ''' Flushes the buffered events and disables tracing. '''
+    global _trace_recorder
+    if _trace_recorder is not None:
+        _trace_recorder.flush()
+    _trace_recorder = None
+
+def flush_tracing() -> None:
+    ''' Appends the buffered trace events to the trace file. '''
+    if _trace_recorder is not None:
+        _trace_recorder.flush()
+
+def toggle_tracing(enabled:bool|None=None) -> bool:
+    ''' Enables, disables or toggles tracing; returns the new state. '''
+    if enabled is None:
+        enabled = _trace_recorder is None
+    if enabled:
+        unreal.log(f'unrealLoader.py: Tracing into {enable_tracing().get_trace_file()}')
+    else:
+        disable_tracing()
+    return enabled
+
+# enable tracing with 'MTOU_TRACE': 1 for the default trace file, or a trace file path
+_trace_setting = os.environ.get('MTOU_TRACE', '').strip()
+if _trace_setting and _trace_setting.lower() not in ['0', 'false', 'off']:
+    enable_tracing(None if _trace_setting.lower() in ['1', 'true', 'on'] else _trace_setting)
+
+# shared data files, same protocol as the Maya exporter (Maya_Scripts/library/datafiles.py):
+# writers hold an advisory lock on '<file>.lock' and replace files atomically (temp file + fsync + rename)
+def try_lock(file) -> bool:
+    ''' Tries to lock the open lock file without blocking; returns True if locked. '''
+    try:
+        if os.name == 'nt':
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+def unlock(file) -> None:
+    ''' Releases the lock of the open lock file. '''
+    if os.name == 'nt':
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+@contextmanager
+def file_lock(file_path:str, timeout:float=LOCK_TIMEOUT):
+    ''' Holds the advisory lock of a shared data file for the enclosed block; raises TimeoutError after the timeout. '''
+    folder_path = os.path.dirname(file_path)
+    if folder_path and not os.path.exists(folder_path):
+        os.makedirs(folder_path, exist_ok=True)
+
+    with open(file_path + '.lock', 'a+b') as file:
+        deadline = time.monotonic() + timeout
+        delay = 0.005
+        while not try_lock(file):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f'Data file is locked by another session: {file_path}')
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)
+        # the lock file modification time marks the last session activity
+        os.utime(file_path + '.lock')
+        try:
+            yield
+        finally:
+            unlock(file)
+
+def atomic_write(file_path:str, text:str) -> None:
+    ''' Writes the whole file at once: temp file in the same folder, fsync, then rename over the file. '''
+    folder_path = os.path.dirname(file_path) or '.'
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path, exist_ok=True)
+
+    file_descriptor, temp_path = tempfile.mkstemp(dir=folder_path, prefix=f'.{os.path.basename(file_path)}.',
+                                                  suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(text.encode('utf-8'))
+            file.flush()
+            os.fsync(file.fileno())
+        # retried while a Windows reader holds the file open
+        for attempt in range(20):
+            try:
+                os.replace(temp_path, file_path)
+                break
+            except PermissionError:
+                if attempt == 19:
+                    raise
+                time.sleep(0.01 * (attempt + 1))
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def save_json_file(file_path:str, data) -> None:
+    ''' Saves a JSON data file atomically, under its lock. '''
+    with file_lock(file_path):
+        atomic_write(file_path, json.dumps(data, indent=4, sort_keys=True))
+
+def update_json_file(file_path:str, update, default=None):
+    ''' Read-modify-write of a JSON data file under its lock; update returns the data set to save. '''
+    with file_lock(file_path):
+        data = default
+        if os.path.exists(file_path):
+            with open(file_path, 'r') as file:
+                data = json.load(file)
+        data = update(data)
+        atomic_write(file_path, json.dumps(data, indent=4, sort_keys=True))
+    return data
+
+class SkeletonRegistry:
+    '''
+    Registry of the project's skeleton assets: skeleton name -> package path.
+    Built from Asset Registry metadata only (no asset is loaded) and kept current 
+    through the Asset Registry added, removed and renamed callbacks when available.
+    '''
+    def __init__(self, asset_registry) -> None:
+        self._asset_registry = asset_registry
+        self._skeleton_class = unreal.TopLevelAssetPath("/Script/Engine", "Skeleton") # type: ignore
+        self._skeletons = {}
+        self._dirty = True
+        self._listening = False
+
+        self.scan()
+        self._bind_callbacks()
+
+    def scan(self) -> None:
+        ''' Rebuilds the registry from the skeleton assets metadata in the content directory. '''
+        # create a filter to search only within the content directory 
+        asset_filter = unreal.ARFilter(class_paths=[self._skeleton_class], # type: ignore
+                                       package_paths=["/Game"], recursive_paths=True) 
+
+        skeletons = {}
+        # get and store skeleton asset names with their full package paths
+        with trace_span('SkeletonRegistry.scan') as span:
+            for asset_data in self._asset_registry.get_assets(asset_filter):
+                skeletons[str(asset_data.asset_name)] = str(asset_data.package_name)
+            span.set(skeletons=len(skeletons))
+
+        if skeletons != self._skeletons:
+            self._skeletons = skeletons
+            self._dirty = True
+
+    def _bind_callbacks(self) -> None:
+        ''' Binds the Asset Registry callbacks; without them the registry is rescanned on request. '''
+        callbacks = {'on_asset_added': self._on_asset_added,
+                     'on_asset_removed': self._on_asset_removed,
+                     'on_asset_renamed': self._on_asset_renamed}
+        if not all(hasattr(self._asset_registry, name) for name in callbacks):
+            return
+        for name, callback in callbacks.items():
+            getattr(self._asset_registry, name).add_callable(callback)
+        self._listening = True
+
+    def _is_skeleton(self, asset_data) -> bool:
+        ''' Returns True if the asset data belongs to a skeleton inside the content directory. '''
+        asset_class = asset_data.asset_class_path
+        return (str(asset_class.asset_name) == 'Skeleton' and str(asset_class.package_name) == '/Script/Engine'
+                and str(asset_data.package_name).startswith('/Game/'))
+
+    def _on_asset_added(self, asset_data) -> None:
+        if self._is_skeleton(asset_data):
+            self._skeletons[str(asset_data.asset_name)] = str(asset_data.package_name)
+            self._dirty = True
+
+    def _on_asset_removed(self, asset_data) -> None:
+        if self._is_skeleton(asset_data) and self._skeletons.pop(str(asset_data.asset_name), None):
+            self._dirty = True
+
+    def _on_asset_renamed(self, asset_data, old_object_path) -> None:
+        if not self._is_skeleton(asset_data):
+            return
+        # remove the skeleton stored under its previous object path
+        old_path = str(old_object_path).split('.')[0]
+        for name, package_path in list(self._skeletons.items()):
+            if package_path == old_path:
+                self._skeletons.pop(name)
+        self._skeletons[str(asset_data.asset_name)] = str(asset_data.package_name)
+        self._dirty = True
+
+    def get_skeletons(self) -> dict:
+        ''' Returns the skeletons data set: skeleton name -> package path. '''
+        if not self._listening:
+            self.scan()
+        return dict(self._skeletons)
+
+    def is_dirty(self) -> bool:
+        ''' Returns True if the skeletons changed since they were last saved. '''
+        if not self._listening:
+            self.scan()
+        return self._dirty
+
+    def invalidate(self) -> None:
+        ''' Rescans the skeletons and marks them to be saved again. '''
+        self.scan()
+        self._dirty = True
+
+    def set_saved(self) -> None:
+        ''' Marks the current skeletons as saved. '''
+        self._dirty = False
+
+# keep a single skeleton registry per editor session
+_skeleton_registry = None
+
+def get_skeleton_registry(asset_registry=None) -> SkeletonRegistry:
+    ''' Returns the editor session skeleton registry; builds it on first use. '''
+    global _skeleton_registry
+    if _skeleton_registry is None:
+        _skeleton_registry = SkeletonRegistry(asset_registry or unreal.AssetRegistryHelpers.get_asset_registry())
+    return _skeleton_registry
+
 class UnrealLoader:
     '''
     Class to handle Unreal Engine project paths & asset data. 
@@ -33,6 +400,10 @@ class UnrealLoader:
         ''' Returns user's documents path from system's home directory. '''
         return self._documents_path
 
+    def get_data_path(self) -> str:
+        ''' Returns the shared UE data path: 'Documents/UE/Data'. '''
+        return self._data_path
+
     def save_path_to_json(self) -> None:
         ''' Store current UE project path data set (JSON) into an absolute path in home directory.'''
         # check if the path exists, if it doesn't exists create it
@@ -44,33 +415,27 @@ class UnrealLoader:
         self.save_data(self._data_path, 'ue_data.json', self._ue_dict)
 
     def save_skeletons_to_json(self) -> None:
-        ''' Store all skeleton assets found in the project into the project's data (JSON) file. '''
-        # create a filter to search only within the content directory 
-        asset_filter = unreal.ARFilter(class_paths=[unreal.TopLevelAssetPath("/Script/Engine", "Skeleton")], # type: ignore
-                                       package_paths=["/Game"], recursive_paths=True) 
-        
-        # get all skeleton assets in the project
-        skeleton_asset_data = self._asset_registry.get_assets(asset_filter)
-        
-        skeleton_assets = {}
-        # get and store skeleton asset names with their full package paths
-        for asset_data in skeleton_asset_data:
-            asset = asset_data.get_asset()
-            asset_full_path = asset_data.package_name
-            asset_name = asset.get_name()
-            skeleton_assets[asset_name] = str(asset_full_path)      
-            
-        if skeleton_assets:
-            # load ue data set
-            data_file = os.path.join(self._data_path, 'ue_data.json')
-            with open(data_file, 'r') as file:
-                ue_data = json.load(file)
-            for skeleton in skeleton_assets:
-                unreal.log(f'Saving Skeleton: {skeleton}')
+        ''' 
+        Store all skeleton assets found in the project into the project's data (JSON) file.
+        Skeletons are read from the skeleton registry; the file is only written when they changed.
+        '''
+        registry = get_skeleton_registry(self._asset_registry)
+        with trace_span('UnrealLoader.check_skeletons'):
+            dirty = registry.is_dirty()
+        if not dirty:
+            return
+        skeleton_assets = registry.get_skeletons()
+        unreal.log(f'Saving {len(skeleton_assets)} Skeleton(s)')
+
+        def assign_skeletons(ue_data:dict) -> dict:
             # assign assets to skeletons data
             ue_data['Skeletons'] = skeleton_assets
-            # store skeleton assets into the ue data set
-            self.save_data(self._data_path, 'ue_data.json', ue_data)
+            return ue_data
+
+        # store skeleton assets into the ue data set; merged under the file lock
+        with trace_span('UnrealLoader.save_data', file='ue_data.json'):
+            update_json_file(os.path.join(self._data_path, 'ue_data.json'), assign_skeletons, default=dict(self._ue_dict))
+        registry.set_saved()
 
     def get_folder_assets(self, folder_path:str) -> list:
         ''' Returns a list of asset data inside the provided folder path. '''
@@ -78,177 +443,1011 @@ class UnrealLoader:
         return data_list
 
     def save_data(self, path:str, file_name:str, data) -> None:
-        ''' Saves data into a json file: must include a path to store data. '''
+        ''' 
+        Saves data into a json file: must include a path to store data.
+        The file is replaced atomically under its lock; safe with the Maya exporter sessions.
+        '''
         if not file_name.endswith('.json'):
             file_name+='.json'
 
-        with open(os.path.join(path, file_name), 'w') as file:
-            json.dump(data, file, indent=4, sort_keys=True)
+        with trace_span('UnrealLoader.save_data', file=file_name):
+            save_json_file(os.path.join(path, file_name), data)
+
+class ImportLedger:
+    '''
+    Persistent record of the files imported into the project.
+    Stored in the project's Saved folder; keyed by source file path with its size, 
+    modification time, content hash and import settings.
+    '''
+    def __init__(self) -> None:
+        # store the ledger inside the project's Saved folder
+        self._ledger_path = os.path.join(os.path.abspath(unreal.Paths.project_saved_dir()), 'MtoU')
+        self._file_name = 'importLedger.json'
+        self._entries = {}
+        self._changed = False
+
+        ledger_file = os.path.join(self._ledger_path, self._file_name)
+        if os.path.exists(ledger_file):
+            with trace_span('ImportLedger.load'):
+                with open(ledger_file, 'r') as file:
+                    self._entries = json.load(file)
+
+    @staticmethod
+    def get_file_hash(file_path:str) -> str:
+        ''' Returns the content hash of the provided file, read in chunks. '''
+        hasher = hashlib.blake2b(digest_size=20)
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024*1024), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def get_settings_hash(import_settings:dict) -> str:
+        ''' Returns the hash of the provided import settings data set. '''
+        settings = json.dumps(import_settings, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(settings, digest_size=20).hexdigest()
+
+    def is_current(self, file_path:str, import_settings:dict) -> bool:
+        ''' 
+        Returns True if the file was already imported at the same revision and settings.
+        The content hash is only computed when the file size or modification time changed.
+        '''
+        entry = self._entries.get(file_path.replace('\\', '/'))
+        if not entry or entry.get('settings') != self.get_settings_hash(import_settings):
+            return False
+
+        file_stat = os.stat(file_path)
+        if entry.get('size') == file_stat.st_size and entry.get('mtime') == file_stat.st_mtime:
+            return True
+        if entry.get('size') != file_stat.st_size:
+            return False
+
+        # file was rewritten; compare content
+        if entry.get('hash') != self.get_file_hash(file_path):
+            return False
+        entry['mtime'] = file_stat.st_mtime
+        self._changed = True
+        return True
+
+    def record(self, file_path:str, import_settings:dict) -> None:
+        ''' Stores the revision and import settings of a successfully imported file. '''
+        file_stat = os.stat(file_path)
+        self._entries[file_path.replace('\\', '/')] = {'size': file_stat.st_size, 
+                                                       'mtime': file_stat.st_mtime,
+                                                       'hash': self.get_file_hash(file_path),
+                                                       'settings': self.get_settings_hash(import_settings)}
+        self._changed = True
+
+    def save(self) -> None:
+        ''' Saves the ledger if any entry changed. '''
+        if not self._changed:
+            return
+        with trace_span('ImportLedger.save', entries=len(self._entries)):
+            save_json_file(os.path.join(self._ledger_path, self._file_name), self._entries)
+        self._changed = False
 
-def import_asset_type():
+class ImportJournal:
+    '''
+    Export job journal of an exporter session (Maya_Scripts/library/journal.py); JSON Lines of settings,
+    batch and ack records. Export batches stay pending until acknowledged once imported; acknowledged
+    batches and the settings records no pending batch references are compacted out of the journal.
+    '''
+    def __init__(self, journal_file:str) -> None:
+        self._journal_file = journal_file
+        self._settings = {}
+        self._batches = {}
+        self._acked = set()
+        self.load()
+
+    def get_journal_file(self) -> str:
+        ''' Returns the journal file. '''
+        return self._journal_file
+
+    def exists(self) -> bool:
+        ''' Returns True if the exporter session created the journal. '''
+        return os.path.exists(self._journal_file)
+
+    def load(self) -> None:
+        ''' Reads every complete record of the journal; an incomplete last line is being written. '''
+        self._settings.clear()
+        self._batches.clear()
+        self._acked.clear()
+        if not self.exists():
+            return
+
+        with trace_span('ImportJournal.load', file=os.path.basename(self._journal_file)):
+            with open(self._journal_file, 'rb') as file:
+                data = file.read()
+            for line in data[:data.rfind(b'\n') + 1].splitlines():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # skip damaged records
+                    continue
+                if record.get('type') == 'settings':
+                    self._settings[record['id']] = record.get('data') or {}
+                elif record.get('type') == 'batch':
+                    self._batches[record['id']] = record
+                elif record.get('type') == 'ack':
+                    self._acked.add(record['id'])
+
+    def get_pending_batches(self) -> list:
+        '''
+        Returns the batches left to import, oldest first, as (batch ID, export time, import data set).
+        Import data sets have the importSettings layout: importer type, then file name, then import settings.
+        '''
+        batches = []
+        for batch_id, record in self._batches.items():
+            if batch_id in self._acked:
+                continue
+            import_data = {BATCH_ID_KEY: batch_id}
+            for handler, files in (record.get('files') or {}).items():
+                import_data[handler] = {}
+                for file, settings_id in files.items():
+                    if settings_id not in self._settings:
+                        unreal.log_warning(f'unrealLoader.py: Import settings of {file} missing from the import journal.')
+                        continue
+                    import_data[handler][file] = dict(self._settings[settings_id])
+            batches.append((batch_id, record.get('time', 0.0), import_data))
+        return batches
+
+    def acknowledge(self, batch_ids:list) -> list:
+        '''
+        Acknowledges the imported batches of this journal, then compacts it; both under the journal lock,
+        so the exporter session cannot append in between. Returns the acknowledged batch IDs.
+        '''
+        with file_lock(self._journal_file):
+            # the exporter session may have appended since the journal was read
+            self.load()
+            batch_ids = [batch_id for batch_id in batch_ids if batch_id in self._batches and batch_id not in self._acked]
+            if not batch_ids:
+                return []
+            self._acked.update(batch_ids)
+            self.compact()
+        return batch_ids
+
+    def compact(self) -> None:
+        '''
+        Rewrites the journal atomically with the pending batches and their settings records only;
+        an emptied journal is removed. The caller holds the journal lock.
+        '''
+        pending = [record for batch_id, record in self._batches.items() if batch_id not in self._acked]
+        settings_ids = {settings_id for record in pending
+                        for files in (record.get('files') or {}).values() for settings_id in files.values()}
+        records = [{'type': 'settings', 'id': settings_id, 'data': self._settings[settings_id]}
+                   for settings_id in self._settings if settings_id in settings_ids]
+        records.extend(pending)
+
+        with trace_span('ImportJournal.compact', batches=len(pending)):
+            if records:
+                atomic_write(self._journal_file, ''.join(json.dumps(record, sort_keys=True) + '\n' for record in records))
+            elif self.exists():
+                # acknowledged batches are dropped with their records
+                os.remove(self._journal_file)
+        self._settings = {settings_id: self._settings[settings_id] for settings_id in settings_ids}
+        self._batches = {record['id']: record for record in pending}
+        self._acked.clear()
+
+def get_import_journals(data_path:str) -> list:
+    '''
+    Returns the journals of every exporter session in the shared data path, including the legacy single journal.
+    Lock files of sessions without journal, idle for longer than STALE_JOURNAL_AGE, are removed.
+    '''
+    name, extension = os.path.splitext(JOURNAL_FILE_NAME)
+    journal_files = sorted(glob.glob(os.path.join(glob.escape(data_path), f'{name}*{extension}')))
+
+    now = time.time()
+    for lock_file in glob.glob(os.path.join(glob.escape(data_path), f'{name}.*{extension}.lock')):
+        try:
+            if not os.path.exists(lock_file[:-len('.lock')]) and now - os.path.getmtime(lock_file) > STALE_JOURNAL_AGE:
+                os.remove(lock_file)
+        except OSError:
+            # in use by a running session
+            continue
+
+    return [ImportJournal(journal_file) for journal_file in journal_files]
+
+def acknowledge_batches(ue_loader:UnrealLoader, batch_ids:list) -> None:
+    ''' Acknowledges the imported export batches in the journals holding them. '''
+    batch_ids = [batch_id for batch_id in batch_ids if batch_id]
+    if not batch_ids:
+        return
+    for journal in get_import_journals(ue_loader.get_data_path()):
+        try:
+            journal.acknowledge(batch_ids)
+        except (TimeoutError, OSError) as e:
+            # batches stay queued; acknowledged with the next import
+            unreal.log_warning(f'unrealLoader.py: Cannot update the import journal {journal.get_journal_file()}: {e}')
+
+def build_import_parameters(import_settings:dict, handler:str):
     ''' 
-    Automates import based on the asset type import data set.
-    Task is managed by the active Interchange Manager.
+    Builds the Interchange import asset parameters of a single file from its import settings.
+    Generic pipeline properties are overridden based on the importer type (handler).
     '''
-    # get unreal's Interchange Manager singleton
-    interchange_manager=unreal.InterchangeManager.get_interchange_manager_scripted()
     # load Import Asset Parameters; enable automated and headless import
     asset_params=unreal.ImportAssetParameters(is_automated=True)
 
-    # load paths to retrieve external import data set
-    ue_loader = UnrealLoader()
-    ue_path = ue_loader.get_project_path_data()
-    data_file = os.path.join(ue_loader.get_documents_path(),'UE','Data','importSettings.json')
+    # load generic pipelines for public property overrides
+    generic_pipeline=unreal.InterchangeGenericAssetsPipeline()
+    generic_common_meshes=generic_pipeline.common_meshes_properties
+    generic_anim_pipeline=generic_pipeline.animation_pipeline
+    generic_mesh_anim_pipeline=generic_pipeline.common_skeletal_meshes_and_animations_properties
+    generic_mesh_pipeline=generic_pipeline.mesh_pipeline
+    generic_mat_pipeline=generic_pipeline.material_pipeline
+    generic_tex_pipeline=generic_mat_pipeline.texture_pipeline
 
-    if os.path.exists(data_file):
-        # load import data set
-        with open(data_file, 'r') as file:
-            import_data = json.load(file)
+    # load general import settings data values
+    use_source_name=import_settings.get('Use Source Name')
+    imp_materials=import_settings.get('Import Materials')
+    imp_textures=import_settings.get('Import Textures')
+    imp_static_mesh=import_settings.get('Import Static Mesh')
+    imp_skeletal_mesh=import_settings.get('Import Skeletal Mesh')
+    imp_animations=import_settings.get('Import Animations')
+    anim_range=import_settings.get('Animation Range')
 
-        # data sorter based on asset type; work in progress
-        if import_data.get('OBJ'):
-            unreal.log('Importing OBJ')
-            importer=import_data.get('OBJ')
-            handler='OBJ'
-        elif import_data.get('FBX'):
-            unreal.log('Importing FBX')
-            importer=import_data.get('FBX')
-            handler='FBX'
+    # evaluate if assets names will be set by file name or source file data name 
+    generic_pipeline.use_source_name_for_asset=use_source_name
+
+    # set common mesh properties based on import data
+    generic_common_meshes.auto_detect_mesh_type=True
+
+    # set import static and skeletal mesh bool properties based on import data
+    generic_mesh_pipeline.import_static_meshes=imp_static_mesh
+    generic_mesh_pipeline.import_skeletal_meshes=imp_skeletal_mesh
+    # evaluate if the asset's mesh contain pre-built collisions
+    generic_mesh_pipeline.collision=True
+
+    # set import materials bool property based on import data set value
+    generic_mat_pipeline.import_materials=imp_materials
+
+    # set import textures bool property based on import data set value
+    generic_tex_pipeline.import_textures=imp_textures
+    generic_tex_pipeline.allow_non_power_of_two=True
+
+    if handler=='FBX':
+        # set import animations bool property based on import data set value
+        generic_anim_pipeline.import_animations=imp_animations
+
+        if imp_animations:
+            # set animation range or value based on import animation data
+            if anim_range:
+                generic_anim_pipeline.animation_range=unreal.InterchangeAnimationRange.SET_RANGE
+                unreal.log(generic_anim_pipeline.animation_range)
+                start_range=anim_range[0]
+                end_range=anim_range[1]
+                # convert and set animation integer range to unreal Int32Interval
+                unreal_range=unreal.Int32Interval()
+                unreal_range.min=start_range
+                unreal_range.max=end_range
+                generic_anim_pipeline.frame_import_range=unreal_range
+            else:
+                # import entire timeline 
+                generic_anim_pipeline.animation_range=unreal.InterchangeAnimationRange.TIMELINE
+                unreal.log(generic_anim_pipeline.animation_range)
+            # set common skeletal mesh and anim configurations based on import data
+            generic_mesh_anim_pipeline.import_only_animations=import_settings.get('Import Only Animations') 
+        generic_mesh_anim_pipeline.import_meshes_in_bone_hierarchy=import_settings.get('Meshes in Bone Hierarchy')
+
+    if handler in ['FBX', 'GLTF']:
+        # glTF skins are read by Interchange without the FBX SDK; both can join an existing skeleton
+        skeleton_data=import_settings.get('Skeleton')
+        skeleton_asset=None
+        if not skeleton_data:
+            # if set, disable importing animations if no skeleton asset is found
+            generic_mesh_anim_pipeline.import_only_animations=False
+            skeleton_asset=None
+            unreal.log('generating new skeleton')
         else:
-            unreal.log_error('unrealLoader.py: No valid Importer Type is available.')
-        
-        for file in importer:
-            unreal.log(file)
-            # load individual import settings for file
-            import_settings=importer.get(file)
-
-            # load generic pipelines for public property overrides
-            generic_pipeline=unreal.InterchangeGenericAssetsPipeline()
-            generic_common_meshes=generic_pipeline.common_meshes_properties
-            generic_anim_pipeline=generic_pipeline.animation_pipeline
-            generic_mesh_anim_pipeline=generic_pipeline.common_skeletal_meshes_and_animations_properties
-            generic_mesh_pipeline=generic_pipeline.mesh_pipeline
-            generic_mat_pipeline=generic_pipeline.material_pipeline
-            generic_tex_pipeline=generic_mat_pipeline.texture_pipeline
-
-            # load and store import settings data string values
-            folder_path=import_settings.get('Folder Path').replace('\\', '/')
-            # store full file path using the current UE project 
-            asset_file_path = os.path.join(ue_path['Current Project'], 'Content', folder_path, file)
-            # store destination path in unreal's Content Browser
-            destination_path = f"/Game/{folder_path}"
-
-            # verify asset file does exists prior to import
-            if os.path.exists(asset_file_path):
-                # load general import settings data values
-                use_source_name=import_settings.get('Use Source Name')
-                imp_materials=import_settings.get('Import Materials')
-                imp_textures=import_settings.get('Import Textures')
-                imp_static_mesh=import_settings.get('Import Static Mesh')
-                imp_skeletal_mesh=import_settings.get('Import Skeletal Mesh')
-                imp_animations=import_settings.get('Import Animations')
-                anim_range=import_settings.get('Animation Range')
-
-                # create source data from stored file path
-                source_data=interchange_manager.create_source_data(asset_file_path)
-
-                # evaluate if assets names will be set by file name or source file data name 
-                generic_pipeline.use_source_name_for_asset=use_source_name
-
-                # set common mesh properties based on import data
-                generic_common_meshes.auto_detect_mesh_type=True
-
-                # set import static and skeletal mesh bool properties based on import data
-                generic_mesh_pipeline.import_static_meshes=imp_static_mesh
-                generic_mesh_pipeline.import_skeletal_meshes=imp_skeletal_mesh
-                # evaluate if the asset's mesh contain pre-built collisions
-                generic_mesh_pipeline.collision=True
-
-                # set import materials bool property based on import data set value
-                generic_mat_pipeline.import_materials=imp_materials
-
-                # set import textures bool property based on import data set value
-                generic_tex_pipeline.import_textures=imp_textures
-                generic_tex_pipeline.allow_non_power_of_two=True
-
-                if handler=='FBX':
-                    # set import animations bool property based on import data set value
-                    generic_anim_pipeline.import_animations=imp_animations
-
-                    if imp_animations:
-                        # set animation range or value based on import animation data
-                        if anim_range:
-                            generic_anim_pipeline.animation_range=unreal.InterchangeAnimationRange.SET_RANGE
-                            unreal.log(generic_anim_pipeline.animation_range)
-                            start_range=anim_range[0]
-                            end_range=anim_range[1]
-                            # convert and set animation integer range to unreal Int32Interval
-                            unreal_range=unreal.Int32Interval()
-                            unreal_range.min=start_range
-                            unreal_range.max=end_range
-                            generic_anim_pipeline.frame_import_range=unreal_range
-                        else:
-                            # import entire timeline 
-                            generic_anim_pipeline.animation_range=unreal.InterchangeAnimationRange.TIMELINE
-                            unreal.log(generic_anim_pipeline.animation_range)
-                        # set common skeletal mesh and anim configurations based on import data
-                        generic_mesh_anim_pipeline.import_only_animations=import_settings.get('Import Only Animations') 
-                    generic_mesh_anim_pipeline.import_meshes_in_bone_hierarchy=import_settings.get('Meshes in Bone Hierarchy')
-
-                    skeleton_data=import_settings.get('Skeleton')
-                    skeleton_asset=None
-                    if not skeleton_data:
-                        # if set, disable importing animations if no skeleton asset is found
-                        generic_mesh_anim_pipeline.import_only_animations=False
-                        skeleton_asset=None
-                        unreal.log('generating new skeleton')
-                    else:
-                        skeleton_asset = unreal.load_asset(skeleton_data)
-                        unreal.log(f'joining: {skeleton_asset}')
-                        # error handling for invalid skeleton asset
-                        if not skeleton_asset:
-                            unreal.log_warning(f'unrealLoader.py: Skeleton asset {skeleton_data} cannot be loaded, make sure skeleton asset is valid.')
-                            skeleton_asset=None
-                    unreal.log(skeleton_asset)
-                    # assign existing skeleton asset to newly imported skeletal meshes & animations
-                    generic_mesh_anim_pipeline.skeleton=skeleton_asset
-
-                if import_settings.get('Force Mesh Type'):
-                    # sort and set force mesh type property based on import data
-                    force_mesh_type=import_settings.get('Force Mesh Type')
-                    if force_mesh_type==0:
-                        generic_common_meshes.force_all_mesh_as_type=unreal.InterchangeForceMeshType.IFMT_NONE
-                    elif force_mesh_type==1:
-                        generic_common_meshes.force_all_mesh_as_type=unreal.InterchangeForceMeshType.IFMT_STATIC_MESH
-                    elif force_mesh_type==2:
-                        generic_common_meshes.force_all_mesh_as_type=unreal.InterchangeForceMeshType.IFMT_SKELETAL_MESH
-
-                # apply the same pipeline properties on reimport unless import data changes
-                generic_pipeline.reimport_strategy=unreal.ReimportStrategyFlags.APPLY_PIPELINE_PROPERTIES
-                unreal.log(generic_pipeline.reimport_strategy)
-
-                # use Interchange Import Data for setting generic and specialized asset pipelines
-                asset_import_data=unreal.InterchangeAssetImportData()
-                asset_import_data.set_pipelines([generic_pipeline,
-                                                 generic_mesh_anim_pipeline,
-                                                 generic_common_meshes,
-                                                 generic_mat_pipeline,
-                                                 generic_tex_pipeline,]) # pyright: ignore[reportArgumentType] 
-
-                # override Interchange default import asset parameters, parsing through loaded pipelines 
-                asset_params.override_pipelines=asset_import_data.get_pipelines()
-
-                # execute custom import 
-                interchange_manager.import_asset(destination_path, source_data,
-                                                asset_params)
-            
-                ue_loader.save_skeletons_to_json()
+            skeleton_asset = unreal.load_asset(skeleton_data)
+            unreal.log(f'joining: {skeleton_asset}')
+            # error handling for invalid skeleton asset
+            if not skeleton_asset:
+                unreal.log_warning(f'unrealLoader.py: Skeleton asset {skeleton_data} cannot be loaded, make sure skeleton asset is valid.')
+                skeleton_asset=None
+        unreal.log(skeleton_asset)
+        # assign existing skeleton asset to newly imported skeletal meshes & animations
+        generic_mesh_anim_pipeline.skeleton=skeleton_asset
+
+    if import_settings.get('Force Mesh Type'):
+        # sort and set force mesh type property based on import data
+        force_mesh_type=import_settings.get('Force Mesh Type')
+        if force_mesh_type==0:
+            generic_common_meshes.force_all_mesh_as_type=unreal.InterchangeForceMeshType.IFMT_NONE
+        elif force_mesh_type==1:
+            generic_common_meshes.force_all_mesh_as_type=unreal.InterchangeForceMeshType.IFMT_STATIC_MESH
+        elif force_mesh_type==2:
+            generic_common_meshes.force_all_mesh_as_type=unreal.InterchangeForceMeshType.IFMT_SKELETAL_MESH
+
+    # apply the same pipeline properties on reimport unless import data changes
+    generic_pipeline.reimport_strategy=unreal.ReimportStrategyFlags.APPLY_PIPELINE_PROPERTIES
+    unreal.log(generic_pipeline.reimport_strategy)
+
+    # use Interchange Import Data for setting generic and specialized asset pipelines
+    asset_import_data=unreal.InterchangeAssetImportData()
+    asset_import_data.set_pipelines([generic_pipeline,
+                                     generic_mesh_anim_pipeline,
+                                     generic_common_meshes,
+                                     generic_mat_pipeline,
+                                     generic_tex_pipeline,]) # pyright: ignore[reportArgumentType] 
+
+    # override Interchange default import asset parameters, parsing through loaded pipelines 
+    asset_params.override_pipelines=asset_import_data.get_pipelines()
+
+    return asset_params
+
+def convert_instance_transform(matrix:list) -> tuple:
+    '''
+    Converts an instance placement exported by Maya (row-major 4x4 matrix, 16 values, Maya world space)
+    into Unreal space. Returns the (location, rotation, scale) of the placed actor.
+    '''
+    axes=MAYA_TO_UE_AXES + [3]
+    # swapping Y and Z converts both the rows (basis vectors and origin) and the columns (their components)
+    planes=[unreal.Plane(*[matrix[axes[row] * 4 + axes[column]] for column in range(4)]) for row in range(4)]
+    ue_matrix=unreal.Matrix(*planes)
+    return ue_matrix.get_origin(), ue_matrix.get_rotator(), ue_matrix.get_scale_vector()
+
+def get_object_paths(imported_objects) -> list:
+    ''' Returns the asset paths of the objects reported by an Interchange import. '''
+    return [imported_object.get_path_name() for imported_object in imported_objects or [] if imported_object]
+
+def get_source_names(import_data:str) -> tuple:
+    ''' Returns the lowercase names of the source files recorded in an asset import data tag (JSON). '''
+    try:
+        source_files = json.loads(import_data) if import_data else []
+    except ValueError:
+        return ()
+    return tuple({os.path.basename(str(source_file.get('RelativeFilename', ''))).lower()
+                  for source_file in source_files if isinstance(source_file, dict)})
+
+def index_imported_assets(folder_assets:list, source_names:dict|None=None) -> dict:
+    '''
+    Returns the asset paths of folder assets keyed by the source file they were imported from (lowercase name).
+    Matched on the source files recorded in their import data (Asset Registry 'AssetImportData' tag),
+    so the asset names set by the import pipeline (source name, prefix or suffix) do not matter.
+    Parsed tags are kept in the optional source names cache: import data tag -> source names.
+    '''
+    source_names = {} if source_names is None else source_names
+    imported_assets = {}
+    for asset_data in folder_assets:
+        import_data = str(asset_data.get_tag_value('AssetImportData') or '')
+        if import_data not in source_names:
+            source_names[import_data] = get_source_names(import_data)
+        for source_name in source_names[import_data]:
+            imported_assets.setdefault(source_name, []).append(f'{asset_data.package_name}.{asset_data.asset_name}')
+    return imported_assets
+
+def get_imported_static_mesh(job:dict):
+    ''' Returns the static mesh imported by an import job (see 'ImportScheduler._complete'), if any. '''
+    for asset_path in job.get('assets') or []:
+        asset = unreal.EditorAssetLibrary.load_asset(asset_path)
+        if isinstance(asset, unreal.StaticMesh):
+            return asset
+    return None
+
+def place_instances(job:dict) -> int:
+    '''
+    Places an actor of the imported static mesh for every instance recorded by the exporter:
+    copies of the same mesh geometry are imported once and placed with their own transform.
+    Actors placed by an earlier import of the asset (same label) are moved instead.
+    Returns the number of placed actors.
+    '''
+    instances=job['settings'].get('Instances') or []
+    static_mesh=get_imported_static_mesh(job)
+    if static_mesh is None:
+        unreal.log_warning(f"unrealLoader.py: No static mesh imported from {job['file']}, {len(instances)} instance(s) not placed.")
+        return 0
 
+    actor_subsystem=unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    with trace_span('place_instances', file=job['file'], instances=len(instances)):
+        placed_actors={actor.get_actor_label(): actor for actor in actor_subsystem.get_all_level_actors()
+                       if isinstance(actor, unreal.StaticMeshActor)
+                       and actor.static_mesh_component.static_mesh==static_mesh}
+        for instance in instances:
+            location, rotation, scale=convert_instance_transform(instance['Transform'])
+            actor=placed_actors.get(instance['Name'])
+            if actor:
+                actor.set_actor_location_and_rotation(location, rotation, False, False)
             else:
-                unreal.log_warning(f'unrealLoader.py: {asset_file_path} cannot be located, make sure asset file path exists or is valid.')
+                actor=actor_subsystem.spawn_actor_from_object(static_mesh, location, rotation)
+            if actor:
+                actor.set_actor_scale3d(scale)
+                actor.set_actor_label(instance['Name'])
+    unreal.log(f"unrealLoader.py: Placed {len(instances)} instance(s) of {job['file']}")
+    return len(instances)
+
+def assign_lods(job:dict) -> int:
+    '''
+    Imports the LOD sidecar files written by the exporter ('<name>_LOD<n>.fbx', next to the source file)
+    into the LOD slots 1..n of the imported static mesh, replacing any existing LOD.
+    Returns the number of assigned LODs.
+    '''
+    lods=job['settings'].get('LODs') or []
+    static_mesh=get_imported_static_mesh(job)
+    if static_mesh is None:
+        unreal.log_warning(f"unrealLoader.py: No static mesh imported from {job['file']}, {len(lods)} LOD(s) not assigned.")
+        return 0
+
+    mesh_subsystem=unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+    source_folder=os.path.dirname(job['source'])
+    assigned=0
+    with trace_span('assign_lods', file=job['file'], lods=len(lods)):
+        for lod_index, lod in enumerate(lods, start=1):
+            lod_file=os.path.join(source_folder, lod['File'])
+            if not os.path.exists(lod_file):
+                unreal.log_warning(f'unrealLoader.py: LOD file {lod_file} not found.')
+                break
+            # LOD slots are filled in order; a missing LOD leaves the following ones out
+            if mesh_subsystem.import_lod(static_mesh, lod_index, lod_file) != lod_index:
+                unreal.log_warning(f'unrealLoader.py: LOD{lod_index} of {job["file"]} cannot be imported.')
+                break
+            assigned+=1
+    unreal.log(f"unrealLoader.py: Assigned {assigned} LOD(s) to {job['file']}")
+    return assigned
+
+def get_import_batches(ue_loader:UnrealLoader, import_data:dict|None=None) -> list:
+    '''
+    Returns the export batches to import as (batch ID, import data set) pairs.
+    The pending batches of every exporter session journal are read, in export order,
+    unless an import data set is provided (e.g. pushed by the exporter).
+    '''
+    if import_data is not None:
+        return [(import_data.get(BATCH_ID_KEY), import_data)]
+
+    journals = get_import_journals(ue_loader.get_data_path())
+    batches = sorted([batch for journal in journals for batch in journal.get_pending_batches()],
+                     key=lambda batch: batch[1])
+    if not batches:
+        unreal.log('unrealLoader.py: No export batch is queued in the import journals.')
+    return [(batch_id, import_data) for batch_id, _, import_data in batches]
+
+def create_import_jobs(ue_loader:UnrealLoader, ledger:ImportLedger, force_reimport:bool=False,
+                       import_data:dict|None=None, batches:list|None=None) -> list:
+    ''' 
+    Returns the import jobs of every new or changed file of the export batches (see get_import_batches).
+    A file queued by several batches is imported once, with the settings of its latest batch.
+    Each job stores the file, importer type, source file path, destination path, import settings
+    and the export batch ID.
+    '''
+    ue_path = ue_loader.get_project_path_data()
+    if batches is None:
+        batches = get_import_batches(ue_loader, import_data)
+    if not batches:
+        return []
+
+    import_jobs={}
+    for batch_id, batch_data in batches:
+        # data sorter based on asset type; work in progress
+        importers=[(handler, batch_data.get(handler)) for handler in IMPORTER_TYPES if batch_data.get(handler)]
+        if not importers:
+            unreal.log_error(f'unrealLoader.py: No valid Importer Type is available in batch {batch_id}.')
+
+        for handler, importer in importers:
+            for file in importer:
+                # load individual import settings for file
+                import_settings=importer.get(file)
+
+                # load and store import settings data string values
+                folder_path=import_settings.get('Folder Path').replace('\\', '/')
+                # store full file path using the current UE project 
+                asset_file_path = os.path.join(ue_path['Current Project'], 'Content', folder_path, file)
+                # store destination path in unreal's Content Browser
+                destination_path = f"/Game/{folder_path}"
+
+                # verify asset file does exists prior to import
+                if not os.path.exists(asset_file_path):
+                    unreal.log_warning(f'unrealLoader.py: {asset_file_path} cannot be located, make sure asset file path exists or is valid.')
+                    continue
+                # skip files already imported at the same revision and settings
+                if not force_reimport and ledger.is_current(asset_file_path, import_settings):
+                    unreal.log(f'unrealLoader.py: {file} is up to date, skipping import.')
+                    import_jobs.pop(asset_file_path, None)
+                    continue
+
+                # later batches replace the job of an earlier export
+                import_jobs.pop(asset_file_path, None)
+                import_jobs[asset_file_path]={'file': file, 'handler': handler, 'source': asset_file_path,
+                                              'destination': destination_path, 'settings': import_settings,
+                                              'batch_id': batch_id}
+
+    return list(import_jobs.values())
+
+class ImportScheduler:
+    '''
+    Non-blocking, time-sliced batch importer.
+    Queues the import jobs and advances on the editor tick within a per-frame time budget, 
+    keeping a bounded number of Interchange imports in flight. Shows a cancelable progress bar 
+    and logs the duration of every imported file. Failed imports are not recorded in the ledger.
+    Once finished, only the export batches whose every job was imported are acknowledged in the import journal;
+    batches with failed or cancelled jobs stay queued and are imported again on the next run.
+    '''
+    def __init__(self, import_jobs:list, ue_loader:UnrealLoader, ledger:ImportLedger,
+                 max_in_flight:int=4, frame_budget:float=0.008, on_finished=None,
+                 batch_ids:list|None=None) -> None:
+        # get unreal's Interchange Manager singleton
+        self._interchange_manager = unreal.InterchangeManager.get_interchange_manager_scripted()
+        self._ue_loader = ue_loader
+        self._ledger = ledger
+        self._jobs = list(import_jobs)
+        self._pending = list(import_jobs)
+        self._total = len(import_jobs)
+        self._in_flight = {}
+        self._results = []
+        # import data tag -> source names of the assets listed by the completion fallback
+        self._source_names = {}
+        self._max_in_flight = max(1, max_in_flight)
+        self._frame_budget = frame_budget
+        self._on_finished = on_finished
+        self._tick_handle = None
+        self._slow_task = None
+        self._start_time = 0.0
+        self._trace_start = 0.0
+        self._cancelled = False
+        # export batch IDs of the jobs, carried in the import journal or pushed data set
+        self._batch_ids = list(batch_ids or [])
+        for job in import_jobs:
+            if job.get('batch_id') and job['batch_id'] not in self._batch_ids:
+                self._batch_ids.append(job['batch_id'])
+        self._batch_id = self._batch_ids[-1] if self._batch_ids else None
+
+    def is_running(self) -> bool:
+        ''' Returns True while the scheduler is registered on the editor tick. '''
+        return self._tick_handle is not None
+
+    def get_results(self) -> list:
+        ''' Returns the finished import jobs with their duration and import state. '''
+        return self._results
+
+    def start(self) -> None:
+        ''' Shows the progress bar and registers the scheduler on the editor tick. '''
+        self._start_time = time.perf_counter()
+        self._trace_start = time.time()
+        recorder = get_trace_recorder()
+        if recorder:
+            # ends the flows started by the exporter; bound to the import batch span
+            for batch_id in self._batch_ids:
+                recorder.flow(batch_id, start=False, timestamp=self._trace_start)
+        # the slow task scope is kept open across ticks, until '_finish': its progress frames and cancel state
+        # span the whole queue, while the editor keeps ticking between frames.
+        # the delayed dialog is only shown for batches running longer than the delay
+        self._slow_task = unreal.ScopedSlowTask(self._total, 'Importing MtoU Assets')
+        self._slow_task.__enter__()
+        self._slow_task.make_dialog_delayed(PROGRESS_DIALOG_DELAY, True)
+        self._tick_handle = unreal.register_slate_post_tick_callback(self._tick)
+
+    def cancel(self) -> None:
+        ''' Drops every pending job; in flight imports are left to finish. '''
+        if self._pending:
+            unreal.log_warning(f'unrealLoader.py: Import cancelled, {len(self._pending)} file(s) not imported.')
+        self._pending.clear()
+        self._cancelled = True
+
+    def _dispatch(self, job:dict) -> None:
+        ''' Starts the Interchange import of a single job. '''
+        with trace_span('build_import_parameters', file=job['file'], handler=job['handler']):
+            asset_params = build_import_parameters(job['settings'], job['handler'])
+        job_id = job['source']
+        # Interchange calls back with the imported objects once the source file is imported; none if it failed
+        if hasattr(asset_params, 'on_assets_import_done'):
+            asset_params.on_assets_import_done.add_callable(
+                lambda imported_objects=None, *args: self._complete(job_id, get_object_paths(imported_objects)))
+
+        # create source data from stored file path
+        source_data = self._interchange_manager.create_source_data(job['source'])
+        job['start'] = time.perf_counter()
+        job['trace_start'] = time.time()
+        self._in_flight[job_id] = job
+
+        # execute custom import 
+        with trace_span('InterchangeManager.import_asset', file=job['file']):
+            imported = self._interchange_manager.import_asset(job['destination'], source_data, asset_params)
+        if not imported:
+            self._complete(job_id, [])
+
+    def _complete(self, job_id:str, assets:list) -> None:
+        '''
+        Stores the result of a finished import job, from the paths of its imported assets, and advances the progress bar.
+        A job without imported assets failed.
+        '''
+        job = self._in_flight.pop(job_id, None)
+        if not job:
+            return
+        imported = bool(assets)
+        job['duration'] = time.perf_counter() - job['start']
+        job['imported'] = imported
+        job['assets'] = list(assets)
+        self._results.append(job)
+        recorder = get_trace_recorder()
+        if recorder:
+            # imports overlap while in flight; recorded as async spans
+            recorder.async_span(f"Interchange import {job['file']}", job_id, job['trace_start'], job['duration'],
+                                {'handler': job['handler'], 'imported': imported, 'batch_id': job.get('batch_id')})
+        if imported:
+            self._ledger.record(job['source'], job['settings'])
+            # copies of the mesh exported as instances of this asset
+            if job['settings'].get('Place Instances') and job['settings'].get('Instances'):
+                place_instances(job)
+            # LODs simplified by the exporter, written as sidecar files
+            if job['settings'].get('LODs'):
+                assign_lods(job)
+        unreal.log(f"unrealLoader.py: {'Imported' if imported else 'Failed to import'} {job['file']} in {job['duration']:.2f}s")
+        if self._slow_task:
+            self._slow_task.enter_progress_frame(1, f"Importing MtoU Assets ({len(self._results)}/{self._total})")
+
+    def _tick(self, delta_time:float) -> None:
+        ''' Advances the queue within the frame time budget. '''
+        frame_start = time.perf_counter()
+
+        if self._slow_task and self._slow_task.should_cancel() and not self._cancelled:
+            self.cancel()
+
+        # without completion callbacks, in flight imports are done once Interchange is idle;
+        # an import succeeded only if assets of its destination folder were imported from its source file
+        if self._in_flight and not self._interchange_manager.is_interchange_active():
+            # each destination folder is listed and indexed once per tick
+            imported_assets = {}
+            for job_id, job in list(self._in_flight.items()):
+                if job['destination'] not in imported_assets:
+                    imported_assets[job['destination']] = index_imported_assets(
+                        self._ue_loader.get_folder_assets(job['destination']), self._source_names)
+                source_name = os.path.basename(job['source']).lower()
+                self._complete(job_id, imported_assets[job['destination']].get(source_name, []))
+
+        while (self._pending and len(self._in_flight) < self._max_in_flight
+               and time.perf_counter() - frame_start < self._frame_budget):
+            self._dispatch(self._pending.pop(0))
 
+        if not self._pending and not self._in_flight:
+            self._finish()
+
+    def _finish(self) -> None:
+        ''' Unregisters the tick callback, closes the progress bar and stores the project data. '''
+        unreal.unregister_slate_post_tick_callback(self._tick_handle)
+        self._tick_handle = None
+        if self._slow_task:
+            self._slow_task.__exit__(None, None, None)
+            self._slow_task = None
+
+        self._ledger.save()
+        self._ue_loader.save_skeletons_to_json()
+        # batches with failed or cancelled jobs stay queued in the import journal
+        incomplete = {job.get('batch_id') for job in self._jobs if not job.get('imported')}
+        acknowledge_batches(self._ue_loader, [batch_id for batch_id in self._batch_ids if batch_id not in incomplete])
+
+        imported = len([job for job in self._results if job.get('imported')])
+        duration = time.perf_counter() - self._start_time
+        unreal.log(f'unrealLoader.py: Imported {imported}/{self._total} file(s) in {duration:.2f}s')
+        recorder = get_trace_recorder()
+        if recorder:
+            recorder.complete('ImportScheduler.batch', self._trace_start, duration,
+                              {'batch_id': self._batch_id, 'files': self._total, 'imported': imported})
+        flush_tracing()
+        if self._on_finished:
+            self._on_finished(self)
+
+# keep a reference to the running scheduler; only one batch is imported at a time
+_active_scheduler = None
+
+def import_asset_type(force_reimport:bool=False, max_in_flight:int=4, on_finished=None,
+                      import_data:dict|None=None):
+    ''' 
+    Automates import of the export batches queued in the import journal, or of the provided data set.
+    Task is managed by the active Interchange Manager, advanced on the editor tick without blocking.
+    Files already imported at the same revision and settings are skipped unless force_reimport is set.
+    Returns the running ImportScheduler, or None if there is nothing to import.
+    '''
+    global _active_scheduler
+    if _active_scheduler and _active_scheduler.is_running():
+        unreal.log_warning('unrealLoader.py: An import batch is already running.')
+        return None
+
+    # load paths to retrieve the queued export batches
+    with trace_span('create_import_jobs', force_reimport=force_reimport) as span:
+        ue_loader = UnrealLoader()
+        ledger = ImportLedger()
+        batches = get_import_batches(ue_loader, import_data)
+        import_jobs = create_import_jobs(ue_loader, ledger, force_reimport=force_reimport, batches=batches)
+        span.set(batches=len(batches), jobs=len(import_jobs))
+    batch_ids = [batch_id for batch_id, _ in batches if batch_id]
+    if not import_jobs:
+        unreal.log('unrealLoader.py: No new or changed files to import.')
+        # nothing left to import from the queued batches
+        acknowledge_batches(ue_loader, batch_ids)
+        flush_tracing()
+        return None
+
+    _active_scheduler = ImportScheduler(import_jobs, ue_loader, ledger, max_in_flight=max_in_flight,
+                                        on_finished=on_finished, batch_ids=batch_ids)
+    _active_scheduler.start()
+    return _active_scheduler
+
+class ImportWatcher:
+    '''
+    Opt-in auto importer. Polls the import journal and the exported files of its pending batches at a low 
+    frequency on the editor tick; once a burst of exports settles, the batches are imported automatically.
+    '''
+    def __init__(self, poll_interval:float=2.0, settle_time:float=3.0) -> None:
+        self._data_path = UnrealLoader().get_data_path()
+        self._poll_interval = poll_interval
+        self._settle_time = settle_time
+        self._elapsed = 0.0
+        self._tick_handle = None
+        self._data_stamp = None
+        self._signature = None
+        self._changed_time = 0.0
+        self._imported_signature = None
+
+    def is_running(self) -> bool:
+        ''' Returns True while the watcher is registered on the editor tick. '''
+        return self._tick_handle is not None
+
+    def start(self) -> None:
+        ''' Registers the watcher; the current data set is treated as already imported. '''
+        if self.is_running():
+            return
+        self._imported_signature = self._get_signature()
+        self._signature = self._imported_signature
+        self._tick_handle = unreal.register_slate_post_tick_callback(self._tick)
+        unreal.log('unrealLoader.py: Auto import enabled.')
+
+    def stop(self) -> None:
+        ''' Unregisters the watcher. '''
+        if not self.is_running():
+            return
+        unreal.unregister_slate_post_tick_callback(self._tick_handle)
+        self._tick_handle = None
+        unreal.log('unrealLoader.py: Auto import disabled.')
+
+    @staticmethod
+    def _get_stamp(file_path:str):
+        ''' Returns the modification time and size of a file, or None if missing. '''
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (file_stat.st_mtime, file_stat.st_size)
+
+    def _get_signature(self):
+        ''' 
+        Returns the stamps of the import journal and every exported file of its pending batches.
+        Returns None if the journal is missing, has no pending batch or lists missing files.
+        '''
+        name, extension = os.path.splitext(JOURNAL_FILE_NAME)
+        journal_files = sorted(glob.glob(os.path.join(glob.escape(self._data_path), f'{name}*{extension}')))
+        data_stamp = tuple((journal_file, self._get_stamp(journal_file)) for journal_file in journal_files)
+        if not data_stamp:
+            return None
+        # reuse the previous signature while the data set is untouched
+        if data_stamp == self._data_stamp and self._signature is not None:
+            file_stamps = self._signature[1:]
+        else:
+            try:
+                batches = [batch for journal in get_import_journals(self._data_path)
+                           for batch in journal.get_pending_batches()]
+            except OSError:
+                return None
+            project_path = UnrealLoader().get_project_path_data()['Current Project']
+            file_stamps = set()
+            for _, _, import_data in batches:
+                for handler in IMPORTER_TYPES:
+                    for file_name, import_settings in (import_data.get(handler) or {}).items():
+                        folder_path = import_settings.get('Folder Path', '').replace('\\', '/')
+                        file_stamps.add(os.path.join(project_path, 'Content', folder_path, file_name))
+            file_stamps = [(file_path, None) for file_path in sorted(file_stamps)]
+        self._data_stamp = data_stamp
+        if not file_stamps:
+            # every batch is imported
+            return None
+
+        signature = [data_stamp]
+        for file_path, _ in file_stamps:
+            file_stamp = self._get_stamp(file_path)
+            if file_stamp is None:
+                return None
+            signature.append((file_path, file_stamp))
+        return tuple(signature)
+
+    def _tick(self, delta_time:float) -> None:
+        ''' Polls the exported data at the watcher interval; imports once the changes settle. '''
+        self._elapsed += delta_time
+        if self._elapsed < self._poll_interval:
+            return
+        self._elapsed = 0.0
+
+        signature = self._get_signature()
+        now = time.monotonic()
+        if signature != self._signature:
+            # new writes; restart the debounce window
+            self._signature = signature
+            self._changed_time = now
+            return
+
+        if signature is None or signature == self._imported_signature:
+            return
+        if now - self._changed_time < self._settle_time:
+            return
+        if _active_scheduler and _active_scheduler.is_running():
+            return
+
+        self._imported_signature = signature
+        unreal.log('unrealLoader.py: Exported files changed, importing automatically.')
+        import_asset_type()
+
+# keep a reference to the auto import watcher; disabled by default
+_import_watcher = None
+
+def toggle_auto_import(enabled:bool|None=None) -> bool:
+    ''' Enables, disables or toggles the auto import watcher; returns the new state. '''
+    global _import_watcher
+    if _import_watcher is None:
+        _import_watcher = ImportWatcher()
+    if enabled is None:
+        enabled = not _import_watcher.is_running()
+
+    if enabled:
+        _import_watcher.start()
     else:
-        unreal.log_warning('unrealLoader.py: Custom Import settings data set has not been generated or cannot be located.')
+        _import_watcher.stop()
+    return enabled
+
+class TransportServer:
+    '''
+    Localhost server for export batches pushed by the Maya exporter (Maya_Scripts/library/transport.py).
+    Polled without blocking on the editor tick; every batch is acknowledged, imported, 
+    and answered with the per-file import results and timings.
+    Messages are JSON objects, one per line. Outgoing messages are queued per connection and flushed
+    with non-blocking sends on the tick, so an exporter that stops reading never stalls the editor.
+    '''
+    def __init__(self, host:str='127.0.0.1', port:int|None=None) -> None:
+        self._address = (host, port or int(os.environ.get('MTOU_PORT', 52173)))
+        self._sock = None
+        self._tick_handle = None
+        self._connections = {}
+        self._outgoing = {}
+        self._batches = []
+        self._current = None
+
+    def is_running(self) -> bool:
+        ''' Returns True while the server is listening. '''
+        return self._sock is not None
+
+    def start(self) -> None:
+        ''' Binds the listening socket and registers the server on the editor tick. '''
+        if self.is_running():
+            return
+        try:
+            self._sock = socket.create_server(self._address)
+        except OSError as e:
+            unreal.log_warning(f'unrealLoader.py: Transport server cannot listen on port {self._address[1]}: {e}')
+            self._sock = None
+            return
+        self._sock.setblocking(False)
+        self._tick_handle = unreal.register_slate_post_tick_callback(self._tick)
+        unreal.log(f'unrealLoader.py: Transport server listening on port {self._address[1]}.')
+
+    def stop(self) -> None:
+        ''' Closes every connection and the listening socket. '''
+        if not self.is_running():
+            return
+        unreal.unregister_slate_post_tick_callback(self._tick_handle)
+        self._tick_handle = None
+        for connection in list(self._connections):
+            connection.close()
+        self._connections.clear()
+        self._outgoing.clear()
+        self._sock.close()
+        self._sock = None
+        unreal.log('unrealLoader.py: Transport server stopped.')
+
+    def _send(self, connection, message:dict) -> None:
+        ''' Queues a message to the exporter and sends as much of it as the socket takes right away. '''
+        self._outgoing.setdefault(connection, bytearray()).extend((json.dumps(message) + '\n').encode('utf-8'))
+        self._flush(connection)
+
+    def _flush(self, connection) -> None:
+        ''' Sends the queued bytes of a connection without blocking; the rest is sent on later ticks. '''
+        pending = self._outgoing.get(connection)
+        try:
+            while pending:
+                sent = connection.send(pending)
+                del pending[:sent]
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._close(connection)
+            return
+        self._outgoing.pop(connection, None)
+
+    def _close(self, connection) -> None:
+        self._connections.pop(connection, None)
+        self._outgoing.pop(connection, None)
+        connection.close()
+
+    def _tick(self, delta_time:float) -> None:
+        ''' Accepts connections, reads complete messages, flushes queued replies and starts queued batches. '''
+        readable, writable, _ = select.select([self._sock, *self._connections], list(self._outgoing), [], 0)
+        for sock in writable:
+            self._flush(sock)
+        for sock in readable:
+            if sock is not self._sock and sock not in self._connections:
+                # closed while flushing
+                continue
+            if sock is self._sock:
+                try:
+                    connection, _ = self._sock.accept()
+                except OSError:
+                    # the exporter disconnected before the connection was accepted
+                    continue
+                connection.setblocking(False)
+                self._connections[connection] = bytearray()
+                continue
+            try:
+                data = sock.recv(65536)
+            except OSError:
+                data = b''
+            if not data:
+                self._close(sock)
+                continue
+            buffer = self._connections[sock]
+            buffer.extend(data)
+            while b'\n' in buffer:
+                line, _, rest = bytes(buffer).partition(b'\n')
+                buffer[:] = rest
+                self._receive(sock, line)
+
+        if self._current is None and self._batches:
+            self._start_batch(*self._batches.pop(0))
+
+    def _receive(self, connection, line:bytes) -> None:
+        ''' Acknowledges and queues an export batch message. '''
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return
+        if message.get('type') != 'export_batch':
+            return
+        batch_id = message.get('batch_id')
+        unreal.log(f'unrealLoader.py: Received export batch {batch_id}.')
+        self._send(connection, {'type': 'accepted', 'batch_id': batch_id})
+        self._batches.append((connection, batch_id, message.get('import_data') or {}))
+
+    def _start_batch(self, connection, batch_id:str, import_data:dict) -> None:
+        ''' Imports a batch; the exporter is answered once the import scheduler finishes. '''
+        if _active_scheduler and _active_scheduler.is_running():
+            # wait for the running import batch
+            self._batches.insert(0, (connection, batch_id, import_data))
+            return
+
+        start_time = time.perf_counter()
+        self._current = batch_id
+
+        def batch_done(scheduler):
+            results = [{'file': job['file'], 'imported': job.get('imported', False), 
+                        'duration': job.get('duration', 0.0)} for job in scheduler.get_results()] if scheduler else []
+            self._current = None
+            if connection in self._connections:
+                self._send(connection, {'type': 'import_done', 'batch_id': batch_id, 'results': results,
+                                        'duration': time.perf_counter() - start_time})
+
+        if import_asset_type(import_data=import_data, on_finished=batch_done) is None:
+            # nothing new or changed to import
+            batch_done(None)
+
+# keep a reference to the transport server; disabled by default
+_transport_server = None
+
+def toggle_transport_server(enabled:bool|None=None) -> bool:
+    ''' Starts, stops or toggles the transport server; returns the new state. '''
+    global _transport_server
+    if _transport_server is None:
+        _transport_server = TransportServer()
+    if enabled is None:
+        enabled = not _transport_server.is_running()
+
+    if enabled:
+        _transport_server.start()
+    else:
+        _transport_server.stop()
+    return _transport_server.is_running()
 
 def create_imported_asset_data(ue_loader:UnrealLoader, folder_path:str):
     ''' 
@@ -297,6 +1496,8 @@ def run_loader():
     ''' Runs the main UnrealLoader functions to store project data: path and skeletons. '''
     ue_loader = UnrealLoader()
     ue_loader.save_path_to_json()
+    # path data overwrites the data set; store the skeletons again
+    get_skeleton_registry().invalidate()
     ue_loader.save_skeletons_to_json()
 
 def create_loader_toolbar():
@@ -326,6 +1527,45 @@ def create_loader_toolbar():
         
         toolbar.add_menu_entry("ImportAssetsWithSettings", entryImport)
 
+        # add force reimport button entry
+        entryReimport = unreal.ToolMenuEntry(name="ForceReimportAssetsWithSettings",
+                                             type=unreal.MultiBlockType.TOOL_BAR_BUTTON)
+        entryReimport.set_label("Force Reimport")
+        entryReimport.set_tool_tip("Reimports every asset using external settings, including unchanged files")
+        entryReimport.set_icon("EditorStyle", "Icons.Refresh") # load reimport icon
+
+        # set force reimport asset command 
+        entryReimport.set_string_command(type=unreal.ToolMenuStringCommandType.PYTHON, custom_type="",
+                                         string="import unrealLoader; unrealLoader.import_asset_type(force_reimport=True)")
+        
+        toolbar.add_menu_entry("ForceReimportAssetsWithSettings", entryReimport)
+
+        # add auto import toggle button entry
+        entryAutoImport = unreal.ToolMenuEntry(name="ToggleAutoImport",
+                                               type=unreal.MultiBlockType.TOOL_BAR_BUTTON)
+        entryAutoImport.set_label("Auto Import")
+        entryAutoImport.set_tool_tip("Toggles automatic import of new Maya exports (disabled by default)")
+        entryAutoImport.set_icon("EditorStyle", "Icons.Visible") # load auto import icon
+
+        # set auto import toggle command 
+        entryAutoImport.set_string_command(type=unreal.ToolMenuStringCommandType.PYTHON, custom_type="",
+                                           string="import unrealLoader; unrealLoader.toggle_auto_import()")
+        
+        toolbar.add_menu_entry("ToggleAutoImport", entryAutoImport)
+
+        # add transport server toggle button entry
+        entryTransport = unreal.ToolMenuEntry(name="ToggleTransportServer",
+                                              type=unreal.MultiBlockType.TOOL_BAR_BUTTON)
+        entryTransport.set_label("Maya Link")
+        entryTransport.set_tool_tip("Toggles the localhost server receiving export batches from Maya (disabled by default)")
+        entryTransport.set_icon("EditorStyle", "Icons.Link") # load transport icon
+
+        # set transport server toggle command 
+        entryTransport.set_string_command(type=unreal.ToolMenuStringCommandType.PYTHON, custom_type="",
+                                          string="import unrealLoader; unrealLoader.toggle_transport_server()")
+        
+        toolbar.add_menu_entry("ToggleTransportServer", entryTransport)
+
         # add reload button entry
         entryStore = unreal.ToolMenuEntry(name="StoreCurrentProjectData",
                                           type=unreal.MultiBlockType.TOOL_BAR_BUTTON)
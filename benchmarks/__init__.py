@@ -0,0 +1 @@
+# Performance benchmark suite: synthetic scenes, maya and unreal stand-ins and a baseline runner.
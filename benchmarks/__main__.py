@@ -0,0 +1,4 @@
+from .runner import main
+import sys
+
+sys.exit(main())
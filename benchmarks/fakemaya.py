@@ -0,0 +1,427 @@
+from .stats import stats, counted
+import types
+import sys
+
+# Lightweight maya.cmds / maya.api.OpenMaya stand-ins over a synthetic scene.
+# Only the calls used by the plugin are modelled; any other maya.cmds command is a counted no-op.
+
+_scene = None
+_selection = []
+_playback = {'min': 1.0, 'max': 120.0}
+_undo = {'state': True, 'chunks': 0}
+_fbx_bake = {'enabled': False, 'start': None, 'end': None}
+
+def set_scene(scene) -> None:
+    ''' Sets the synthetic scene the stand-ins operate on. '''
+    global _scene
+    _scene = scene
+    _selection.clear()
+    _fbx_bake.update({'enabled': False, 'start': None, 'end': None})
+
+def get_name(node:str) -> str:
+    ''' Returns the short name of a node name or full path. '''
+    return node.rsplit('|', 1)[-1]
+
+def get_node(node:str):
+    ''' Returns the scene node of a node name or full path; raises like Maya on missing nodes. '''
+    scene_node = _scene.nodes.get(get_name(node))
+    if scene_node is None:
+        raise ValueError(f'No object matches name: {node}')
+    return scene_node
+
+def as_list(nodes) -> list:
+    ''' Returns the node argument as a list. '''
+    if nodes is None:
+        return []
+    if isinstance(nodes, str):
+        return [nodes]
+    return list(nodes)
+
+def format_nodes(names:list, full_path:bool=False) -> list:
+    ''' Returns node names, or full paths when requested. '''
+    return [_scene.full_path(name) for name in names] if full_path else list(names)
+
+def is_type(node, node_type) -> bool:
+    ''' Returns True if the node matches the type filter (a type or list of types). '''
+    if node_type is None:
+        return True
+    if isinstance(node_type, str):
+        node_type = [node_type]
+    return node.type in node_type
+
+def iter_descendants(name:str):
+    ''' Yields the node descendants, depth first. '''
+    for child in _scene.nodes[name].children:
+        yield child
+        yield from iter_descendants(child)
+
+# maya.cmds stand-ins
+@counted('cmds.ls')
+def ls(*args, type=None, selection=False, sl=False, assemblies=False, long=False, **kwargs):
+    if selection or sl:
+        names = [get_name(node) for node in _selection]
+    elif assemblies:
+        names = _scene.get_assemblies()
+    elif args:
+        names = [get_name(node) for node in as_list(args[0]) if get_name(node) in _scene.nodes]
+    else:
+        names = list(_scene.nodes)
+    return format_nodes([name for name in names if is_type(_scene.nodes[name], type)], long)
+
+@counted('cmds.listRelatives')
+def listRelatives(*args, parent=False, shapes=False, children=False, allDescendents=False,
+                  fullPath=False, type=None, **kwargs):
+    relatives = []
+    for node in as_list(args[0] if args else None):
+        scene_node = get_node(node)
+        if parent:
+            relatives.extend([scene_node.parent] if scene_node.parent else [])
+        elif allDescendents:
+            relatives.extend(iter_descendants(scene_node.name))
+        else:
+            relatives.extend([child for child in scene_node.children
+                              if not shapes or _scene.nodes[child].type == 'mesh'])
+    relatives = [name for name in relatives if is_type(_scene.nodes[name], type)]
+    # Maya returns None when nothing is found
+    return format_nodes(relatives, fullPath) or None
+
+@counted('cmds.nodeType')
+def nodeType(node=None, **kwargs):
+    # like Maya, the first node of a list, or the first selected node when none is given
+    nodes = as_list(node) or _selection
+    return get_node(nodes[0]).type if nodes else None
+
+@counted('cmds.listConnections')
+def listConnections(*args, type=None, source=True, destination=True, **kwargs):
+    connections = []
+    for node in as_list(args[0] if args else None):
+        connections.extend([name for name in get_node(node).connections if is_type(_scene.nodes[name], type)])
+    return connections or None
+
+@counted('cmds.objExists')
+def objExists(node):
+    return get_name(node) in _scene.nodes
+
+@counted('cmds.select')
+def select(*args, clear=False, cl=False, add=False, deselect=False, **kwargs):
+    nodes = as_list(args[0] if args else None)
+    if clear or cl:
+        _selection.clear()
+    elif deselect:
+        for node in nodes:
+            if node in _selection:
+                _selection.remove(node)
+    elif add:
+        _selection.extend(nodes)
+    else:
+        _selection[:] = nodes
+
+@counted('cmds.xform')
+def xform(node, query=False, translation=False, rotatePivot=False, **kwargs):
+    scene_node = get_node(node)
+    if query:
+        return list(scene_node.translation)
+    if translation:
+        scene_node.translation = list(translation)
+
+@counted('cmds.move')
+def move(x, y, z, *args, **kwargs):
+    for node in as_list(args[0] if args else _selection):
+        get_node(node).translation = [x, y, z]
+
+@counted('cmds.playbackOptions')
+def playbackOptions(query=False, edit=False, minTime=False, maxTime=False, min=None, max=None, **kwargs):
+    if query:
+        return _playback['min'] if minTime else _playback['max']
+    if min is not None:
+        _playback['min'] = float(min)
+    if max is not None:
+        _playback['max'] = float(max)
+
+@counted('cmds.undoInfo')
+def undoInfo(query=False, state=None, openChunk=False, closeChunk=False, **kwargs):
+    if query:
+        return _undo['state']
+    if state is not None:
+        _undo['state'] = bool(state)
+    if openChunk:
+        _undo['chunks'] += 1
+    if closeChunk:
+        _undo['chunks'] -= 1
+
+@counted('cmds.pluginInfo')
+def pluginInfo(*args, **kwargs):
+    return True
+
+@counted('cmds.warning')
+def warning(*args, **kwargs):
+    pass
+
+def record_bake(start, end) -> None:
+    '''
+    Records a 'cmds.bake_pass' call per bake and a 'cmds.bake_frame' call per baked frame:
+    every bake pays a fixed graph evaluation setup, then grows with the frame range.
+    '''
+    stats.record('cmds.bake_pass')
+    for _ in range(int(end) - int(start) + 1):
+        stats.record('cmds.bake_frame')
+
+@counted('cmds.bakeResults')
+def bakeResults(*args, time=None, **kwargs):
+    start, end = time if time else (_playback['min'], _playback['max'])
+    record_bake(start, end)
+
+@counted('cmds.FBXExportBakeComplexAnimation')
+def FBXExportBakeComplexAnimation(flag, value):
+    _fbx_bake['enabled'] = bool(value)
+
+@counted('cmds.FBXExportBakeComplexStart')
+def FBXExportBakeComplexStart(flag, value):
+    _fbx_bake['start'] = value
+
+@counted('cmds.FBXExportBakeComplexEnd')
+def FBXExportBakeComplexEnd(flag, value):
+    _fbx_bake['end'] = value
+
+@counted('cmds.FBXExport')
+def FBXExport(*args):
+    # the FBX exporter bakes the animation of every export with baking enabled
+    if _fbx_bake['enabled']:
+        start = _fbx_bake['start'] if _fbx_bake['start'] is not None else _playback['min']
+        end = _fbx_bake['end'] if _fbx_bake['end'] is not None else _playback['max']
+        record_bake(start, end)
+
+def cmds_getattr(name:str):
+    ''' Any other command is a counted no-op (FBX commands, bakeResults, undo, file...). '''
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return counted(f'cmds.{name}')(lambda *args, **kwargs: None)
+
+# maya.api.OpenMaya stand-ins
+class MFn():
+    kTransform = 'transform'
+    kJoint = 'joint'
+    kMesh = 'mesh'
+    kSkinClusterFilter = 'skinCluster'
+    kInvalid = None
+
+class MSpace():
+    kTransform = 1
+    kObject = 2
+    kWorld = 4
+
+class MObject():
+    def __init__(self, name:str|None=None):
+        self.name = name
+
+class MDagPath():
+    def __init__(self, name:str|None=None):
+        if isinstance(name, MDagPath):
+            name = name.name
+        self.name = name
+
+    @counted('om.MDagPath.fullPathName')
+    def fullPathName(self):
+        return _scene.full_path(self.name)
+
+    @counted('om.MDagPath.partialPathName')
+    def partialPathName(self):
+        return self.name
+
+    def node(self):
+        return MObject(self.name)
+
+    def hasFn(self, fn_type):
+        return _scene.nodes[self.name].type == fn_type
+
+    def exclusiveMatrixInverse(self):
+        # synthetic parents are never rotated nor scaled
+        return MMatrix()
+
+class MMatrix():
+    ''' Identity matrix; the synthetic scene has no rotation nor scale. '''
+
+class MVector():
+    def __init__(self, *args):
+        values = list(args[0]) if len(args) == 1 else list(args) or [0.0, 0.0, 0.0]
+        self.x, self.y, self.z = [float(value) for value in values]
+
+    def __iter__(self):
+        return iter([self.x, self.y, self.z])
+
+    def __sub__(self, other):
+        return MVector(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, matrix):
+        return MVector(self)
+
+class MPlug():
+    def __init__(self, node:str, attribute:str):
+        self.node = node
+        self.attribute = attribute
+
+class MFnTransform():
+    def __init__(self, path=None):
+        self._name = path.name if path is not None else None
+
+    @counted('om.MFnTransform.rotatePivot')
+    def rotatePivot(self, space=0):
+        # synthetic pivots sit at the node translation
+        return MVector(_scene.nodes[self._name].translation)
+
+    @counted('om.MFnTransform.translation')
+    def translation(self, space=0):
+        return MVector(_scene.nodes[self._name].translation)
+
+    def findPlug(self, attribute, want_networked_plug=False):
+        return MPlug(self._name, attribute)
+
+class MDGModifier():
+    ''' Batches translate plug edits; undoIt restores the previous values. '''
+    _AXES = {'translateX': 0, 'translateY': 1, 'translateZ': 2}
+
+    def __init__(self):
+        self._edits = []
+        self._previous = []
+
+    def newPlugValueDouble(self, plug, value):
+        self._edits.append((plug, float(value)))
+
+    @counted('om.MDGModifier.doIt')
+    def doIt(self):
+        for plug, value in self._edits:
+            translation = _scene.nodes[plug.node].translation
+            axis = self._AXES[plug.attribute]
+            self._previous.append((plug, translation[axis]))
+            translation[axis] = value
+
+    @counted('om.MDGModifier.undoIt')
+    def undoIt(self):
+        for plug, value in reversed(self._previous):
+            _scene.nodes[plug.node].translation[self._AXES[plug.attribute]] = value
+        self._previous.clear()
+
+class MSelectionList():
+    def __init__(self):
+        self._items = []
+
+    @counted('om.MSelectionList.add')
+    def add(self, node):
+        self._items.append(get_node(node).name)
+
+    def getDagPath(self, index):
+        return MDagPath(self._items[index])
+
+    def getDependNode(self, index):
+        return MObject(self._items[index])
+
+class MItDag():
+    kDepthFirst = 0
+    kBreadthFirst = 1
+
+    def __init__(self, traversal=0, filter_type=None):
+        # the plugin always resets the iterator to a root path
+        self._paths = []
+        self._index = 0
+
+    @counted('om.MItDag.reset')
+    def reset(self, root, traversal=0, filter_type=None):
+        names = [root.name, *iter_descendants(root.name)]
+        self._paths = [name for name in names if filter_type is None or _scene.nodes[name].type == filter_type]
+        self._index = 0
+
+    def isDone(self):
+        return self._index >= len(self._paths)
+
+    @counted('om.MItDag.next')
+    def next(self):
+        self._index += 1
+
+    def getPath(self):
+        return MDagPath(self._paths[self._index])
+
+    def fullPathName(self):
+        return _scene.full_path(self._paths[self._index])
+
+    def currentItem(self):
+        return MObject(self._paths[self._index])
+
+class MItDependencyNodes():
+    def __init__(self, filter_type=None):
+        self._nodes = [name for name, node in _scene.nodes.items() if filter_type is None or node.type == filter_type]
+        self._index = 0
+
+    def isDone(self):
+        return self._index >= len(self._nodes)
+
+    @counted('om.MItDependencyNodes.next')
+    def next(self):
+        self._index += 1
+
+    def thisNode(self):
+        return MObject(self._nodes[self._index])
+
+class MFnDependencyNode():
+    def __init__(self, node=None):
+        self._name = node.name if node is not None else None
+
+    def name(self):
+        return self._name
+
+class MFnDagNode(MFnDependencyNode):
+    isIntermediateObject = False
+
+# maya.api.OpenMayaAnim stand-ins
+class MFnSkinCluster(MFnDependencyNode):
+    @counted('oma.MFnSkinCluster.influenceObjects')
+    def influenceObjects(self):
+        return [MDagPath(joint) for joint in _scene.nodes[self._name].influences]
+
+def api_getattr(name:str):
+    ''' API classes that are not modelled exist for annotations only; using them raises. '''
+    if name.startswith('__'):
+        raise AttributeError(name)
+    def unmodelled(*args, **kwargs):
+        raise NotImplementedError(f'OpenMaya.{name} is not modelled by the benchmark stand-ins.')
+    return type(name, (), {'__init__': unmodelled})
+
+def install(scene=None) -> dict:
+    '''
+    Installs the maya stand-in modules into sys.modules; returns them by module name.
+    Must run before any plugin module is imported.
+    '''
+    if scene is not None:
+        set_scene(scene)
+
+    maya = types.ModuleType('maya')
+    cmds = types.ModuleType('maya.cmds')
+    for function in [ls, listRelatives, nodeType, listConnections, objExists, select, xform, move,
+                     playbackOptions, undoInfo, pluginInfo, warning, bakeResults, FBXExportBakeComplexAnimation,
+                     FBXExportBakeComplexStart, FBXExportBakeComplexEnd, FBXExport]:
+        setattr(cmds, function.__name__, function)
+    cmds.__getattr__ = cmds_getattr
+
+    mel = types.ModuleType('maya.mel')
+    mel.eval = counted('mel.eval')(lambda *args, **kwargs: None)
+
+    utils = types.ModuleType('maya.utils')
+    # deferred calls run right away; there is no idle queue outside Maya
+    utils.executeDeferred = lambda function, *args, **kwargs: function(*args, **kwargs)
+
+    api = types.ModuleType('maya.api')
+    open_maya = types.ModuleType('maya.api.OpenMaya')
+    for cls in [MFn, MSpace, MObject, MDagPath, MMatrix, MVector, MPlug, MSelectionList, MItDag,
+                MItDependencyNodes, MFnDependencyNode, MFnDagNode, MFnTransform, MDGModifier]:
+        setattr(open_maya, cls.__name__, cls)
+    open_maya_anim = types.ModuleType('maya.api.OpenMayaAnim')
+    open_maya_anim.MFnSkinCluster = MFnSkinCluster
+    open_maya.__getattr__ = api_getattr
+    open_maya_anim.__getattr__ = api_getattr
+
+    maya.cmds, maya.mel, maya.utils, maya.api = cmds, mel, utils, api
+    api.OpenMaya, api.OpenMayaAnim = open_maya, open_maya_anim
+
+    modules = {'maya': maya, 'maya.cmds': cmds, 'maya.mel': mel, 'maya.utils': utils, 'maya.api': api,
+               'maya.api.OpenMaya': open_maya, 'maya.api.OpenMayaAnim': open_maya_anim}
+    sys.modules.update(modules)
+    return modules
@@ -0,0 +1,164 @@
+from .stats import stats, counted
+import types
+import json
+import sys
+import os
+
+# Lightweight unreal module stand-in for the loader benchmarks.
+# Interchange imports complete right away; their host cost is modelled by the 'unreal.import_asset' latency.
+
+_config = {'project_dir': '', 'saved_dir': '', 'skeletons': {}}
+# destination folder -> source file -> asset data of its imported asset; a reimport replaces the same asset
+_imported = {}
+_tick_callbacks = {}
+
+class stubObject():
+    '''
+    Permissive stand-in for Unreal objects: every attribute is a stub, every call returns a stub.
+    Attribute assignments are stored like on the real pipeline objects.
+    '''
+    def __init__(self, *args, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def __getattr__(self, name:str):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        stub = stubObject()
+        setattr(self, name, stub)
+        return stub
+
+    def __call__(self, *args, **kwargs):
+        return stubObject()
+
+class assetData():
+    ''' Asset Registry metadata of a skeleton asset, or of an asset imported from a source file. '''
+    def __init__(self, name:str, package_name:str, asset_class:str='Skeleton', source_file:str|None=None):
+        self.asset_name = name
+        self.package_name = package_name
+        self.package_path = package_name.rsplit('/', 1)[0]
+        self.asset_class_path = stubObject(asset_name=asset_class, package_name='/Script/Engine')
+        self._tags = {'AssetImportData': json.dumps([{'RelativeFilename': source_file}])} if source_file else {}
+
+    def get_tag_value(self, tag:str):
+        return self._tags.get(tag)
+
+class assetRegistry():
+    ''' Asset Registry stand-in; without callbacks, the loader rescans it on request. '''
+    @counted('unreal.AssetRegistry.get_assets')
+    def get_assets(self, asset_filter):
+        return [assetData(name, package) for name, package in _config['skeletons'].items()]
+
+    @counted('unreal.AssetRegistry.get_assets_by_path')
+    def get_assets_by_path(self, folder_path, recursive=True):
+        return list(_imported.get(str(folder_path), {}).values())
+
+class interchangeManager():
+    ''' Interchange Manager stand-in: every import succeeds and is done on return, without completion callback. '''
+    @counted('unreal.create_source_data')
+    def create_source_data(self, file_path):
+        return stubObject(file_path=file_path)
+
+    @counted('unreal.import_asset')
+    def import_asset(self, destination, source_data, asset_params):
+        # imported assets are named after the source file with the pipeline prefix
+        asset_name = f"SM_{os.path.splitext(os.path.basename(source_data.file_path))[0]}"
+        _imported.setdefault(str(destination), {})[source_data.file_path] = assetData(
+            asset_name, f'{destination}/{asset_name}', asset_class='StaticMesh', source_file=source_data.file_path)
+        return True
+
+    def is_interchange_active(self):
+        return False
+
+class scopedSlowTask():
+    ''' Progress bar stand-in; never cancelled. '''
+    def __init__(self, total, text=''):
+        self.total = total
+        self.completed = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def make_dialog(self, can_cancel=False):
+        pass
+
+    def make_dialog_delayed(self, threshold, can_cancel=False):
+        pass
+
+    @counted('unreal.ScopedSlowTask.enter_progress_frame')
+    def enter_progress_frame(self, work=1, text=''):
+        self.completed += work
+
+    def should_cancel(self):
+        return False
+
+@counted('unreal.register_slate_post_tick_callback')
+def register_slate_post_tick_callback(callback):
+    handle = len(_tick_callbacks) + 1
+    while handle in _tick_callbacks:
+        handle += 1
+    _tick_callbacks[handle] = callback
+    return handle
+
+@counted('unreal.unregister_slate_post_tick_callback')
+def unregister_slate_post_tick_callback(handle):
+    _tick_callbacks.pop(handle, None)
+
+def tick(delta_time:float=1.0/60.0) -> int:
+    ''' Runs one editor tick on every registered callback; returns the number of callbacks left. '''
+    for callback in list(_tick_callbacks.values()):
+        stats.record('unreal.tick')
+        callback(delta_time)
+    return len(_tick_callbacks)
+
+def run_ticks(max_ticks:int=1000000) -> int:
+    ''' Ticks until every callback unregistered itself; returns the number of ticks. '''
+    ticks = 0
+    while _tick_callbacks and ticks < max_ticks:
+        tick()
+        ticks += 1
+    return ticks
+
+def unreal_getattr(name:str):
+    ''' Any other unreal type or enum is a stub (pipelines, import parameters...). '''
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return stubObject()
+
+def configure(project_dir:str, saved_dir:str, skeletons:dict|None=None) -> None:
+    ''' Sets the project paths and the skeletons reported by the Asset Registry. '''
+    _config['project_dir'] = project_dir
+    _config['saved_dir'] = saved_dir
+    _config['skeletons'] = dict(skeletons or {})
+    _imported.clear()
+
+def install(project_dir:str='', saved_dir:str='', skeletons:dict|None=None) -> types.ModuleType:
+    '''
+    Installs the unreal stand-in module into sys.modules; returns it.
+    Must run before 'unrealLoader' is imported.
+    '''
+    configure(project_dir, saved_dir, skeletons)
+    registry = assetRegistry()
+    manager = interchangeManager()
+
+    unreal = types.ModuleType('unreal')
+    unreal.log = counted('unreal.log')(lambda *args: None)
+    unreal.log_warning = counted('unreal.log_warning')(lambda *args: None)
+    unreal.log_error = counted('unreal.log_error')(lambda *args: None)
+    unreal.Paths = stubObject(project_dir=lambda: _config['project_dir'],
+                              project_saved_dir=lambda: _config['saved_dir'])
+    unreal.AssetRegistryHelpers = stubObject(get_asset_registry=lambda: registry)
+    unreal.InterchangeManager = stubObject(get_interchange_manager_scripted=lambda: manager)
+    unreal.ScopedSlowTask = scopedSlowTask
+    unreal.register_slate_post_tick_callback = register_slate_post_tick_callback
+    unreal.unregister_slate_post_tick_callback = unregister_slate_post_tick_callback
+    # no editor toolbar outside Unreal
+    unreal.ToolMenus = stubObject(get=lambda: stubObject(find_menu=lambda name: None))
+    unreal.load_asset = counted('unreal.load_asset')(lambda path: stubObject(path=path))
+    unreal.__getattr__ = unreal_getattr
+
+    sys.modules['unreal'] = unreal
+    return unreal
@@ -0,0 +1,84 @@
+'''
+Import time report of the plugin startup, from 'python -X importtime' runs with the maya stand-ins.
+Runs on plain CPython; Maya is not required (NumPy is, for the exporter UI stage).
+
+Usage:
+    python -m benchmarks.importtime [--top N] [--budget MS]
+
+Stages, each measured in a fresh interpreter:
+    plugin_load   what 'MtoU.initializePlugin' imports: the menu module only
+    menu_use      what the first use of the menu item imports: the exporter UI and its library
+The report lists the cumulative import time of each stage and its slowest plugin modules.
+A plugin load slower than the budget exits with code 1.
+'''
+from pathlib import Path
+import subprocess
+import argparse
+import sys
+
+REPO_PATH = Path(__file__).resolve().parent.parent
+
+# imported after the stand-ins in every stage; the stand-ins themselves are not measured
+STAGES = {'plugin_load': 'import Maya_Scripts.menu',
+          'menu_use': 'import Maya_Scripts.menu; import Maya_Scripts.mtouExporter'}
+
+def measure_stage(statement:str) -> list:
+    '''
+    Runs the statement in a fresh interpreter with '-X importtime'.
+    Returns the modules imported by the statement as (indented module name, self us, cumulative us).
+    '''
+    code = f"from benchmarks import fakemaya; fakemaya.install(); {statement}"
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=str(REPO_PATH),
+                             capture_output=True, text=True)
+    if process.returncode:
+        raise RuntimeError(f'Import failed:\n{process.stderr}')
+
+    # imports are written once done: everything after the stand-ins belongs to the statement
+    lines = process.stderr.splitlines()
+    marker = len(lines)
+    for index, line in enumerate(lines):
+        if 'benchmarks.fakemaya' in line:
+            marker = index + 1
+    modules = []
+    for line in lines[marker:]:
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        # nested imports keep their indent
+        modules.append((name[1:].rstrip(), int(self_time), int(cumulative)))
+    return modules
+
+def stage_total(modules:list) -> int:
+    ''' Returns the cumulative import time of the top level imports of a stage (us). '''
+    # nested imports are indented below their parent; top level names have no indent
+    return sum(cumulative for name, _, cumulative in modules if name == name.lstrip())
+
+def write_report(stage:str, modules:list, top:int=10) -> None:
+    ''' Logs the stage total and its slowest plugin modules. '''
+    plugin_modules = [(name.strip(), self_time, cumulative) for name, self_time, cumulative in modules
+                      if name.strip().startswith('Maya_Scripts')]
+    sys.stdout.write(f"{stage}: {stage_total(modules) / 1000.0:.1f}ms, {len(modules)} module(s), "
+                     f"{len(plugin_modules)} plugin module(s)\n")
+    for name, self_time, cumulative in sorted(plugin_modules, key=lambda module: -module[2])[:top]:
+        sys.stdout.write(f"    {name:<40} {self_time / 1000.0:>8.1f}ms self {cumulative / 1000.0:>8.1f}ms cumulative\n")
+
+def main(argv:list|None=None) -> int:
+    ''' Command line entry point: reports the import time of every startup stage. '''
+    parser = argparse.ArgumentParser(prog='benchmarks.importtime', description='MtoU startup import time report.')
+    parser.add_argument('--top', type=int, default=10, help='slowest plugin modules listed per stage')
+    parser.add_argument('--budget', type=float, default=20.0, help='plugin load budget (ms)')
+    args = parser.parse_args(argv)
+
+    totals = {}
+    for stage, statement in STAGES.items():
+        modules = measure_stage(statement)
+        totals[stage] = stage_total(modules) / 1000.0
+        write_report(stage, modules, top=args.top)
+
+    if totals['plugin_load'] > args.budget:
+        sys.stdout.write(f"REGRESSION plugin_load: {totals['plugin_load']:.1f}ms over the {args.budget:.1f}ms budget\n")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
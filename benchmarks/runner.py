@@ -0,0 +1,285 @@
+'''
+Benchmark runner: times the plugin hot paths on a synthetic scene with maya and unreal stand-ins.
+Runs on plain CPython; Maya and Unreal are not required (NumPy is, as for the plugin itself).
+
+Usage:
+    python -m benchmarks [--scale full|small] [--filter NAME] [--repeat N] [--realtime]
+    python -m benchmarks --save-baseline
+
+Every case records its best wall time, its stand-in call counts, the simulated host time of
+those calls (per call latencies, see DEFAULT_LATENCIES) and its peak traced memory.
+Results are compared with the stored baseline of the same scale: a slower wall time or
+higher peak memory beyond the tolerance, or any increase in call counts, is a regression.
+Wall times also get an absolute slack (--min-wall), so millisecond cases do not flag timer noise.
+'''
+from pathlib import Path
+import tracemalloc
+import tempfile
+import argparse
+import shutil
+import json
+import time
+import sys
+import os
+
+REPO_PATH = Path(__file__).resolve().parent.parent
+BASELINE_FILE = Path(__file__).resolve().parent / 'baseline.json'
+
+SCALES = {'full': {'meshes': 10000, 'joints': 2000, 'clips': 300, 'export_meshes': 200, 'import_files': 1000,
+                   'lod_triangles': 1000000},
+          'small': {'meshes': 1000, 'joints': 200, 'clips': 30, 'export_meshes': 50, 'import_files': 100,
+                    'lod_triangles': 100000}}
+
+# modelled host latency per call (seconds); call names fall back to their prefix
+DEFAULT_LATENCIES = {'cmds': 20e-6, 'mel': 20e-6, 'om': 1e-6, 'oma': 1e-6, 'cmds.bake_frame': 5e-3,
+                     'cmds.bake_pass': 0.5,
+                     'unreal': 10e-6, 'unreal.import_asset': 0.05, 'unreal.tick': 1.0/60.0}
+
+class benchmarkContext():
+    '''
+    Synthetic scene, stand-in modules and a temporary UE project shared by every case.
+    The home folder is redirected to the temporary folder, so no user data is read or written.
+    '''
+    def __init__(self, scale:dict, realtime:bool=False):
+        from . import fakemaya, fakeunreal, scene, stats
+
+        self.scale = scale
+        self.temp_path = tempfile.mkdtemp(prefix='mtou_bench_')
+        self.project_path = os.path.join(self.temp_path, 'Project')
+        self.saved_path = os.path.join(self.project_path, 'Saved')
+        os.makedirs(os.path.join(self.project_path, 'Content'))
+        for variable in ['HOME', 'USERPROFILE']:
+            os.environ[variable] = self.temp_path
+
+        self.stats = stats.stats
+        self.stats.latencies = dict(DEFAULT_LATENCIES)
+        self.stats.realtime = realtime
+
+        self.scene = scene.generate_scene(meshes=scale['meshes'], joints=scale['joints'], clips=scale['clips'])
+        self.fakemaya = fakemaya
+        self.fakeunreal = fakeunreal
+        self.scene_module = scene
+        fakemaya.install(self.scene)
+        fakeunreal.install(self.project_path, self.saved_path, self.scene.skeletons)
+
+        # import the plugin modules once the stand-ins are installed
+        for path in [str(REPO_PATH), str(REPO_PATH / 'Unreal_Scripts')]:
+            if path not in sys.path:
+                sys.path.insert(0, path)
+        from Maya_Scripts.library import modules, procedures, exporter, journal, simplify
+        import unrealLoader
+
+        self.modules = modules
+        self.procedures = procedures
+        self.exporter = exporter
+        self.journal = journal
+        self.simplify = simplify
+        self.unrealLoader = unrealLoader
+
+    def close(self) -> None:
+        ''' Removes the temporary project. '''
+        shutil.rmtree(self.temp_path, ignore_errors=True)
+
+# benchmark cases: each prepares its inputs (not timed) and returns the timed callable
+def case_get_root_jnts(context:benchmarkContext):
+    return context.modules.get_root_jnts
+
+def case_get_skinned_meshes(context:benchmarkContext):
+    meshes = context.scene.meshes
+    return lambda: context.modules.get_skinned_meshes(meshes)
+
+def case_get_unused_joints(context:benchmarkContext):
+    roots = context.scene.root_joints
+    return lambda: context.modules.get_unused_joints_in_hier(roots)
+
+def case_fbx_batch_export(context:benchmarkContext):
+    ''' procedures.fbx_export_procedure is the body of the UI 'do_FBX_export'. '''
+    fbx = context.exporter.fbx()
+    fbx.set_UE_project_path(context.project_path, 'Bench/Batch')
+    selection = context.scene.meshes[:context.scale['export_meshes']]
+    # synthetic meshes have no geometry to group into instances or validate: every mesh is a unique asset
+    settings = dict(context.procedures.FBX_DEFAULT_SETTINGS, batch_export=True, skip_unchanged=False,
+                    instance_meshes=False, validate_meshes=False)
+    return lambda: context.procedures.fbx_export_procedure(fbx, selection, settings, 'bench', 'Bench/Batch')
+
+def fbx_clips_export(context:benchmarkContext, single_bake:bool):
+    fbx = context.exporter.fbx()
+    fbx.set_UE_project_path(context.project_path, 'Bench/Clips')
+    selection = context.scene.root_joints[:1]
+    settings = dict(context.procedures.FBX_DEFAULT_SETTINGS, export_anim=True, bake_anim=True, imp_anim=True,
+                    single_bake=single_bake, skip_unchanged=False, validate_meshes=False)
+    clips = context.scene.clips
+    return lambda: context.procedures.fbx_export_procedure(fbx, selection, settings, '', 'Bench/Clips',
+                                                           clips=clips, skeleton_data=context.scene.skeletons)
+
+def case_fbx_clips_single_bake(context:benchmarkContext):
+    return fbx_clips_export(context, single_bake=True)
+
+def case_fbx_clips_per_clip_bake(context:benchmarkContext):
+    return fbx_clips_export(context, single_bake=False)
+
+def case_simplify_lod_chain(context:benchmarkContext):
+    ''' Builds the LOD1..LOD3 chain of a height field mesh, as the FBX exporter does for its LOD sidecar files. '''
+    points, triangles, uvs = context.scene_module.generate_grid_mesh(context.scale['lod_triangles'])
+    ratios = context.procedures.FBX_DEFAULT_SETTINGS['lod_ratios']
+    return lambda: context.simplify.build_lod_chain(points, triangles, ratios, attributes=uvs)
+
+def write_import_files(context:benchmarkContext) -> dict:
+    ''' Writes the exported files to import; returns their import data set. '''
+    folder_path = os.path.join(context.project_path, 'Content', 'Bench', 'Import')
+    os.makedirs(folder_path, exist_ok=True)
+    settings = context.procedures.build_import_settings(context.procedures.FBX_DEFAULT_SETTINGS, importer='FBX')
+    settings['Folder Path'] = 'Bench/Import'
+
+    files = {}
+    for index in range(context.scale['import_files']):
+        file_name = f'bench_{index:05d}.fbx'
+        with open(os.path.join(folder_path, file_name), 'wb') as file:
+            file.write(file_name.encode('utf-8') * 64)
+        files[file_name] = dict(settings)
+    return {'FBX': files}
+
+def case_import_asset_type(context:benchmarkContext):
+    ''' Imports exported files through the tick scheduler, from an empty import ledger. '''
+    import_data = write_import_files(context)
+
+    def run():
+        shutil.rmtree(os.path.join(context.saved_path, 'MtoU'), ignore_errors=True)
+        context.unrealLoader.import_asset_type(import_data=import_data)
+        context.fakeunreal.run_ticks()
+    return run
+
+def case_import_journal(context:benchmarkContext):
+    '''
+    Journals the exported files as ten export batches, then imports every queued batch
+    through the tick scheduler (from an empty import ledger) and compacts the journal.
+    '''
+    import_data = write_import_files(context)
+    files = list(import_data['FBX'].items())
+    batch_size = max(1, len(files) // 10)
+    batches = [{'FBX': dict(files[index:index + batch_size])} for index in range(0, len(files), batch_size)]
+    data_path = os.path.join(context.temp_path, 'Documents', 'UE', 'Data')
+
+    def run():
+        shutil.rmtree(os.path.join(context.saved_path, 'MtoU'), ignore_errors=True)
+        for index, batch in enumerate(batches):
+            context.journal.append_batch(data_path, batch, f'bench_{index}')
+        context.unrealLoader.import_asset_type()
+        context.fakeunreal.run_ticks()
+    return run
+
+CASES = {'maya.get_root_jnts': case_get_root_jnts,
+         'maya.get_skinned_meshes': case_get_skinned_meshes,
+         'maya.get_unused_joints_in_hier': case_get_unused_joints,
+         'maya.fbx_batch_export': case_fbx_batch_export,
+         'maya.fbx_clips_single_bake': case_fbx_clips_single_bake,
+         'maya.fbx_clips_per_clip_bake': case_fbx_clips_per_clip_bake,
+         'maya.simplify_lod_chain': case_simplify_lod_chain,
+         'unreal.import_asset_type': case_import_asset_type,
+         'unreal.import_journal': case_import_journal}
+
+def run_case(context:benchmarkContext, case, repeat:int=3) -> dict:
+    '''
+    Runs a case: best wall time over the repeats, then one traced run for the call counts,
+    simulated host time and peak memory.
+    '''
+    run = case(context)
+    stats = context.stats
+
+    # keep the plugin output out of the report
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        wall_times = []
+        for _ in range(max(1, repeat)):
+            start_time = time.perf_counter()
+            run()
+            wall_times.append(time.perf_counter() - start_time)
+
+        stats.reset()
+        tracemalloc.start()
+        try:
+            run()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    return {'wall': min(wall_times), 'calls': stats.total_calls(), 'simulated': stats.simulated_time,
+            'peak_memory': peak_memory, 'top_calls': stats.top_calls(5)}
+
+def compare(results:dict, baseline:dict, tolerance:float=0.25, min_wall:float=0.01) -> list:
+    ''' Returns the regressions of the results against the baseline, as readable lines. '''
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result['calls'] > base['calls']:
+            regressions.append(f"{name}: calls {base['calls']} -> {result['calls']}")
+        if result['wall'] > base['wall'] * (1.0 + tolerance) + min_wall:
+            regressions.append(f"{name}: wall {base['wall']:.4f}s -> {result['wall']:.4f}s")
+        if result['peak_memory'] > base['peak_memory'] * (1.0 + tolerance):
+            regressions.append(f"{name}: peak memory {base['peak_memory']} -> {result['peak_memory']} bytes")
+    return regressions
+
+def write_report(results:dict, baseline:dict) -> None:
+    ''' Logs the results table, with the wall time ratio to the baseline. '''
+    sys.stdout.write(f"{'case':<32} {'wall':>10} {'vs base':>8} {'calls':>10} {'simulated':>11} {'peak':>10}\n")
+    for name, result in results.items():
+        base = baseline.get(name)
+        ratio = f"{result['wall'] / base['wall']:.2f}x" if base and base['wall'] else '-'
+        sys.stdout.write(f"{name:<32} {result['wall']:>9.4f}s {ratio:>8} {result['calls']:>10} "
+                         f"{result['simulated']:>10.2f}s {result['peak_memory'] / 1024:>8.0f}KB\n")
+
+def load_baseline(baseline_file:Path) -> dict:
+    ''' Loads the stored baselines: scale name -> case results. '''
+    if not baseline_file.exists():
+        return {}
+    with open(baseline_file, 'r') as file:
+        return json.load(file)
+
+def main(argv:list|None=None) -> int:
+    ''' Command line entry point: runs the benchmark cases and compares them with the baseline. '''
+    parser = argparse.ArgumentParser(prog='benchmarks', description='MtoU performance benchmarks.')
+    parser.add_argument('--scale', choices=list(SCALES), default='full', help='synthetic scene size')
+    parser.add_argument('--filter', help='only run the cases containing this text')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case; the best is kept')
+    parser.add_argument('--realtime', action='store_true', help='busy-wait the modelled call latencies')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed wall time and memory increase')
+    parser.add_argument('--min-wall', type=float, default=0.01, help='allowed wall time increase in seconds, on top of the tolerance')
+    parser.add_argument('--baseline', default=str(BASELINE_FILE), help='baseline (JSON) file')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the new baseline')
+    parser.add_argument('--report', help='optional path to save the results (JSON)')
+    args = parser.parse_args(argv)
+
+    cases = {name: case for name, case in CASES.items() if not args.filter or args.filter in name}
+    baseline_file = Path(args.baseline)
+    baselines = load_baseline(baseline_file)
+    baseline = baselines.get(args.scale, {})
+
+    context = benchmarkContext(SCALES[args.scale], realtime=args.realtime)
+    try:
+        sys.stdout.write(f"Scene: {context.scene.summary()}\n")
+        results = {name: run_case(context, case, repeat=args.repeat) for name, case in cases.items()}
+    finally:
+        context.close()
+
+    write_report(results, baseline)
+    if args.report:
+        with open(args.report, 'w') as file:
+            json.dump(results, file, indent=4)
+
+    if args.save_baseline:
+        baselines[args.scale] = dict(baseline, **results)
+        with open(baseline_file, 'w') as file:
+            json.dump(baselines, file, indent=4, sort_keys=True)
+        sys.stdout.write(f'Baseline saved: {baseline_file}\n')
+        return 0
+
+    regressions = compare(results, baseline, tolerance=args.tolerance, min_wall=args.min_wall)
+    for regression in regressions:
+        sys.stdout.write(f'REGRESSION {regression}\n')
+    return 1 if regressions else 0
@@ -0,0 +1,143 @@
+import random
+
+# Synthetic scene generator for the benchmark suite.
+# Scenes are plain data: every node is stored by its (unique) short name.
+
+class sceneNode():
+    ''' A synthetic DAG or dependency node. '''
+    __slots__ = ('name', 'type', 'parent', 'children', 'translation', 'connections', 'influences')
+
+    def __init__(self, name:str, node_type:str, parent:str|None=None, translation:tuple=(0.0, 0.0, 0.0)):
+        self.name = name
+        self.type = node_type
+        self.parent = parent
+        self.children = []
+        self.translation = list(translation)
+        self.connections = []
+        self.influences = []
+
+class syntheticScene():
+    '''
+    Synthetic Maya scene: static meshes, skinned character rigs and animation clips.
+    Names are unique, so short names and full paths resolve to the same node.
+    '''
+    def __init__(self):
+        self.nodes = {}
+        self.meshes = []
+        self.joints = []
+        self.root_joints = []
+        self.skin_clusters = []
+        self.rigs = []
+        self.clips = []
+        self.skeletons = {}
+
+    def add_node(self, name:str, node_type:str, parent:str|None=None, translation:tuple=(0.0, 0.0, 0.0)) -> sceneNode:
+        ''' Adds a node under its parent; returns the node. '''
+        node = sceneNode(name, node_type, parent, translation)
+        self.nodes[name] = node
+        if parent:
+            self.nodes[parent].children.append(name)
+        return node
+
+    def connect(self, source:str, destination:str) -> None:
+        ''' Connects two nodes both ways, as listConnections reports them. '''
+        self.nodes[source].connections.append(destination)
+        self.nodes[destination].connections.append(source)
+
+    def full_path(self, name:str) -> str:
+        ''' Returns the full DAG path of the node. '''
+        path = []
+        while name:
+            path.append(name)
+            name = self.nodes[name].parent
+        return '|' + '|'.join(reversed(path))
+
+    def get_assemblies(self) -> list:
+        ''' Returns the top level DAG nodes. '''
+        return [name for name, node in self.nodes.items()
+                if node.parent is None and node.type in ['transform', 'joint']]
+
+    def summary(self) -> dict:
+        ''' Returns the scene node counts. '''
+        return {'nodes': len(self.nodes), 'meshes': len(self.meshes), 'joints': len(self.joints),
+                'rigs': len(self.rigs), 'skin_clusters': len(self.skin_clusters), 'clips': len(self.clips)}
+
+def generate_scene(meshes:int=10000, joints:int=2000, clips:int=300, rigs:int=20,
+                   skinned_ratio:float=0.1, unused_ratio:float=0.2, seed:int=0) -> syntheticScene:
+    '''
+    Generates a deterministic synthetic scene.
+    Joints are split across rigs as random trees; a share of the meshes is skinned to a rig,
+    leaving unused_ratio of each rig's joints without bind data. Clips cover consecutive frame ranges.
+    '''
+    rng = random.Random(seed)
+    scene = syntheticScene()
+
+    def random_translation():
+        return (rng.uniform(-500, 500), rng.uniform(0, 200), rng.uniform(-500, 500))
+
+    rigs = max(1, min(rigs, joints)) if joints else 0
+    rig_joint_map = {}
+    for rig_index in range(rigs):
+        rig_name = f'rig_{rig_index:02d}'
+        scene.add_node(rig_name, 'transform', translation=random_translation())
+        scene.rigs.append(rig_name)
+
+        rig_joints = []
+        joint_count = joints // rigs + (1 if rig_index < joints % rigs else 0)
+        for joint_index in range(joint_count):
+            joint_name = f'{rig_name}_jnt_{joint_index:04d}'
+            # every joint is parented to a random earlier joint of the rig
+            parent = rng.choice(rig_joints) if rig_joints else rig_name
+            scene.add_node(joint_name, 'joint', parent=parent, translation=random_translation())
+            rig_joints.append(joint_name)
+        scene.joints.extend(rig_joints)
+        rig_joint_map[rig_name] = rig_joints
+        if rig_joints:
+            scene.root_joints.append(rig_joints[0])
+            scene.skeletons[f'{rig_name}_Skeleton'] = f'/Game/Characters/{rig_name}/{rig_name}_Skeleton'
+
+    skinned_meshes = int(meshes * skinned_ratio) if rigs else 0
+    for mesh_index in range(meshes):
+        mesh_name = f'mesh_{mesh_index:05d}'
+        skinned = mesh_index < skinned_meshes
+        rig_name = scene.rigs[mesh_index % rigs] if skinned else None
+
+        scene.add_node(mesh_name, 'transform', parent=rig_name, translation=random_translation())
+        scene.add_node(f'{mesh_name}Shape', 'mesh', parent=mesh_name)
+        scene.meshes.append(mesh_name)
+
+        if skinned:
+            rig_joints = rig_joint_map[rig_name]
+            cluster_name = f'skinCluster{len(scene.skin_clusters)+1}'
+            cluster = scene.add_node(cluster_name, 'skinCluster')
+            # leave the last joints of the rig unbound
+            cluster.influences = rig_joints[:max(1, int(len(rig_joints) * (1.0 - unused_ratio)))]
+            scene.connect(cluster_name, f'{mesh_name}Shape')
+            scene.skin_clusters.append(cluster_name)
+
+    frame = 1
+    for clip_index in range(clips):
+        length = rng.randint(20, 120)
+        scene.clips.append([f'Clip_{clip_index:03d}', frame, frame + length])
+        frame += length + 1
+
+    return scene
+
+def generate_grid_mesh(triangles:int=1000000) -> tuple:
+    '''
+    Generates a deterministic height field mesh of about the triangle count, as NumPy arrays:
+    points (N, 3), triangles (T, 3) and uvs (N, 2). Used by the mesh simplification case.
+    '''
+    import numpy as np
+
+    size = max(2, int(round((triangles / 2) ** 0.5)) + 1)
+    xs, zs = np.meshgrid(np.linspace(0.0, 100.0, size), np.linspace(0.0, 100.0, size))
+    heights = 10.0 * np.sin(xs * 0.1) * np.cos(zs * 0.1)
+    points = np.stack([xs.ravel(), heights.ravel(), zs.ravel()], axis=1)
+
+    indices = np.arange(size * size).reshape(size, size)
+    corners = [indices[:-1, :-1].ravel(), indices[:-1, 1:].ravel(), indices[1:, :-1].ravel(), indices[1:, 1:].ravel()]
+    faces = np.concatenate([np.stack([corners[0], corners[1], corners[3]], axis=1),
+                            np.stack([corners[0], corners[3], corners[2]], axis=1)]).astype(np.int32)
+    uvs = points[:, [0, 2]] / 100.0
+    return points, faces, uvs
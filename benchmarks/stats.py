@@ -0,0 +1,60 @@
+import time
+
+# Call statistics shared by the maya and unreal stand-ins.
+
+class callStats():
+    '''
+    Counts the stand-in calls and models their host application latency.
+    Latency is added to a simulated clock; with realtime set, calls also busy-wait for it.
+    '''
+    def __init__(self, latencies:dict|None=None, realtime:bool=False):
+        ''' Latencies map a call name prefix ('cmds', 'om', 'unreal', or a full call name) to seconds. '''
+        self.latencies = latencies or {}
+        self.realtime = realtime
+        self.calls = {}
+        self.simulated_time = 0.0
+
+    def reset(self) -> None:
+        ''' Clears the call counts and the simulated clock. '''
+        self.calls = {}
+        self.simulated_time = 0.0
+
+    def get_latency(self, name:str) -> float:
+        ''' Returns the latency of a call: its own entry or the entry of its prefix. '''
+        if name in self.latencies:
+            return self.latencies[name]
+        return self.latencies.get(name.split('.')[0], 0.0)
+
+    def record(self, name:str) -> None:
+        ''' Counts a call and applies its latency. '''
+        self.calls[name] = self.calls.get(name, 0) + 1
+        latency = self.get_latency(name)
+        if not latency:
+            return
+        self.simulated_time += latency
+        if self.realtime:
+            end = time.perf_counter() + latency
+            while time.perf_counter() < end:
+                pass
+
+    def total_calls(self) -> int:
+        ''' Returns the number of recorded calls. '''
+        return sum(self.calls.values())
+
+    def top_calls(self, count:int=10) -> dict:
+        ''' Returns the most called names with their counts. '''
+        return dict(sorted(self.calls.items(), key=lambda item: item[1], reverse=True)[:count])
+
+# stand-ins record into the active statistics
+stats = callStats()
+
+def counted(name:str):
+    ''' Decorator: records a call of the decorated function under the provided name. '''
+    def decorator(function):
+        def wrapper(*args, **kwargs):
+            stats.record(name)
+            return function(*args, **kwargs)
+        wrapper.__name__ = function.__name__
+        wrapper.__doc__ = function.__doc__
+        return wrapper
+    return decorator
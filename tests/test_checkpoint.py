@@ -0,0 +1,59 @@
+import os
+
+from Maya_Scripts.library import checkpoint
+
+def test_resume_skips_recorded_items(tmp_path):
+    batch_key = checkpoint.get_batch_key('FBX', ['a', 'b', 'c'], 'mesh', 'Props', {'batch_export': True})
+    first_run = checkpoint.exportCheckpoint(str(tmp_path), batch_key, total=3)
+    first_run.record('mesh_1.fbx', {'Folder Path': 'Props'})
+    first_run.record('mesh_2.fbx', None)
+
+    resumed = checkpoint.exportCheckpoint(str(tmp_path), batch_key, total=3)
+    assert resumed.get_resumed_count() == 2
+    assert resumed.is_done('mesh_1.fbx') and resumed.is_done('mesh_2.fbx')
+    assert not resumed.is_done('mesh_3.fbx')
+    assert resumed.get_import_settings('mesh_1.fbx') == {'Folder Path': 'Props'}
+    # unchanged (skipped) items have no settings to journal
+    assert resumed.get_import_settings('mesh_2.fbx') is None
+
+def test_batch_key_depends_on_the_settings():
+    key = checkpoint.get_batch_key('FBX', ['a'], 'mesh', 'Props', {'batch_export': True})
+    assert key == checkpoint.get_batch_key('FBX', ['a'], 'mesh', 'Props', {'batch_export': True})
+    assert key != checkpoint.get_batch_key('FBX', ['a'], 'mesh', 'Props', {'batch_export': True, 'skins': False})
+
+def test_journaled_items_are_not_journaled_again(tmp_path):
+    batch_checkpoint = checkpoint.exportCheckpoint(str(tmp_path), 'key', total=2)
+    batch_checkpoint.record('mesh_1.fbx', {'Folder Path': 'Props'})
+    batch_checkpoint.mark_journaled(['mesh_1.fbx'])
+
+    resumed = checkpoint.exportCheckpoint(str(tmp_path), 'key', total=2)
+    assert resumed.is_done('mesh_1.fbx')
+    assert resumed.get_import_settings('mesh_1.fbx') is None
+
+def test_incomplete_last_record_is_ignored(tmp_path):
+    batch_checkpoint = checkpoint.exportCheckpoint(str(tmp_path), 'key', total=2)
+    batch_checkpoint.record('mesh_1.fbx', {})
+    with open(batch_checkpoint.get_file_path(), 'a') as file:
+        file.write('{"type": "item", "file": "mesh_2.fbx"')
+
+    resumed = checkpoint.exportCheckpoint(str(tmp_path), 'key', total=2)
+    assert resumed.get_done_count() == 1
+
+def test_complete_removes_the_checkpoint_and_keeps_its_lock(tmp_path):
+    batch_checkpoint = checkpoint.exportCheckpoint(str(tmp_path), 'key', total=1)
+    batch_checkpoint.record('mesh_1.fbx', {})
+    batch_checkpoint.complete()
+    assert not os.path.exists(batch_checkpoint.get_file_path())
+    assert os.path.exists(batch_checkpoint.get_file_path() + '.lock')
+
+def test_progress_counts_skipped_items_and_cancels():
+    cancel_requests = iter([False, True])
+    progress = checkpoint.batchProgress(4, cancel=lambda: next(cancel_requests))
+    progress.skip(2)
+    assert not progress.is_cancelled()
+    progress.start_item()
+    progress.finish_item()
+    assert progress.done == 3
+    assert progress.get_percent() == 75
+    assert progress.is_cancelled()
+    assert progress.is_cancelled()
@@ -0,0 +1,61 @@
+import threading
+import json
+import os
+
+from Maya_Scripts.library import datafiles
+
+def test_atomic_write_replaces_the_file(tmp_path):
+    file_path = str(tmp_path / 'data.json')
+    datafiles.atomic_write(file_path, 'first')
+    datafiles.atomic_write(file_path, b'second')
+    with open(file_path, 'rb') as file:
+        assert file.read() == b'second'
+    # no temp file is left behind
+    assert os.listdir(tmp_path) == ['data.json']
+
+def test_update_json_starts_from_a_copy_of_the_default(tmp_path):
+    file_path = str(tmp_path / 'data.json')
+    default = {'items': []}
+    data = datafiles.update_json(file_path, lambda data: dict(data, items=data['items'] + [1]), default=default)
+    assert data == {'items': [1]}
+    assert default == {'items': []}
+    assert datafiles.load_json(file_path) == {'items': [1]}
+
+def test_update_json_keeps_parallel_updates(tmp_path):
+    file_path = str(tmp_path / 'counter.json')
+    def increment():
+        for _ in range(20):
+            datafiles.update_json(file_path, lambda data: dict(data, count=data['count'] + 1), default={'count': 0})
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert datafiles.load_json(file_path) == {'count': 80}
+
+def test_file_lock_times_out(tmp_path):
+    file_path = str(tmp_path / 'data.json')
+    with datafiles.file_lock(file_path):
+        errors = []
+        def lock_again():
+            try:
+                with datafiles.file_lock(file_path, timeout=0.05):
+                    pass
+            except datafiles.lockTimeout as e:
+                errors.append(e)
+
+        # flock locks are held per open file: a second open in another thread must wait
+        thread = threading.Thread(target=lock_again)
+        thread.start()
+        thread.join()
+    assert len(errors) == 1
+
+def test_append_text_ends_an_incomplete_line(tmp_path):
+    file_path = str(tmp_path / 'journal.jsonl')
+    with open(file_path, 'w') as file:
+        file.write('{"type": "batch"')
+    datafiles.append_text(file_path, json.dumps({'type': 'ack'}) + '\n')
+    with open(file_path) as file:
+        lines = file.read().splitlines()
+    assert lines == ['{"type": "batch"', '{"type": "ack"}']
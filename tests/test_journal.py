@@ -0,0 +1,46 @@
+import json
+import os
+
+from Maya_Scripts.library import journal
+
+def test_append_batch_stores_identical_settings_once(tmp_path):
+    settings = {'Folder Path': 'Props', 'imp_materials': True}
+    import_data = {'FBX': {'a.fbx': settings, 'b.fbx': dict(settings)}, 'OBJ': {}}
+    assert journal.append_batch(str(tmp_path), import_data, 'batch-1') == 2
+
+    records = journal.read_records(journal.get_journal_file(str(tmp_path)))
+    assert [record['type'] for record in records] == ['settings', 'batch']
+    settings_id = journal.get_settings_id(settings)
+    assert records[0] == {'type': 'settings', 'id': settings_id, 'data': settings}
+    assert records[1]['files'] == {'FBX': {'a.fbx': settings_id, 'b.fbx': settings_id}}
+
+def test_later_batches_reference_stored_settings(tmp_path):
+    settings = {'Folder Path': 'Props'}
+    journal.append_batch(str(tmp_path), {'FBX': {'a.fbx': settings}}, 'batch-1')
+    # only the batch record is written
+    assert journal.append_batch(str(tmp_path), {'FBX': {'a.fbx': settings}}, 'batch-2') == 1
+
+def test_empty_batches_are_not_journaled(tmp_path):
+    assert journal.append_batch(str(tmp_path), {'FBX': {}, 'OBJ': {}}, 'batch-1') == 0
+    assert journal.read_records(journal.get_journal_file(str(tmp_path))) == []
+
+def test_session_journals_are_separate(tmp_path):
+    assert journal.get_journal_file(str(tmp_path), 'host-1') != journal.get_journal_file(str(tmp_path), 'host-2')
+
+def test_incomplete_last_record_is_ignored(tmp_path):
+    journal_file = journal.get_journal_file(str(tmp_path))
+    journal.append_batch(str(tmp_path), {'FBX': {'a.fbx': {}}}, 'batch-1')
+    with open(journal_file, 'a') as file:
+        file.write(json.dumps({'type': 'ack', 'id': 'batch-1'}))
+    assert [record['type'] for record in journal.read_records(journal_file)] == ['settings', 'batch']
+
+def test_settings_ids_follow_journal_changes(tmp_path):
+    journal_file = journal.get_journal_file(str(tmp_path))
+    journal.append_batch(str(tmp_path), {'FBX': {'a.fbx': {'Folder Path': 'Props'}}}, 'batch-1')
+    assert journal.get_settings_ids(journal_file) == {journal.get_settings_id({'Folder Path': 'Props'})}
+
+    # the loader compacts the journal down to nothing left to import
+    (tmp_path / 'compacted.jsonl').write_text('')
+    os.replace(tmp_path / 'compacted.jsonl', journal_file)
+    assert journal.get_settings_ids(journal_file) == set()
+    assert journal.append_batch(str(tmp_path), {'FBX': {'a.fbx': {'Folder Path': 'Props'}}}, 'batch-2') == 2
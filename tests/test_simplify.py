@@ -0,0 +1,50 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from Maya_Scripts.library import simplify
+
+def grid_mesh(size:int=21) -> tuple:
+    ''' Returns a wavy grid of size x size vertices: points, triangles and uvs. '''
+    xs, zs = np.meshgrid(np.linspace(0.0, 10.0, size), np.linspace(0.0, 10.0, size))
+    points = np.stack([xs.ravel(), np.sin(xs.ravel()) * np.cos(zs.ravel()), zs.ravel()], axis=1)
+    indices = np.arange(size * size).reshape(size, size)
+    corners = [indices[:-1, :-1].ravel(), indices[:-1, 1:].ravel(), indices[1:, :-1].ravel(), indices[1:, 1:].ravel()]
+    triangles = np.concatenate([np.stack([corners[0], corners[1], corners[3]], axis=1),
+                                np.stack([corners[0], corners[3], corners[2]], axis=1)])
+    return points, triangles, points[:, [0, 2]] / 10.0
+
+def test_lod_chain_triangle_counts_decrease():
+    points, triangles, uvs = grid_mesh()
+    lods = simplify.build_lod_chain(points, triangles, [0.5, 0.25, 0.125], attributes=uvs)
+
+    counts = [len(lod_triangles) for _, lod_triangles, _ in lods]
+    assert counts == sorted(counts, reverse=True)
+    assert len(set(counts)) == len(counts)
+    assert counts[0] < len(triangles)
+    for ratio, count in zip([0.5, 0.25, 0.125], counts):
+        assert count <= len(triangles) * ratio * 1.1
+
+def test_lod_meshes_are_compact():
+    points, triangles, uvs = grid_mesh()
+    for lod_points, lod_triangles, lod_uvs in simplify.build_lod_chain(points, triangles, [0.5, 0.25], attributes=uvs):
+        assert len(lod_points) == len(lod_uvs)
+        assert lod_triangles.min() >= 0
+        assert lod_triangles.max() < len(lod_points)
+        # no degenerate triangles
+        assert np.all((lod_triangles[:, 0] != lod_triangles[:, 1]) & (lod_triangles[:, 1] != lod_triangles[:, 2])
+                      & (lod_triangles[:, 2] != lod_triangles[:, 0]))
+
+def test_simplify_is_deterministic():
+    points, triangles, uvs = grid_mesh()
+    first = simplify.simplify(points, triangles, 200, attributes=uvs)
+    second = simplify.simplify(points, triangles, 200, attributes=uvs)
+    for first_array, second_array in zip(first, second):
+        assert np.array_equal(first_array, second_array)
+
+def test_simplify_keeps_the_border():
+    points, triangles, _ = grid_mesh()
+    lod_points, _, _ = simplify.simplify(points, triangles, 100)
+    # the open border is weighted: the grid keeps its extent, within 0.5%
+    assert np.allclose(lod_points[:, [0, 2]].min(axis=0), [0.0, 0.0], atol=0.05)
+    assert np.allclose(lod_points[:, [0, 2]].max(axis=0), [10.0, 10.0], atol=0.05)
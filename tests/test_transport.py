@@ -0,0 +1,50 @@
+import socket
+import time
+
+import pytest
+
+from Maya_Scripts.library import transport
+
+@pytest.fixture
+def server():
+    server = transport.localServer(handler=lambda import_data: [{'file': file_name, 'imported': True}
+                                                                for importer in import_data.values()
+                                                                if isinstance(importer, dict)
+                                                                for file_name in importer])
+    server.start()
+    yield server
+    server.close()
+
+def test_round_trip_waits_for_the_import(server):
+    client = transport.transportClient(port=server.get_port())
+    done = client.send_batch({'FBX': {'a.fbx': {}}}, batch_id='batch-1', wait=True, timeout=5.0)
+    assert done['type'] == 'import_done'
+    assert done['batch_id'] == 'batch-1'
+    assert done['results'] == [{'file': 'a.fbx', 'imported': True}]
+    assert server.batches[0]['import_data'] == {'FBX': {'a.fbx': {}}}
+
+def test_accepted_batch_reports_done_in_the_background(server):
+    client = transport.transportClient(port=server.get_port())
+    results = []
+    accepted = client.send_batch({'FBX': {'a.fbx': {}}}, batch_id='batch-1', on_done=results.append)
+    assert accepted == {'type': 'accepted', 'batch_id': 'batch-1'}
+    deadline = time.monotonic() + 5.0
+    while not results and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert results[0]['batch_id'] == 'batch-1'
+
+def test_no_listener_falls_back():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    client = transport.transportClient(port=port)
+    assert not client.is_server_listening()
+    assert client.send_batch({'FBX': {}}) is None
+
+def test_unresponsive_listener_does_not_block():
+    # connections are accepted by the backlog but never answered
+    with socket.create_server(('127.0.0.1', 0)) as sock:
+        client = transport.transportClient(port=sock.getsockname()[1], accept_timeout=0.2)
+        start_time = time.perf_counter()
+        assert client.send_batch({'FBX': {}}, timeout=60.0) is None
+        assert time.perf_counter() - start_time < 5.0
@@ -0,0 +1,61 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from Maya_Scripts.library import validation
+
+def quad_mesh() -> tuple:
+    ''' Returns a valid two quad strip: points, face vertex counts and face-vertex indices. '''
+    points = np.array([[0, 0, 0], [1, 0, 0], [2, 0, 0], [0, 1, 0], [1, 1, 0], [2, 1, 0]], dtype=np.float64)
+    counts = np.array([4, 4], dtype=np.int32)
+    connects = np.array([0, 1, 4, 3, 1, 2, 5, 4], dtype=np.int32)
+    return points, counts, connects
+
+def test_valid_mesh_has_no_issues():
+    points, counts, connects = quad_mesh()
+    assert validation.validate_mesh(points, counts, connects, {'map1': counts.copy()}) == {}
+
+def test_nan_vertices():
+    points, counts, connects = quad_mesh()
+    points[4, 1] = np.nan
+    points[5, 0] = np.inf
+    assert validation.check_nan_vertices(points).tolist() == [4, 5]
+
+def test_non_manifold_edges():
+    points, counts, connects = quad_mesh()
+    # a third face on the shared edge 1-4
+    points = np.vstack([points, [[1, 0, 1]]])
+    counts = np.append(counts, 3)
+    connects = np.append(connects, [1, 4, 6])
+    assert validation.check_non_manifold_edges(counts, connects).tolist() == [[1, 4]]
+
+def test_lamina_faces():
+    points, counts, connects = quad_mesh()
+    # the first face again, with another winding and start vertex
+    counts = np.append(counts, 4)
+    connects = np.append(connects, [4, 1, 0, 3])
+    assert validation.check_lamina_faces(counts, connects).tolist() == [0, 2]
+
+def test_zero_area_faces():
+    points, counts, connects = quad_mesh()
+    # collapse the second quad onto a line
+    points[[5]] = points[[2]]
+    points[4] = [1, 0, 0]
+    assert 1 in validation.check_zero_area_faces(points, counts, connects).tolist()
+    assert 0 not in validation.check_zero_area_faces(points, counts, connects).tolist()
+
+def test_missing_uvs_and_uv_sets():
+    points, counts, connects = quad_mesh()
+    assert validation.check_missing_uvs(counts, {'map1': np.array([4, 0])}).tolist() == [1]
+    assert validation.check_missing_uvs(counts, {}).tolist() == [0, 1]
+    uv_counts = {f'map{index}': counts.copy() for index in range(10)}
+    assert validation.check_uv_sets(uv_counts) == ['map8', 'map9']
+
+def test_error_report_lists_issues():
+    points, counts, connects = quad_mesh()
+    points[0, 0] = np.nan
+    issues = validation.validate_mesh(points, counts, connects, {'map1': counts.copy()})
+    error = validation.meshValidationError([{'mesh': '|strip|stripShape', 'issues': issues}])
+    assert isinstance(error, ValueError)
+    assert '|strip|stripShape' in str(error)
+    assert 'vtx[0]' in str(error)